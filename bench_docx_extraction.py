@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Benchmark DOCX Extraction - python-docx vs streaming extractor
+British English
+
+Builds synthetic large DOCX files (body paragraphs, tables, footnotes,
+headers, footers) and compares time, peak memory and text recovered.
+Each extraction runs in a fresh process so peak memory is not shared.
+
+Usage:
+    python bench_docx_extraction.py
+    python bench_docx_extraction.py --docs 5 --paragraphs 50000
+"""
+
+import argparse
+import importlib.util
+import multiprocessing
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from utils.docx_extractor import extract_docx_text, LXML_AVAILABLE
+
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+<Override PartName="/word/footnotes.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.footnotes+xml"/>
+<Override PartName="/word/header1.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.header+xml"/>
+<Override PartName="/word/footer1.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.footer+xml"/>
+</Types>"""
+
+ROOT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+
+DOCUMENT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/footnotes" Target="footnotes.xml"/>
+<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/header" Target="header1.xml"/>
+<Relationship Id="rId3" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/footer" Target="footer1.xml"/>
+</Relationships>"""
+
+SENTENCE = ("The Claimant alleges that clause {n} of the Share Purchase Agreement was "
+            "breached when the warranties were given on {n} March. ")
+
+
+def _paragraph(text: str) -> str:
+    return f'<w:p><w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+
+
+def _table(rows: int, start: int) -> str:
+    body = []
+    for r in range(rows):
+        cells = ''.join(
+            f'<w:tc>{_paragraph(f"Cell {start + r}.{c} - Exhibit {start + r}")}</w:tc>'
+            for c in range(4)
+        )
+        body.append(f'<w:tr>{cells}</w:tr>')
+    return f'<w:tbl>{"".join(body)}</w:tbl>'
+
+
+def build_synthetic_docx(path: Path, paragraphs: int, table_every: int = 200):
+    """Write a DOCX with the given number of body paragraphs plus tables and notes"""
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', CONTENT_TYPES)
+        archive.writestr('_rels/.rels', ROOT_RELS)
+        archive.writestr('word/_rels/document.xml.rels', DOCUMENT_RELS)
+
+        # Stream the body so building a huge file stays cheap
+        with archive.open('word/document.xml', 'w') as f:
+            f.write(f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                    f'<w:document xmlns:w="{W_NS}"><w:body>'.encode('utf-8'))
+            for n in range(paragraphs):
+                f.write(_paragraph(SENTENCE.format(n=n) * 3).encode('utf-8'))
+                if n % table_every == 0:
+                    f.write(_table(10, n).encode('utf-8'))
+            f.write(b'<w:sectPr><w:headerReference w:type="default" r:id="rId2" '
+                    b'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"/>'
+                    b'</w:sectPr></w:body></w:document>')
+
+        notes = ''.join(
+            f'<w:footnote w:id="{i}">{_paragraph(f"Footnote {i}: see Exhibit {i}")}</w:footnote>'
+            for i in range(1, max(2, paragraphs // 100))
+        )
+        archive.writestr('word/footnotes.xml', f'<w:footnotes xmlns:w="{W_NS}">{notes}</w:footnotes>')
+        archive.writestr('word/header1.xml', f'<w:hdr xmlns:w="{W_NS}">{_paragraph("PRIVILEGED AND CONFIDENTIAL")}</w:hdr>')
+        archive.writestr('word/footer1.xml', f'<w:ftr xmlns:w="{W_NS}">{_paragraph("Lismore v ProcessHoldings")}</w:ftr>')
+
+
+def _python_docx_text(path: Path) -> str:
+    """The original extraction path"""
+    from docx import Document
+    doc = Document(path)
+    return "\n".join([para.text for para in doc.paragraphs])
+
+
+def _peak_rss_mb():
+    """Peak resident memory of this process in MB (None if unavailable)"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    except ImportError:
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+    except Exception:
+        return None
+
+
+def _run_one(method: str, path: str, queue):
+    baseline = _peak_rss_mb()
+    start = time.perf_counter()
+    try:
+        if method == 'python-docx':
+            text = _python_docx_text(Path(path))
+        else:
+            text = extract_docx_text(Path(path))
+        error = None
+    except Exception as e:
+        text, error = '', f"{type(e).__name__}: {e}"
+    elapsed = time.perf_counter() - start
+    peak = _peak_rss_mb()
+    growth = (peak - baseline) if peak is not None and baseline is not None else None
+    queue.put({'seconds': elapsed, 'peak_growth_mb': growth, 'chars': len(text), 'error': error})
+
+
+def measure(method: str, path: Path) -> dict:
+    """Run one extraction in a fresh process"""
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_run_one, args=(method, str(path), queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark DOCX extraction')
+    parser.add_argument('--docs', type=int, default=3, help='Number of synthetic files')
+    parser.add_argument('--paragraphs', type=int, default=20000, help='Body paragraphs in the first file')
+    parser.add_argument('--keep', action='store_true', help='Keep the generated files')
+    args = parser.parse_args()
+
+    if importlib.util.find_spec('docx') is not None:
+        methods = ['python-docx', 'streaming']
+    else:
+        print("⚠️  python-docx not installed - benchmarking the streaming extractor only")
+        methods = ['streaming']
+
+    print("=" * 70)
+    print("DOCX EXTRACTION BENCHMARK")
+    print("=" * 70)
+    print(f"XML parser: {'lxml' if LXML_AVAILABLE else 'xml.etree (lxml not installed)'}")
+
+    work_dir = Path(tempfile.mkdtemp(prefix='docx_bench_'))
+    try:
+        files = []
+        for i in range(args.docs):
+            paragraphs = args.paragraphs * (i + 1)
+            path = work_dir / f'synthetic_{paragraphs}.docx'
+            build_synthetic_docx(path, paragraphs)
+            files.append(path)
+            print(f"  📄 {path.name}: {path.stat().st_size / (1024 * 1024):.1f} MB")
+
+        print(f"\n{'File':<28}{'Method':<14}{'Time (s)':>10}{'Peak +MB':>10}{'Chars':>14}")
+        print("-" * 76)
+
+        for path in files:
+            for method in methods:
+                result = measure(method, path)
+                growth = result['peak_growth_mb']
+                growth_text = f"{growth:.0f}" if growth is not None else 'n/a'
+                print(f"{path.name:<28}{method:<14}{result['seconds']:>10.2f}"
+                      f"{growth_text:>10}{result['chars']:>14,}")
+                if result['error']:
+                    print(f"    ❌ {result['error'][:70]}")
+
+        print("\nNote: python-docx reads body paragraphs only - the character gap is")
+        print("table, footnote, header and footer text it never returned.")
+    finally:
+        if args.keep:
+            print(f"\nFiles kept in: {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
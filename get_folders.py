@@ -6,21 +6,16 @@ Identifies what's consuming disk space on C: drive
 """
 
 from pathlib import Path
-import os
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from utils.corpus_walker import folder_size, iter_files
 
 
 def get_folder_size(folder_path):
-    """Calculate folder size"""
-    total = 0
-    try:
-        for entry in os.scandir(folder_path):
-            if entry.is_file(follow_symlinks=False):
-                total += entry.stat().st_size
-            elif entry.is_dir(follow_symlinks=False):
-                total += get_folder_size(entry.path)
-    except (PermissionError, FileNotFoundError):
-        pass
-    return total
+    """Calculate folder size (parallel scandir walk)"""
+    return folder_size(Path(folder_path))
 
 
 def format_size(bytes_value):
@@ -95,15 +90,14 @@ def main():
                 print(f"   Pass 1 output: {format_size(output_size):.2f} GB")
                 print(f"   Location: {output_folder}")
                 
-                # Check for large files
+                # Check for large files (sizes come from the walk - no extra stat)
                 try:
-                    files = list(output_folder.rglob("*"))
-                    large_files = [f for f in files if f.is_file() and f.stat().st_size > 100*(1024**2)]  # > 100 MB
+                    large_files = [r for r in iter_files([output_folder]) if r.size > 100*(1024**2)]  # > 100 MB
                     
                     if large_files:
                         print(f"\n   Large files (>100 MB) in Pass 1 output:")
-                        for f in sorted(large_files, key=lambda x: x.stat().st_size, reverse=True)[:10]:
-                            print(f"      • {f.name}: {format_size(f.stat().st_size):.2f} GB")
+                        for record in sorted(large_files, key=lambda r: r.size, reverse=True)[:10]:
+                            print(f"      • {record.path.name}: {format_size(record.size):.2f} GB")
                 except:
                     pass
     
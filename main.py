@@ -34,21 +34,36 @@ Commands:
   phase0        Run Phase 0: Knowledge foundation (legacy)
   estimate      Show cost estimates
   status        Show current system status
+  scan          Show source files added/changed/removed since last Pass 1
+  cache stats   Show extraction cache statistics
+  cache clear   Empty the extraction cache
+  ocr status    Show the scanned-PDF OCR queue
+  ocr run       OCR every queued document now, then merge the text
+  ocr retry     Re-queue documents whose OCR failed
 
 Examples:
   python main.py analyse              # Run complete 4-pass analysis
   python main.py pass1                # Just triage documents
   python main.py estimate             # Check costs before running
   python main.py status               # Check what's been completed
+  python main.py cache stats          # Check extraction cache usage
+  python main.py ocr run              # OCR scanned PDFs found by Pass 1
         """
     )
     
     parser.add_argument(
         'command',
-        choices=['analyse', 'pass1', 'pass2', 'pass3', 'pass4', 'phase0', 'estimate', 'status'],
+        choices=['analyse', 'pass1', 'pass2', 'pass3', 'pass4', 'phase0', 'estimate', 'status', 'scan', 'cache', 'ocr'],
         help='Command to execute'
     )
     
+    parser.add_argument(
+        'subcommand',
+        nargs='?',
+        default=None,
+        help='Subcommand (cache: stats | clear, ocr: status | run | retry)'
+    )
+    
     parser.add_argument(
         '--limit',
         type=int,
@@ -57,6 +72,16 @@ Examples:
     
     args = parser.parse_args()
     
+    # Cache maintenance does not need the full orchestrator
+    if args.command == 'cache':
+        run_cache_command(Config(), args.subcommand or 'stats')
+        return
+    
+    # OCR queue inspection does not need the full orchestrator either
+    if args.command == 'ocr' and (args.subcommand or 'status') != 'run':
+        run_ocr_queue_command(Config(), args.subcommand or 'status')
+        return
+    
     # Initialise orchestrator
     try:
         orchestrator = LitigationOrchestrator()
@@ -82,6 +107,10 @@ Examples:
             show_cost_estimate(orchestrator)
         elif args.command == 'status':
             show_status(orchestrator)
+        elif args.command == 'scan':
+            run_scan(orchestrator)
+        elif args.command == 'ocr':
+            run_ocr(orchestrator)
     except KeyboardInterrupt:
         print("\n\nInterrupted by user. Progress saved.")
         sys.exit(0)
@@ -346,6 +375,90 @@ def run_phase_0(orchestrator):
         traceback.print_exc()
         raise
 
+def run_scan(orchestrator):
+    """Diff the source tree against the manifest (read-only)"""
+    
+    if orchestrator.source_manifest is None:
+        print("\n⚠️  Source manifest disabled (config.manifest_config)")
+        return
+    
+    folders = orchestrator.config.get_pass_1_folders()
+    diff = orchestrator.source_manifest.scan(folders)
+    orchestrator.source_manifest.print_diff(diff)
+    
+    if orchestrator.source_manifest.is_empty():
+        print("Manifest is empty - the next 'python main.py pass1' records the baseline.")
+    elif diff.has_changes:
+        print("Next step: python main.py pass1   # Triage only the changes")
+    else:
+        print("No changes - Pass 1 results are up to date.")
+
+
+def run_cache_command(config: Config, subcommand: str):
+    """Show or clear the extraction cache"""
+    from utils.extraction_cache import ExtractionCache
+    
+    cache_config = config.extraction_cache_config
+    cache = ExtractionCache(
+        cache_dir=cache_config['cache_dir'],
+        max_size_mb=cache_config.get('max_size_mb', 2048)
+    )
+    
+    try:
+        if subcommand == 'stats':
+            cache.print_stats()
+        elif subcommand == 'clear':
+            stats = cache.get_statistics()
+            response = input(f"\nClear {stats['entries']:,} cached extractions? (yes/no): ").strip().lower()
+            if response == 'yes':
+                cache.clear()
+                print("✅ Extraction cache cleared")
+            else:
+                print("Cancelled.")
+        else:
+            print(f"Unknown cache subcommand: {subcommand} (use: stats | clear)")
+    finally:
+        cache.close()
+
+
+def run_ocr_queue_command(config: Config, subcommand: str):
+    """Show the OCR queue or re-queue failed jobs"""
+    from utils.ocr_queue import OCRQueue
+    
+    ocr_queue = OCRQueue(config.ocr_config['queue_db'])
+    
+    if subcommand == 'status':
+        ocr_queue.print_stats()
+    elif subcommand == 'retry':
+        count = ocr_queue.retry_failed()
+        print(f"✅ {count} failed OCR jobs re-queued - run: python main.py ocr run")
+    else:
+        print(f"Unknown ocr subcommand: {subcommand} (use: status | run | retry)")
+
+
+def run_ocr(orchestrator):
+    """OCR every queued scanned document in the foreground, then merge"""
+    
+    pool = orchestrator.get_ocr_pool()
+    if pool is None:
+        print("\n⚠️  OCR disabled (config.ocr_config)")
+        return
+    
+    stats = pool.queue.get_statistics()
+    print(f"\n🔠 OCR queue: {stats['pending'] + stats['running']:,} documents to process")
+    
+    if stats['pending'] + stats['running']:
+        pool.on_progress = lambda p: print(f"  {p['status']:>8}: {p['completed']:,} done, {p['failed']:,} failed")
+        try:
+            pool.run()
+        except ImportError as e:
+            print(f"⚠️  {e}")
+            return
+    
+    orchestrator.merge_ocr_results()
+    pool.queue.print_stats()
+
+
 def show_cost_estimate(orchestrator):
     """Show detailed cost estimates"""
     
@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Dict, List, Tuple
 import time
 
+from utils.archive_reader import source_exists
+
 
 class IntelligentSearch:
     """
@@ -160,30 +162,13 @@ class IntelligentSearch:
         # Find original file
         original_path = self._find_original_file(doc)
         
-        if not original_path or not original_path.exists():
+        if not original_path or not source_exists(original_path):
             print(f"      ⚠️  Original file not found: {doc['filename']}")
             return doc.get('content', '')
         
-        # Load full PDF (NO LIMITS!)
+        # Load full text (NO LIMITS!) - served from the page store after first load
         try:
-            # Temporarily remove limits
-            old_max_chars = self.document_loader.MAX_CHARS_EXTRACT
-            old_max_pages = self.document_loader.MAX_PDF_PAGES
-            
-            self.document_loader.MAX_CHARS_EXTRACT = None  # No limit!
-            self.document_loader.MAX_PDF_PAGES = None      # No limit!
-            
-            # Load full document
-            full_doc = self.document_loader.load_document(
-                original_path, 
-                folder_metadata=doc.get('folder_metadata', {})
-            )
-            
-            # Restore limits
-            self.document_loader.MAX_CHARS_EXTRACT = old_max_chars
-            self.document_loader.MAX_PDF_PAGES = old_max_pages
-            
-            full_text = full_doc['content']
+            full_text = self.document_loader.load_full_text(original_path)
             
             # Cache it
             self.full_doc_cache[doc_id] = full_text
@@ -196,6 +181,30 @@ class IntelligentSearch:
             print(f"      ❌ Error loading full PDF: {e}")
             return doc.get('content', '')
     
+    def get_pages(self, doc: Dict, start: int, end: int = None) -> List[Dict]:
+        """
+        Fetch a page range of a document without re-parsing the whole file
+        
+        Args:
+            doc: Document (needs metadata filepath or folder + filename)
+            start: First page (1-based)
+            end: Last page, inclusive (None = last page)
+            
+        Returns:
+            List of {'page', 'text', 'engine'} dictionaries (empty if not found)
+        """
+        original_path = self._find_original_file(doc)
+        
+        if not original_path or not source_exists(original_path):
+            print(f"      ⚠️  Original file not found: {doc.get('filename')}")
+            return []
+        
+        try:
+            return self.document_loader.load_pages(original_path, start, end)
+        except Exception as e:
+            print(f"      ❌ Error loading pages {start}-{end}: {e}")
+            return []
+    
     def _find_original_file(self, doc: Dict) -> Path:
         """Find original PDF file from document metadata"""
         
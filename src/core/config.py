@@ -41,6 +41,7 @@ class Config:
         # Output folders (in project)
         self.output_dir = self.project_root / "data" / "output"
         self.analysis_dir = self.output_dir / "analysis"
+        self.phase_0_dir = self.analysis_dir / "phase_0"
         
         # API Configuration
         self.api_config = {
@@ -77,10 +78,90 @@ class Config:
             'prefix_chars': 10000,
             'enable_semantic': True,
             'similarity_threshold': 0.85,
+            'lsh_jaccard_threshold': 0.5,   # Shingle overlap at which MinHash/LSH proposes a candidate
+            'minhash_permutations': 128,
+            'shingle_size': 3,              # Words per shingle
             'skip_duplicates': True,
             'log_duplicates': True,
             'batch_dedup': True,
-            'max_vectors_in_memory': 5000
+            'max_vectors_in_memory': 5000,  # Full term vectors in RAM; the rest spill to disk
+            'vector_sketch_dims': 256,      # Fixed-size per-document sketch kept in RAM
+            'vector_spill_dir': self.output_dir / "dedup_spill",
+            'parallel_workers': max(1, (os.cpu_count() or 2) - 1),  # Feature processes (1 = serial)
+            'parallel_batch_size': 500,     # Documents sharded per parallel round
+            'containment_enabled': True,    # Exhibits inside bundles, emails inside chains
+            'containment_threshold': 0.8,   # Share of the smaller document found in the larger
+            'winnow_kgram': 8,              # Words per fingerprinted k-gram
+            'winnow_window': 4,             # K-grams per winnowing window
+            'containment_action': 'skip',   # 'skip' or 'downgrade' contained priority documents
+            'persistent_index': True,       # Share verdicts across phases, passes and runs
+            'index_db': self.output_dir / "dedup_index.db"
+        }
+
+        # Document Loading Configuration
+        self.loader_config = {
+            'parallel_enabled': True,
+            'max_workers': max(1, (os.cpu_count() or 2) - 1),
+            'parallel_min_files': 1,     # Even small folders get hang/OOM protection
+            'tasks_per_worker': 2,       # Files queued per worker process
+            'max_crash_retries': 1,      # Re-runs before a crashing file is quarantined
+            'file_timeout_seconds': 600, # Hard kill (in-process PDF limit is 300s)
+            'max_worker_rss_mb': 3072,   # Hard kill when a worker's memory exceeds this
+            'discovery_workers': 8,      # Threads listing directories (I/O bound)
+            'preview_triage': True,      # Pass 1 extracts previews; full text only for priority docs
+            'preview_chars': self.deduplication_config['prefix_chars'],  # Whole dedup prefix is extracted
+            'preview_max_pages': 50      # PDF page cap when pages yield little text (scans)
+        }
+
+        # Extraction Cache Configuration
+        self.extraction_cache_config = {
+            'enabled': True,
+            'cache_dir': self.output_dir / "extraction_cache",
+            'max_size_mb': 2048          # Compressed text budget before LRU eviction
+        }
+
+        # Page Store Configuration (random-access page loading)
+        self.page_store_config = {
+            'enabled': True,
+            'store_dir': self.output_dir / "page_store"
+        }
+
+        # OCR Configuration (scanned PDFs, worked off the triage path)
+        self.ocr_config = {
+            'enabled': True,
+            'queue_db': self.output_dir / "ocr_queue.db",
+            'background': True,          # Run the OCR pool alongside Pass 1
+            'max_workers': 1,            # OCR processes (below-normal priority)
+            'dpi': 300,
+            'language': 'eng',
+            'tesseract_cmd': None,       # Path to tesseract.exe if not on PATH
+            'job_timeout_seconds': 1800, # Hard kill per document
+            'max_worker_rss_mb': 2048
+        }
+
+        # Email Threading Configuration (quoted history collapsed before triage)
+        self.email_threading_config = {
+            'enabled': True,
+            'threads_file': self.analysis_dir / "pass_1" / "email_threads.json"
+        }
+
+        # Source Manifest Configuration (incremental ingest)
+        self.manifest_config = {
+            'enabled': True,
+            'db_path': self.output_dir / "source_manifest.db"
+        }
+
+        # BM25 Retrieval Configuration (persistent index, synced incrementally)
+        self.retrieval_config = {
+            'index_db': self.output_dir / "bm25_index.db",
+            'k1': 1.5,   # Term frequency saturation
+            'b': 0.75,   # Length normalisation
+            
+            # Passage retrieval (Pass 3 and chat send passages, not whole documents)
+            'passage_index_db': self.output_dir / "passage_index.db",
+            'passage_tokens': 400,            # Target passage size
+            'passage_token_budget': 12000,    # Passage tokens per prompt
+            'max_passages_per_doc': 3
         }
 
         self.vector_config = {
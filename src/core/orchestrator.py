@@ -21,7 +21,12 @@ from api.client import ClaudeClient
 from prompts.autonomous import AutonomousPrompts
 from prompts.deliverables import DeliverablesPrompts
 from utils.document_loader import DocumentLoader
-from utils.document_retrieval import DocumentRetrieval
+from utils.retrieval_service import RetrievalService
+from utils.source_manifest import SourceManifest
+from utils.ocr_queue import OCRWorkerPool
+from utils.dedup_index import DedupIndex
+from utils.deduplication import DocumentDeduplicator
+from utils.archive_reader import source_exists
 from core.phase_0 import Phase0Executor 
 
 # ACTIVATED: Import HierarchicalMemory system
@@ -75,12 +80,34 @@ class LitigationOrchestrator:
         
 
         self.document_loader = DocumentLoader(self.config)
+        
+        # Source manifest (added/changed/removed files between runs)
+        self.source_manifest = None
+        manifest_config = getattr(self.config, 'manifest_config', {})
+        if manifest_config.get('enabled', False):
+            self.source_manifest = SourceManifest(
+                db_path=manifest_config['db_path'],
+                supported_formats=DocumentLoader.SUPPORTED_FORMATS,
+                hash_fn=self.document_loader.content_hash,
+                known_hash_fn=self.document_loader.known_hash,
+                walk_workers=self.config.loader_config['discovery_workers']
+            )
+        
+        # OCR pool for scanned PDFs (started by Pass 1 or 'python main.py ocr')
+        self.ocr_pool = None
+        
+        # Dedup index shared by Phase 0 and every pass (see create_deduplicator)
+        self.dedup_index = None
+        dedup_config = self.config.deduplication_config
+        if dedup_config['enabled'] and dedup_config.get('persistent_index', False):
+            self.dedup_index = DedupIndex(dedup_config['index_db'])
+        
         self.autonomous_prompts = AutonomousPrompts(self.config)
         self.deliverables_prompts = DeliverablesPrompts(self.config)
         
-        # Document retrieval system (BM25)
-        self.retrieval_system = None
-        print("✅ BM25 Document Retrieval ready (builds index on first use)")
+        # Document retrieval (BM25) - one index snapshot for every pass and chat
+        self.retrieval_service = RetrievalService(self.knowledge_graph, self.config)
+        print("✅ BM25 Document Retrieval ready (opens index on first use)")
 
         self.phase0_executor = Phase0Executor(self.config, self)
         
@@ -358,40 +385,134 @@ class LitigationOrchestrator:
                 'error': str(e)
             }
     
+    # ========================================================================
+    # DEDUPLICATION
+    # ========================================================================
+    
+    def create_deduplicator(self, scope: str,
+                            similarity_threshold: Optional[float] = None) -> Optional[DocumentDeduplicator]:
+        """
+        Deduplicator for one phase or pass, backed by the shared dedup index
+        
+        Args:
+            scope: Name verdicts are recorded under ('phase_0', 'pass_1', ...)
+            similarity_threshold: Override the configured threshold for this scope
+            
+        Returns:
+            DocumentDeduplicator, or None if deduplication is disabled
+        """
+        dedup_config = self.config.deduplication_config
+        if not dedup_config['enabled']:
+            return None
+        
+        return DocumentDeduplicator(
+            similarity_threshold=similarity_threshold or dedup_config['similarity_threshold'],
+            prefix_chars=dedup_config['prefix_chars'],
+            enable_semantic=dedup_config['enable_semantic'],
+            lsh_threshold=dedup_config['lsh_jaccard_threshold'],
+            num_perm=dedup_config['minhash_permutations'],
+            shingle_size=dedup_config['shingle_size'],
+            index=self.dedup_index,
+            scope=scope,
+            max_vectors_in_memory=dedup_config['max_vectors_in_memory'],
+            sketch_dims=dedup_config.get('vector_sketch_dims', 256),
+            spill_dir=dedup_config.get('vector_spill_dir')
+        )
+    
+    # ========================================================================
+    # OCR (scanned PDFs)
+    # ========================================================================
+    
+    def get_ocr_pool(self) -> Optional[OCRWorkerPool]:
+        """OCR worker pool over the loader's queue (None if OCR is disabled)"""
+        if self.ocr_pool is None and self.document_loader.ocr_queue is not None:
+            ocr_config = self.config.ocr_config
+            self.ocr_pool = OCRWorkerPool(
+                queue=self.document_loader.ocr_queue,
+                max_workers=ocr_config.get('max_workers', 1),
+                dpi=ocr_config.get('dpi', 300),
+                language=ocr_config.get('language', 'eng'),
+                tesseract_cmd=ocr_config.get('tesseract_cmd'),
+                job_timeout_seconds=ocr_config.get('job_timeout_seconds', 1800),
+                max_worker_rss_mb=ocr_config.get('max_worker_rss_mb')
+            )
+        return self.ocr_pool
+    
+    def start_ocr_pool(self) -> bool:
+        """Start background OCR if enabled and an engine is installed"""
+        if not getattr(self.config, 'ocr_config', {}).get('background', False):
+            return False
+        
+        pool = self.get_ocr_pool()
+        if pool is None:
+            return False
+        
+        if pool.start():
+            print("🔠 OCR pool running in the background (scanned PDFs)")
+            return True
+        
+        print("⚠️  Scanned PDFs will be queued for OCR, but no OCR engine is installed")
+        print("   Install: pip install pytesseract pillow (plus the Tesseract binary)")
+        return False
+    
+    def merge_ocr_results(self) -> int:
+        """
+        Merge finished OCR text into the extraction cache and knowledge graph
+        
+        Runs on the main thread (the OCR pool only writes its own queue).
+        Merged documents stay flagged in the queue until the next Pass 1
+        has triaged them with their OCR text.
+        
+        Returns:
+            Number of documents updated
+        """
+        ocr_queue = self.document_loader.ocr_queue
+        if ocr_queue is None:
+            return 0
+        
+        merged = 0
+        for job in ocr_queue.unmerged():
+            if not source_exists(job['path']):
+                ocr_queue.mark_merged(job['content_hash'])   # source since removed
+                continue
+            try:
+                doc = self.document_loader.apply_ocr_result(Path(job['path']))
+                doc['doc_id'] = doc.get('doc_id') or job['doc_id']
+                self.knowledge_graph.update_document_content(doc)
+                ocr_queue.mark_merged(job['content_hash'])
+                merged += 1
+            except Exception as e:
+                print(f"  ⚠️  OCR merge failed for {Path(job['path']).name}: {str(e)[:50]}")
+        
+        if merged:
+            print(f"🔠 OCR text merged for {merged} scanned documents")
+        
+        return merged
+    
     # ========================================================================
     # BUILD BM25 DOCUMENT INDEX (when needed)
     # ========================================================================
     
     def build_document_index(self):
-        """Build BM25 index for document retrieval (one-time operation)"""
-        if self.retrieval_system is not None:
-            print("✅ Document index already built")
-            return
-        
+        """Refresh the shared BM25 index with any new or changed documents"""
         print("\n" + "="*70)
-        print("BUILDING BM25 DOCUMENT INDEX")
+        print("REFRESHING BM25 DOCUMENT INDEX")
         print("="*70)
         
         try:
-            # Load all documents
-            print("Loading documents from knowledge graph...")
-            all_docs = self.knowledge_graph.get_all_documents()
+            sync = self.retrieval_service.refresh()
+            stats = self.retrieval_service.get_statistics()
             
-            if not all_docs:
+            if not stats['total_documents']:
                 print("⚠️  No documents found in knowledge graph")
-                return
-            
-            # Build retrieval index
-            print(f"Building index for {len(all_docs)} documents...")
-            self.retrieval_system = DocumentRetrieval(all_docs)
-            
-            print(f"✅ Document index built successfully")
-            print(f"   {len(all_docs)} documents indexed")
+            else:
+                print(f"✅ Document index {sync['action']} (+{sync['added']:,} / -{sync['removed']:,})")
+                print(f"   {stats['total_documents']:,} documents, {stats['total_terms']:,} terms "
+                      f"({stats['index_size_mb']} MB on disk)")
             print("="*70 + "\n")
             
         except Exception as e:
-            print(f"⚠️  Failed to build document index: {e}")
-            self.retrieval_system = None
+            print(f"⚠️  Failed to refresh document index: {e}")
     
     def retrieve_documents(self, query: str, top_k: int = 20) -> List[Dict]:
         """
@@ -405,10 +526,12 @@ class LitigationOrchestrator:
             List of relevant documents
         """
         # Try BM25 first (fast)
-        if self.retrieval_system:
-            bm25_results = self.retrieval_system.search(query, top_k=top_k)
+        try:
+            bm25_results = self.retrieval_service.search(query, top_k=top_k)
             if bm25_results:
                 return bm25_results
+        except Exception as e:
+            print(f"⚠️  BM25 search failed, falling back: {str(e)[:80]}")
         
         # Fall back to semantic search if available
         if self.memory_enabled:
@@ -12,9 +12,9 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from tqdm import tqdm
 import hashlib
-from collections import Counter
-import math
-from utils.deduplication import DocumentDeduplicator
+from utils.email_threading import EmailThreader
+from utils.containment import ContainmentIndex
+from utils.archive_reader import source_exists
 
 
 class PassExecutor:
@@ -39,18 +39,18 @@ class PassExecutor:
         self.checkpoint_dir = config.output_dir / "checkpoints"
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
         
-        # Document index for optimised retrieval
-        self.document_index = None
+        # Shared BM25 retrieval (index snapshot owned by the orchestrator)
+        self.retrieval = orchestrator.retrieval_service
         
-        # Deduplication system for Pass 1
-        if config.deduplication_config['enabled']:
-            self.deduplicator = DocumentDeduplicator(
-                similarity_threshold=config.deduplication_config['similarity_threshold'],
-                prefix_chars=config.deduplication_config['prefix_chars'],
-                enable_semantic=config.deduplication_config['enable_semantic']
-            )
-        else:
-            self.deduplicator = None
+        # Source manifest for incremental Pass 1
+        self.source_manifest = getattr(orchestrator, 'source_manifest', None)
+        
+        # Deduplication system for Pass 1 (shared dedup index, 'pass_1' scope)
+        self.deduplicator = orchestrator.create_deduplicator('pass_1')
+        
+        # Email threading - replies reach triage without their quoted history
+        threading_config = getattr(config, 'email_threading_config', {})
+        self.email_threader = EmailThreader() if threading_config.get('enabled') else None
         
         # Load pleadings into API client for caching
        # self._load_pleadings_for_caching()
@@ -245,126 +245,25 @@ class PassExecutor:
         return validation_result
     
     # ========================================================================
-    # OPTIMISED DOCUMENT RETRIEVAL (BM25 Algorithm)
+    # DOCUMENT RETRIEVAL (shared BM25 index)
     # ========================================================================
     
-    def _build_document_index(self):
-        """Build inverted index for fast BM25 document retrieval"""
-        if self.document_index is not None:
-            return
-        
-        print("\n📚 Building document index for optimal retrieval...")
-        
-        # Get all documents
-        conn = self.knowledge_graph._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT doc_id, content, preview
-            FROM discovery_log
-        """)
+    def _refresh_retrieval(self):
+        """Sync the orchestrator's BM25 index before retrieval-heavy passes"""
+        print("\n📚 Refreshing document index for optimal retrieval...")
         
-        documents = []
-        for row in cursor.fetchall():
-            doc_id, content, preview = row
-            text = content or preview or ""
-            documents.append({'doc_id': doc_id, 'text': text})
+        sync = self.retrieval.refresh()
+        stats = self.retrieval.get_statistics()
         
-        conn.close()
-        
-        if not documents:
+        if not stats['total_documents']:
             print("  ⚠️  No documents found")
-            self.document_index = {'docs': [], 'index': {}, 'doc_lengths': {}, 'avgdl': 0}
-            return
-        
-        # Build inverted index with term frequencies
-        index = {}  # term -> {doc_id: frequency}
-        doc_lengths = {}
-        
-        for doc in documents:
-            doc_id = doc['doc_id']
-            terms = self._tokenize(doc['text'])
-            doc_lengths[doc_id] = len(terms)
-            
-            term_counts = Counter(terms)
-            for term, count in term_counts.items():
-                if term not in index:
-                    index[term] = {}
-                index[term][doc_id] = count
-        
-        avgdl = sum(doc_lengths.values()) / len(doc_lengths) if doc_lengths else 0
-        
-        self.document_index = {
-            'docs': documents,
-            'index': index,
-            'doc_lengths': doc_lengths,
-            'avgdl': avgdl,
-            'N': len(documents)
-        }
-        
-        print(f"  ✅ Indexed {len(documents):,} documents, {len(index):,} unique terms")
-    
-    def _tokenize(self, text: str) -> List[str]:
-        """Simple tokenisation for BM25"""
-        # Lowercase and extract words
-        text = text.lower()
-        words = re.findall(r'\b[a-z]{3,}\b', text)
-        
-        # Remove common stop words
-        stop_words = {'the', 'and', 'for', 'are', 'but', 'not', 'you', 'with', 
-                      'was', 'this', 'that', 'from', 'have', 'has', 'had'}
-        words = [w for w in words if w not in stop_words]
-        
-        return words
-    
-    def _bm25_search(self, query: str, top_k: int = 20) -> List[str]:
-        """
-        BM25 ranking algorithm for document retrieval
-        Returns list of doc_ids ranked by relevance
-        """
-        if self.document_index is None:
-            self._build_document_index()
-        
-        if not self.document_index['docs']:
-            return []
-        
-        query_terms = self._tokenize(query)
-        
-        if not query_terms:
-            return []
-        
-        # BM25 parameters
-        k1 = 1.5  # Term frequency saturation
-        b = 0.75  # Length normalisation
-        
-        N = self.document_index['N']
-        avgdl = self.document_index['avgdl']
-        index = self.document_index['index']
-        doc_lengths = self.document_index['doc_lengths']
-        
-        # Calculate BM25 scores
-        scores = {}
-        
-        for term in query_terms:
-            if term not in index:
-                continue
-            
-            df = len(index[term])  # Document frequency
-            idf = math.log((N - df + 0.5) / (df + 0.5) + 1.0)
-            
-            for doc_id, tf in index[term].items():
-                if doc_id not in scores:
-                    scores[doc_id] = 0.0
-                
-                doc_len = doc_lengths[doc_id]
-                norm = 1 - b + b * (doc_len / avgdl)
-                
-                scores[doc_id] += idf * (tf * (k1 + 1)) / (tf + k1 * norm)
-        
-        # Sort by score
-        ranked_docs = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        
-        return [doc_id for doc_id, score in ranked_docs[:top_k]]
+        elif sync['action'] == 'current':
+            print(f"  ✅ Index current: {stats['total_documents']:,} documents, {stats['total_terms']:,} unique terms")
+        elif sync['action'] == 'updated':
+            print(f"  ✅ Index updated: +{sync['added']:,} / -{sync['removed']:,} documents "
+                  f"({stats['total_documents']:,} indexed)")
+        else:
+            print(f"  ✅ Indexed {stats['total_documents']:,} documents, {stats['total_terms']:,} unique terms")
     
     # ========================================================================
     # PASS 1: TRIAGE WITH PHASE 0 INTELLIGENCE AND DEDUPLICATION
@@ -377,17 +276,51 @@ class PassExecutor:
         print("PASS 1: INTELLIGENT TRIAGE & PRIORITISATION")
         print("="*70)
         
+        # Diff source tree against manifest (skipped in test mode)
+        source_folders = self.config.get_pass_1_folders()
+        manifest_diff = None
+        if self.source_manifest is not None and limit is None:
+            # New/changed files are hashed by the extraction read, not here
+            manifest_diff = self.source_manifest.scan(source_folders, defer_hashes=True)
+        
+        # Scans OCR'd since they were triaged are scored again with their text
+        ocr_retriage = []
+        ocr_queue = getattr(self.document_loader, 'ocr_queue', None)
+        if ocr_queue is not None and manifest_diff is not None:
+            if hasattr(self.orchestrator, 'merge_ocr_results'):
+                self.orchestrator.merge_ocr_results()
+            ocr_retriage = ocr_queue.awaiting_triage()
+        
         # Check for checkpoint
+        previous_index = None
         checkpoint = self._load_checkpoint('pass_1')
         if checkpoint:
-            print("📂 Resuming from checkpoint...")
-            return checkpoint
+            if manifest_diff is None or not (manifest_diff.has_changes or ocr_retriage):
+                print("📂 Resuming from checkpoint...")
+                return checkpoint
+            
+            if self.source_manifest.is_empty():
+                # Checkpoint predates the manifest - adopt current tree as baseline
+                self.source_manifest.commit(manifest_diff)
+                print("📂 Resuming from checkpoint (source manifest initialised)...")
+                return checkpoint
+            
+            previous_index = self._load_scored_index()
+            if previous_index is None:
+                print("⚠️  Source changed but no scored index saved - full re-triage required")
+            else:
+                summary = manifest_diff.summary()
+                print(f"📂 Source changed since checkpoint - incremental triage")
+                print(f"   Added: {summary['added']:,}  Changed: {summary['changed']:,}  Removed: {summary['removed']:,}")
+        
+        incremental = previous_index is not None
         
         # ====================================================================
         # LOAD PHASE 0 SMOKING GUN PATTERNS
         # ====================================================================
         phase_0_file = self.config.phase_0_dir / "case_foundation.json"
         smoking_gun_patterns = []
+        phase_0_foundation = None
         phase_0_used = False
         
         if phase_0_file.exists():
@@ -420,12 +353,10 @@ class PassExecutor:
             print(f"   💡 Tip: Run 'python main.py phase0' first for better results\n")
         
         # ====================================================================
-        # LOAD ALL DOCUMENTS
+        # STREAM DOCUMENTS: LOAD -> DEDUPLICATE -> TRIAGE BATCHES
         # ====================================================================
-       # ====================================================================
-# LOAD ALL DOCUMENTS
-        # ====================================================================
-        all_documents = []
+        # Documents flow through one batch at a time; only the current batch
+        # holds full text, so memory is bounded by batch size, not corpus size.
 
         # Show test mode early
         if limit is not None and limit > 0:
@@ -433,120 +364,71 @@ class PassExecutor:
             print(f"🔬 TEST MODE: Will stop after loading {limit} documents")
             print(f"{'='*70}\n")
 
-        for folder_name in self.config.get_pass_1_folders():
-            # Stop loading if we've hit the limit
-            if limit is not None and len(all_documents) >= limit:
-                print(f"\n✋ Limit reached - stopping folder scan")
-                break
-                
-            folder_path = self.config.source_root / folder_name
-            if folder_path.exists():
-                docs = self.document_loader.load_folder(folder_path)
-                
-                # If adding these docs would exceed limit, only add what we need
-                if limit is not None and len(all_documents) + len(docs) > limit:
-                    remaining = limit - len(all_documents)
-                    all_documents.extend(docs[:remaining])
-                    print(f"\n✋ Limit reached - loaded {len(all_documents)} documents total")
-                    break
-                else:
-                    all_documents.extend(docs)
-                
-                # If adding these docs would exceed limit, only add what we need
-                if limit is not None and len(all_documents) + len(docs) > limit:
-                    remaining = limit - len(all_documents)
-                    all_documents.extend(docs[:remaining])
-                    print(f"\n✋ Limit reached - loaded {len(all_documents)} documents total")
-                    break
-                else:
-                    all_documents.extend(docs)
-
-        initial_doc_count = len(all_documents)
-        print(f"\n📁 Loaded {initial_doc_count:,} documents")
-        # ====================================================================
-        # DEDUPLICATION STAGE
-        # ====================================================================
-        if self.deduplicator:
-            print(f"\n🔍 DEDUPLICATION STAGE")
-            print(f"{'='*70}")
-            print(f"Initial documents: {initial_doc_count:,}")
-            print(f"Checking for duplicates...")
-            
-            unique_docs = []
-            duplicate_log = []
-            
-            for idx, doc in enumerate(all_documents, 1):
-                if idx % 100 == 0:
-                    print(f"  Progress: {idx:,}/{initial_doc_count:,} ({idx/initial_doc_count:.1%})")
-                
-                content = doc.get('content', '') or doc.get('preview', '')
-                doc_id = doc.get('doc_id', '')
-                filename = doc.get('filename', '')
-                
-                is_dup, reason = self.deduplicator.is_duplicate(content, doc_id, filename)
-                
-                if not is_dup:
-                    unique_docs.append(doc)
-                else:
-                    duplicate_log.append({
-                        'doc_id': doc_id,
-                        'filename': filename,
-                        'duplicate_type': reason
-                    })
-            
-            # Update document list
-            all_documents = unique_docs
-            final_doc_count = len(all_documents)
-            
-            # Statistics
-            dedup_stats = self.deduplicator.get_statistics()
-            dedup_stats['initial_count'] = initial_doc_count
-            dedup_stats['final_count'] = final_doc_count
-            dedup_stats['removed'] = initial_doc_count - final_doc_count
-            
-            print(f"\n📊 Deduplication Results:")
-            print(f"   Unique documents: {final_doc_count:,} ({final_doc_count/initial_doc_count:.1%})")
-            print(f"   Removed: {initial_doc_count - final_doc_count:,}")
-            print(f"   - Exact duplicates: {dedup_stats['exact_duplicates']}")
-            print(f"   - Fuzzy duplicates: {dedup_stats['fuzzy_duplicates']}")
-            print(f"   - Semantic duplicates: {dedup_stats['semantic_duplicates']}")
-            print(f"{'='*70}\n")
-            
-            # Save duplicate log
-            if self.config.deduplication_config['log_duplicates']:
-                dup_log_file = self.config.analysis_dir / "pass_1" / "duplicate_log.json"
-                dup_log_file.parent.mkdir(parents=True, exist_ok=True)
-                
-                with open(dup_log_file, 'w', encoding='utf-8') as f:
-                    json.dump(duplicate_log, f, indent=2)
-                
-                print(f"💾 Duplicate log saved: {dup_log_file}\n")
+        # Triage only needs the opening pages - full text is extracted later,
+        # and only for the documents that make the priority cut
+        preview_only = self.config.loader_config.get('preview_triage', True)
+        
+        # Scanned PDFs found while loading are OCR'd alongside triage
+        if hasattr(self.orchestrator, 'start_ocr_pool'):
+            self.orchestrator.start_ocr_pool()
+        
+        if incremental:
+            paths_to_load = manifest_diff.paths_to_load
+            if self.deduplicator:
+                paths_to_load += self._promote_orphaned_duplicates(manifest_diff, paths_to_load)
+            if ocr_retriage:
+                queued = {str(p) for p in paths_to_load}
+                ocr_paths = [Path(job['path']) for job in ocr_retriage
+                             if job['path'] not in queued and source_exists(job['path'])]
+                paths_to_load += ocr_paths
+                print(f"  🔠 {len(ocr_paths):,} OCR'd scans re-queued for triage")
+            print(f"\n📥 Streaming {len(paths_to_load):,} new/changed documents")
+            document_stream = self.document_loader.iter_files(paths_to_load, preview_only=preview_only)
         else:
-            dedup_stats = {'initial_count': initial_doc_count, 'final_count': initial_doc_count, 'removed': 0}
+            document_stream = self._iter_pass_1_documents(source_folders, limit, preview_only)
         
-        # ====================================================================
-        # TRIAGE BATCHES WITH ENHANCED PROGRESS BAR
-        # ====================================================================
-        print(f"📁 Triaging {len(all_documents):,} unique documents")
+        loaded_hashes = {}
+        document_stream = self._iter_recording_hashes(document_stream, loaded_hashes)
+        
+        stream_stats = {'loaded': 0}
+        duplicate_log = []
+        
+        # Collapse quoted reply history before dedup, so the dedup and
+        # triage both see only what each message adds
+        if self.email_threader is not None:
+            if incremental:
+                self.email_threader.load(self.config.email_threading_config['threads_file'])
+                self.email_threader.remove_documents(manifest_diff.stale_doc_ids)
+            document_stream = self._iter_threaded_documents(document_stream)
+        
+        if self.deduplicator:
+            # Incremental runs only check new documents against the index
+            if incremental:
+                print(f"\n🔍 Deduplicating while loading ({len(self.deduplicator.clusters):,} documents already indexed)...")
+            else:
+                self.deduplicator.reset()
+                print(f"\n🔍 Deduplicating while loading...")
+            document_stream = self._iter_unique_documents(document_stream, duplicate_log, stream_stats)
+        else:
+            document_stream = self._count_documents(document_stream, stream_stats)
 
-        # Create batches
+        # Batches are formed lazily from the stream
         batch_size = 100
-        batches = []
-        for i in range(0, len(all_documents), batch_size):
-            batches.append(all_documents[i:i+batch_size])
+        batches = self._iter_batches(document_stream, batch_size)
 
-        print(f"📦 Processing in {len(batches)} batches\n")
+        print(f"📦 Triaging in batches of {batch_size}\n")
 
         scored_documents = []
         total_cost = 0.0
+        triaged_count = 0
         start_time = datetime.now()
 
-        # Enhanced progress bar with real-time # Enhanced progress bar with real-time cost tracking
-        with tqdm(total=len(batches), 
-            desc="🔍 Pass 1 Triage",
+        # Enhanced progress bar with real-time cost tracking (total unknown while streaming)
+        with tqdm(desc="🔍 Pass 1 Triage",
             unit=" batch") as pbar:
             
            for batch_idx, batch in enumerate(batches):
+            triaged_count += len(batch)
     
             lite_batch = []
             for idx, doc in enumerate(batch):
@@ -621,32 +503,33 @@ class PassExecutor:
                 total_cost += metadata.get('cost_gbp', 0)
                 
                 batch_scores = self._parse_triage_response(response, batch)
+                
+                # Keep scores, not full text - top documents are rehydrated at the end
+                for scored in batch_scores:
+                    scored.pop('content', None)
                 scored_documents.extend(batch_scores)
                 
                 print(f"     📊 Parsed {len(batch_scores)} scores")
                 
                 pbar.update(1)
                 
-                if len(batches) <= 5:
-                    print(f"  💰 Batch {batch_idx + 1}/{len(batches)} complete - Cost so far: £{total_cost:.2f}")
+                if batch_idx < 5:
+                    print(f"  💰 Batch {batch_idx + 1} complete - Cost so far: £{total_cost:.2f}")
                 
                 if (batch_idx + 1) % 10 == 0:
                     self._save_mini_checkpoint('pass_1', {
                         'scored_documents': scored_documents,
                         'batch_progress': batch_idx + 1,
-                        'total_batches': len(batches),
                         'cost_so_far': total_cost
                     })
                     
                     elapsed = (datetime.now() - start_time).total_seconds()
-                    rate = (batch_idx + 1) / elapsed if elapsed > 0 else 0
-                    eta_seconds = (len(batches) - (batch_idx + 1)) / rate if rate > 0 else 0
-                    eta_hours = eta_seconds / 3600
+                    rate = triaged_count / elapsed if elapsed > 0 else 0
                     
-                    print(f"\n  ✓ Checkpoint {batch_idx + 1}/{len(batches)}")
+                    print(f"\n  ✓ Checkpoint after batch {batch_idx + 1}")
                     print(f"    Documents scored: {len(scored_documents):,}")
                     print(f"    Cost so far: £{total_cost:.2f}")
-                    print(f"    ETA: {eta_hours:.1f} hours\n")
+                    print(f"    Rate: {rate * 3600:,.0f} documents/hour\n")
                 
             except Exception as e:
                 print(f"\n  ❌ EXCEPTION in batch {batch_idx + 1}:")
@@ -657,13 +540,89 @@ class PassExecutor:
                 pbar.update(1)
                 continue
 
+        initial_doc_count = stream_stats['loaded']
+        print(f"\n📁 Loaded {initial_doc_count:,} documents, triaged {triaged_count:,} unique")
+        
+        # ====================================================================
+        # DEDUPLICATION RESULTS
+        # ====================================================================
+        if self.deduplicator:
+            final_doc_count = triaged_count
+            
+            self.deduplicator.flush()
+            
+            # Statistics
+            dedup_stats = self.deduplicator.get_statistics()
+            dedup_stats['initial_count'] = initial_doc_count
+            dedup_stats['final_count'] = final_doc_count
+            dedup_stats['removed'] = initial_doc_count - final_doc_count
+            
+            print(f"\n📊 Deduplication Results:")
+            if initial_doc_count:
+                print(f"   Unique documents: {final_doc_count:,} ({final_doc_count/initial_doc_count:.1%})")
+            print(f"   Removed: {initial_doc_count - final_doc_count:,}")
+            print(f"   - Exact duplicates: {dedup_stats['exact_duplicates']}")
+            print(f"   - Fuzzy duplicates: {dedup_stats['fuzzy_duplicates']}")
+            print(f"   - Semantic duplicates: {dedup_stats['semantic_duplicates']}")
+            print(f"{'='*70}\n")
+            
+            # Save duplicate log
+            if self.config.deduplication_config['log_duplicates']:
+                dup_log_file = self.config.analysis_dir / "pass_1" / "duplicate_log.json"
+                dup_log_file.parent.mkdir(parents=True, exist_ok=True)
+                
+                with open(dup_log_file, 'w', encoding='utf-8') as f:
+                    json.dump(duplicate_log, f, indent=2)
+                
+                print(f"💾 Duplicate log saved: {dup_log_file}")
+                
+                if self.deduplicator.index is not None:
+                    clusters_file = self.config.analysis_dir / "pass_1" / "duplicate_clusters.json"
+                    cluster_count = self.deduplicator.index.export_clusters(clusters_file)
+                    print(f"💾 {cluster_count:,} duplicate clusters saved: {clusters_file}")
+                print()
+        else:
+            dedup_stats = {'initial_count': initial_doc_count, 'final_count': initial_doc_count, 'removed': 0}
+
+        # Hashes from the extraction read complete the manifest diff
+        if manifest_diff is not None and manifest_diff.pending:
+            hashed = self.source_manifest.resolve(manifest_diff, loaded_hashes)
+            if hashed:
+                print(f"  #️⃣  Hashed {hashed:,} files that were not extracted")
+        
+        # Merge delta scores into the previous full index
+        if incremental:
+            scored_documents = self._merge_scored_index(previous_index, scored_documents, manifest_diff)
+        
         # Sort and take top 800 (FIXED!)
         scored_documents.sort(key=lambda x: x.get('priority_score', 0), reverse=True)
         top_docs = scored_documents[:self.config.pass_1_config['target_priority_docs']]
         
+        # OCR finished during triage reaches the cache before full extraction
+        if hasattr(self.orchestrator, 'merge_ocr_results'):
+            self.orchestrator.merge_ocr_results()
+        
+        # Streamed scores carry no content - restore it for the priority set only
+        known_docs = checkpoint.get('priority_documents', []) if incremental else []
+        top_docs = self._rehydrate_documents(top_docs, known_docs)
+        
+        email_stats = None
+        if self.email_threader is not None and self.email_threader.messages:
+            top_docs = [self.email_threader.collapse_for_analysis(doc) for doc in top_docs]
+            threads_file = self.config.email_threading_config['threads_file']
+            self.email_threader.save(threads_file)
+            email_stats = self.email_threader.get_statistics()
+            self.email_threader.print_stats()
+            print(f"   💾 Threads saved: {threads_file}")
+        
+        # Exhibits inside bundles only show up on full text - check the priority set
+        containment_stats = None
+        if self.config.deduplication_config.get('containment_enabled', False):
+            top_docs, containment_stats = self._apply_containment(top_docs)
+        
         results = {
             'pass': '1',
-            'total_documents_triaged': len(all_documents),
+            'total_documents_triaged': len(scored_documents) if incremental else triaged_count,
             'priority_documents': top_docs,
             'priority_count': len(top_docs),
             'total_cost_gbp': total_cost,
@@ -672,20 +631,333 @@ class PassExecutor:
             'completed_at': datetime.now().isoformat()
         }
         
+        if email_stats is not None:
+            results['email_threading'] = email_stats
+        
+        if containment_stats is not None:
+            results['containment'] = containment_stats
+        
+        if incremental:
+            results['incremental'] = manifest_diff.summary()
+        
         self._save_pass_results('pass_1', results)
         self._save_checkpoint('pass_1', results)
         
+        # Record the ingested tree so the next run only sees new changes
+        if manifest_diff is not None:
+            self._save_scored_index(scored_documents)
+            if incremental:
+                self._remove_stale_documents(manifest_diff)
+            self.source_manifest.commit(manifest_diff)
+            if ocr_retriage:
+                ocr_queue.mark_triaged([job['content_hash'] for job in ocr_retriage])
+        
         print(f"\n✅ Pass 1 complete:")
         if dedup_stats['removed'] > 0:
             print(f"   Initial documents: {dedup_stats['initial_count']:,}")
             print(f"   After deduplication: {dedup_stats['final_count']:,}")
             print(f"   Duplicates removed: {dedup_stats['removed']:,}")
-        print(f"   Top priority documents: {len(top_docs)}/{len(all_documents)}")
+        print(f"   Top priority documents: {len(top_docs)}/{results['total_documents_triaged']}")
         print(f"   Cost: £{total_cost:.2f}")
         print(f"   Phase 0 intelligence: {'✅ USED' if phase_0_used else '❌ NOT USED'}")
         
         return results
     
+    # ========================================================================
+    # PASS 1 DOCUMENT STREAM
+    # ========================================================================
+    
+    def _iter_pass_1_documents(self, source_folders: List[Path], limit: int = None,
+                               preview_only: bool = False):
+        """Stream documents from the Pass 1 folders, stopping at limit"""
+        loaded = 0
+        
+        for folder_name in source_folders:
+            folder_path = self.config.source_root / folder_name
+            if not folder_path.exists():
+                continue
+            
+            for doc in self.document_loader.iter_folder(folder_path, preview_only=preview_only):
+                if limit is not None and loaded >= limit:
+                    print(f"\n✋ Limit reached - loaded {loaded} documents total")
+                    return
+                loaded += 1
+                yield doc
+    
+    def _iter_threaded_documents(self, documents):
+        """Register emails with the threader and strip their quoted history"""
+        for doc in documents:
+            yield self.email_threader.add_document(doc)
+    
+    def _iter_unique_documents(self, documents, duplicate_log: List[Dict], stream_stats: Dict):
+        """Pass through only documents the deduplicator has not seen"""
+        dedup_config = self.config.deduplication_config
+        checked = self.deduplicator.check_stream(
+            documents,
+            max_workers=dedup_config.get('parallel_workers', 1),
+            batch_size=dedup_config.get('parallel_batch_size', 500)
+        )
+        
+        for doc, verdict in checked:
+            stream_stats['loaded'] += 1
+            if stream_stats['loaded'] % 100 == 0:
+                print(f"  Dedup progress: {stream_stats['loaded']:,} documents checked")
+            
+            if not verdict['is_duplicate']:
+                yield doc
+            else:
+                duplicate_log.append({
+                    'doc_id': doc.get('doc_id', ''),
+                    'filename': doc.get('filename', ''),
+                    'duplicate_type': verdict['reason'],
+                    'duplicate_of': verdict['duplicate_of'],
+                    'cluster_id': verdict['cluster_id']
+                })
+    
+    def _iter_recording_hashes(self, documents, hashes: Dict[str, str]):
+        """Pass documents through, noting each source file's content hash"""
+        for doc in documents:
+            metadata = doc.get('metadata', {})
+            if metadata.get('filepath') and metadata.get('content_hash'):
+                hashes[metadata['filepath']] = metadata['content_hash']
+            yield doc
+    
+    def _count_documents(self, documents, stream_stats: Dict):
+        """Pass documents through, counting them"""
+        for doc in documents:
+            stream_stats['loaded'] += 1
+            yield doc
+    
+    def _iter_batches(self, documents, batch_size: int):
+        """Group a document stream into lists of batch_size"""
+        batch = []
+        for doc in documents:
+            batch.append(doc)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    # ========================================================================
+    # INCREMENTAL PASS 1 SUPPORT
+    # ========================================================================
+    
+    def _scored_index_file(self) -> Path:
+        return self.config.analysis_dir / "pass_1" / "scored_index.json"
+    
+    def _save_scored_index(self, scored_documents: List[Dict]):
+        """Save every scored document (without content) for incremental merges"""
+        index = []
+        for doc in scored_documents:
+            entry = {k: v for k, v in doc.items() if k != 'content'}
+            index.append(entry)
+        
+        index_file = self._scored_index_file()
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(index_file, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False)
+        
+        print(f"  💾 Scored index saved: {len(index):,} documents")
+    
+    def _load_scored_index(self) -> Optional[List[Dict]]:
+        """Load full scored index from the previous Pass 1 run"""
+        index_file = self._scored_index_file()
+        
+        if not index_file.exists():
+            return None
+        
+        with open(index_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _promote_orphaned_duplicates(self, manifest_diff, paths_to_load: List[Path]) -> List[Path]:
+        """
+        Forget stale dedup verdicts and find the copies left without an original
+        
+        A document dropped as a duplicate was never triaged; when the copy it
+        duplicated changes or disappears, one surviving path per orphaned
+        doc_id is added to the delta so it is deduplicated and triaged afresh.
+        
+        Returns:
+            Extra paths to load
+        """
+        orphan_ids = self.deduplicator.remove_documents(manifest_diff.stale_doc_ids)
+        if not orphan_ids or self.source_manifest is None:
+            return []
+        
+        skip = {str(p) for p in paths_to_load} | {e.path for e in manifest_diff.removed}
+        promoted = []
+        for paths in self.source_manifest.paths_for_doc_ids(orphan_ids).values():
+            live = [p for p in paths if str(p) not in skip]
+            if live:
+                promoted.append(live[0])
+        
+        if promoted:
+            print(f"  ♻️  {len(promoted):,} duplicates of changed/removed documents re-queued for triage")
+        return promoted
+    
+    def _merge_scored_index(self, previous_index: List[Dict],
+                            new_scores: List[Dict], manifest_diff) -> List[Dict]:
+        """
+        Replace stale entries in the previous index with freshly scored ones
+        
+        Args:
+            previous_index: Scored documents from the last run (no content)
+            new_scores: Documents scored in this run
+            manifest_diff: Scan result (removed/changed doc_ids are dropped)
+            
+        Returns:
+            Merged scored documents
+        """
+        stale_ids = set(manifest_diff.stale_doc_ids)
+        stale_ids.update(doc.get('doc_id') for doc in new_scores)
+        
+        kept = [doc for doc in previous_index if doc.get('doc_id') not in stale_ids]
+        
+        print(f"\n🔀 Merged scores: {len(kept):,} kept + {len(new_scores):,} new "
+              f"({len(previous_index) - len(kept):,} stale dropped)")
+        
+        return kept + new_scores
+    
+    def _rehydrate_documents(self, docs: List[Dict], known_docs: List[Dict]) -> List[Dict]:
+        """
+        Restore full content for priority documents after streaming triage
+        
+        Content comes from the previous priority list where possible;
+        everything else is fully extracted here in one batch, so the
+        expensive extraction runs only for documents that made the cut.
+        """
+        known_content = {
+            d.get('doc_id'): d.get('content') for d in known_docs
+            if d.get('content') and d.get('metadata', {}).get('extraction_mode') != 'preview'
+        }
+        rehydrated = []
+        to_extract = {}
+        
+        for doc in docs:
+            if doc.get('content') and doc.get('metadata', {}).get('extraction_mode') != 'preview':
+                rehydrated.append(doc)
+                continue
+            
+            doc = doc.copy()
+            content = known_content.get(doc.get('doc_id'))
+            if content is not None:
+                doc['content'] = content
+            else:
+                filepath = doc.get('metadata', {}).get('filepath')
+                if filepath and source_exists(filepath):
+                    to_extract[filepath] = doc
+            rehydrated.append(doc)
+        
+        extracted = 0
+        if to_extract:
+            print(f"\n📄 Full extraction for {len(to_extract)} priority documents...")
+            try:
+                for full_doc in self.document_loader.iter_files([Path(p) for p in to_extract]):
+                    doc = to_extract.get(full_doc.get('metadata', {}).get('filepath'))
+                    if doc is None:
+                        continue
+                    doc['content'] = full_doc.get('content')
+                    doc['metadata'] = {**doc.get('metadata', {}), **full_doc.get('metadata', {})}
+                    extracted += 1
+            except Exception as e:
+                print(f"  ⚠️  Full extraction stopped early: {str(e)[:50]}")
+        
+        for doc in rehydrated:
+            if not doc.get('content'):
+                doc['content'] = doc.get('preview', '')
+        
+        if extracted:
+            print(f"  ✅ Full content restored for {extracted} priority documents")
+        
+        return rehydrated
+    
+    def _apply_containment(self, docs: List[Dict]) -> Tuple[List[Dict], Dict]:
+        """
+        Skip or downgrade priority documents contained in another priority document
+        
+        Documents are indexed in priority order; a contained copy is marked
+        with contained_in (the outermost container) and either dropped or
+        moved to the end, per deduplication_config['containment_action'].
+        Relationships are recorded in the shared dedup index.
+        
+        Returns:
+            (documents, stats)
+        """
+        dedup_config = self.config.deduplication_config
+        index = ContainmentIndex(
+            threshold=dedup_config['containment_threshold'],
+            kgram=dedup_config['winnow_kgram'],
+            window=dedup_config['winnow_window']
+        )
+        
+        for doc in docs:
+            index.add(doc.get('doc_id', ''), doc.get('content', '') or '')
+        
+        if not index.contained_in:
+            return docs, {**index.get_statistics(), 'action': None, 'relationships': []}
+        
+        dedup_index = getattr(self.orchestrator, 'dedup_index', None)
+        relationships = []
+        kept = []
+        contained = []
+        
+        for doc in docs:
+            doc_id = doc.get('doc_id', '')
+            container = index.container_of(doc_id)
+            if container is None:
+                kept.append(doc)
+                continue
+            
+            score = index.contained_in[doc_id][1]
+            doc = doc.copy()
+            doc['metadata'] = {**doc.get('metadata', {}), 'contained_in': container,
+                               'containment': round(score, 3)}
+            contained.append(doc)
+            relationships.append({
+                'doc_id': doc_id,
+                'filename': doc.get('filename', ''),
+                'contained_in': container,
+                'containment': round(score, 3)
+            })
+            if dedup_index is not None:
+                dedup_index.record_containment('pass_1', doc_id, container, round(score, 3))
+        
+        if dedup_index is not None:
+            dedup_index.commit()
+        
+        action = dedup_config.get('containment_action', 'skip')
+        if action == 'downgrade':
+            docs = kept + contained
+        else:
+            docs = kept
+        
+        verb = 'moved to the end' if action == 'downgrade' else 'skipped'
+        print(f"\n📎 Containment: {len(contained)} priority documents sit inside another "
+              f"priority document ({verb})")
+        
+        return docs, {**index.get_statistics(), 'action': action, 'relationships': relationships}
+    
+    def _remove_stale_documents(self, manifest_diff):
+        """Drop removed files and superseded versions from the knowledge graph and vectors"""
+        # doc_ids are content hashes: an edited file is ingested under a new
+        # doc_id, so its previous version is stale just like a deleted file
+        stale_ids = manifest_diff.stale_doc_ids
+        
+        if stale_ids:
+            count = self.knowledge_graph.remove_documents(stale_ids)
+            print(f"  🗑️  Removed {count} deleted or superseded documents from knowledge graph")
+        
+        memory_system = getattr(self.orchestrator, 'memory_system', None)
+        
+        if stale_ids and memory_system is not None and memory_system.tier2 is not None:
+            memory_system.tier2.remove_documents(stale_ids)
+        
+        page_store = getattr(self.document_loader, 'page_store', None)
+        if manifest_diff.removed and page_store is not None:
+            page_store.remove([Path(e.path) for e in manifest_diff.removed])
+    
     # ========================================================================
     # PASS 2: DEEP ANALYSIS WITH CHECKPOINTING
     # ========================================================================
@@ -846,8 +1118,8 @@ class PassExecutor:
         print("PASS 3: AUTONOMOUS INVESTIGATIONS")
         print("="*70)
         
-        # Build document index for optimal retrieval
-        self._build_document_index()
+        # Bring the shared BM25 index up to date (Pass 1/2 may have added documents)
+        self._refresh_retrieval()
         
         checkpoint = self._load_checkpoint('pass_3')
         if checkpoint:
@@ -882,16 +1154,20 @@ class PassExecutor:
                 print(f"\n  🔍 Investigating: {investigation.topic}")
                 print(f"     Priority: {investigation.priority}/10 | Depth: {depth}")
                 
-                # OPTIMISED DOCUMENT RETRIEVAL using BM25
-                relevant_doc_ids = self._bm25_search(investigation.topic, top_k=20)
-                print(f"     📄 Retrieved {len(relevant_doc_ids)} relevant documents")
+                # OPTIMISED DOCUMENT RETRIEVAL - best BM25 passages within the token budget
+                relevant_documents = self.retrieval.retrieve_passages(
+                    investigation.topic,
+                    max_documents=self.config.pass_3_config.get('docs_per_investigation', 20)
+                )
+                passage_count = sum(len(doc['passages']) for doc in relevant_documents)
+                print(f"     📄 Retrieved {passage_count} passages from {len(relevant_documents)} relevant documents")
                 
                 # Get complete intelligence
                 complete_intel = self.knowledge_graph.export_complete()
                 
                 prompt = self.autonomous_prompts.investigation_recursive_prompt(
                     investigation=investigation,
-                    relevant_documents=relevant_doc_ids,
+                    relevant_documents=relevant_documents,
                     complete_intelligence=complete_intel
                 )
                 
@@ -905,7 +1181,7 @@ class PassExecutor:
                     # Parse investigation result
                     inv_result = self._parse_investigation_response(response, investigation)
                     inv_result['cost_gbp'] = metadata.get('cost_gbp', 0)
-                    inv_result['relevant_docs_count'] = len(relevant_doc_ids)
+                    inv_result['relevant_docs_count'] = len(relevant_documents)
                     
                     # Store result
                     self.knowledge_graph.store_investigation_result(inv_result)
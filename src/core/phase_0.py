@@ -93,7 +93,11 @@ class Phase0Executor:
         # Get dependencies from orchestrator
         self.api_client = orchestrator.api_client
         self.memory_system = getattr(orchestrator, 'memory_system', None)
-        self.deduplicator = getattr(orchestrator, 'deduplicator', None)
+        create_deduplicator = getattr(orchestrator, 'create_deduplicator', None)
+        self.deduplicator = (
+            create_deduplicator('phase_0', similarity_threshold=self.DEDUP_THRESHOLD)
+            if create_deduplicator else None
+        )
         
         # Import Phase0Prompts
         from prompts.phase_0_prompts import Phase0Prompts
@@ -111,9 +115,8 @@ class Phase0Executor:
         # Cache available folders for fuzzy matching
         self._available_folders = self._scan_available_folders()
         
-        # Configure stricter deduplication if available
+        # Stricter deduplication (own scope in the shared dedup index)
         if self.deduplicator:
-            self.deduplicator.similarity_threshold = self.DEDUP_THRESHOLD
             print(f"  🔍 Deduplication threshold: {self.DEDUP_THRESHOLD:.0%} (stricter)")
     
     def _scan_available_folders(self) -> List[Path]:
@@ -312,6 +315,10 @@ class Phase0Executor:
         start_time = datetime.now()
         total_cost = 0.0
         
+        # Phase 0 re-reads its folders every run - start its dedup scope afresh
+        if self.deduplicator:
+            self.deduplicator.reset()
+        
         # ====================================================================
         # STAGE 1: CASE UNDERSTANDING
         # ====================================================================
@@ -400,6 +407,9 @@ class Phase0Executor:
         # ====================================================================
         execution_time = (datetime.now() - start_time).total_seconds()
         
+        if self.deduplicator:
+            self.deduplicator.flush()
+        
         complete_foundation = {
             'phase': 'phase_0',
             'purpose': 'comprehensive_case_learning',
@@ -759,7 +769,7 @@ class Phase0Executor:
                     
                     # ✅ CHECK: Deduplication
                     if self.deduplicator:
-                        doc_id = doc.get('id', '')
+                        doc_id = doc.get('doc_id') or doc.get('id', '')
                         is_dup, reason = self.deduplicator.is_duplicate(content, doc_id, filename)
                         
                         if is_dup:
@@ -141,6 +141,7 @@ class KnowledgeGraph:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_contradictions_severity ON contradictions(severity)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_discovery_category ON discovery_log(category)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_discovery_importance ON discovery_log(importance)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_discovery_indexed_date ON discovery_log(indexed_date)")
         
         conn.commit()
 
@@ -245,6 +246,64 @@ class KnowledgeGraph:
         conn.close()
         return documents
     
+    def remove_documents(self, doc_ids: List[str]) -> int:
+        """
+        Remove documents from the discovery log (source files deleted or edited)
+        
+        Returns:
+            Number of rows removed
+        """
+        if not doc_ids:
+            return 0
+        
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        removed = 0
+        for i in range(0, len(doc_ids), 500):
+            chunk = doc_ids[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(f"DELETE FROM discovery_log WHERE doc_id IN ({placeholders})", chunk)
+            removed += cursor.rowcount
+        
+        conn.commit()
+        conn.close()
+        return removed
+    
+    def update_document_content(self, doc: Dict) -> bool:
+        """
+        Replace a document's text (e.g. once OCR has run on a scan)
+        
+        Triage scores and enhanced metadata on an existing row are kept;
+        unknown documents are added.
+        
+        Returns:
+            True if an existing row was updated
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            UPDATE discovery_log
+            SET content = ?, preview = ?, metadata_json = ?, indexed_date = ?
+            WHERE doc_id = ?
+        """, (
+            doc.get('content'),
+            doc.get('preview'),
+            json.dumps(doc.get('metadata', {})),
+            datetime.now().isoformat(),
+            doc.get('doc_id')
+        ))
+        updated = cursor.rowcount > 0
+        
+        conn.commit()
+        conn.close()
+        
+        if not updated:
+            self.add_document(doc)
+        
+        return updated
+    
     def get_documents_for_investigation(self, topic: str) -> List[str]:
         """
         Get relevant document IDs for investigation topic
@@ -15,6 +15,8 @@ from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from dataclasses import dataclass, asdict
 
+from utils.ingestion import SourceFile, read_source
+
 
 @dataclass
 class MemoryQuery:
@@ -470,14 +472,19 @@ class HierarchicalMemory:
     def ingest_document(self, 
                        doc_path: Path,
                        doc_metadata: Dict[str, Any],
-                       target_tiers: List[int] = None) -> Dict[str, bool]:
+                       target_tiers: List[int] = None,
+                       source: SourceFile = None) -> Dict[str, bool]:
         """
         Ingest document into appropriate tiers
         
+        The file is read at most once: the same bytes give the canonical
+        doc_id and go to the Tier 4 vault.
+        
         Args:
             doc_path: Path to document file
             doc_metadata: Metadata (importance, type, etc.)
             target_tiers: Which tiers to add to (auto-determined if None)
+            source: File already read by the ingestion pipeline
             
         Returns:
             Dict of tier: success status
@@ -485,6 +492,12 @@ class HierarchicalMemory:
         if target_tiers is None:
             target_tiers = self._determine_target_tiers(doc_metadata)
         
+        if source is None and (4 in target_tiers or not doc_metadata.get('doc_id')):
+            source = read_source(doc_path)
+        
+        if source is not None and not doc_metadata.get('doc_id'):
+            doc_metadata = {**doc_metadata, 'doc_id': source.doc_id}
+        
         results = {}
         
         # Tier 1: Only top 100 documents
@@ -502,7 +515,12 @@ class HierarchicalMemory:
         
         # Tier 4: Always store original
         if 4 in target_tiers:
-            results[4] = self.tier4.encrypt_and_store(doc_path, doc_metadata)
+            results[4] = self.tier4.encrypt_and_store(
+                doc_path,
+                doc_metadata=doc_metadata,
+                data=source.data if source is not None else None,
+                content_hash=source.content_hash if source is not None else None
+            )
         
         self.logger.info(f"Ingested {doc_path.name} into tiers: {list(results.keys())}")
         return results
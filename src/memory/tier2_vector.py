@@ -14,6 +14,8 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 import logging
 
+from utils.ingestion import canonical_doc_id, hash_file
+
 try:
     import chromadb
     from chromadb.config import Settings
@@ -108,7 +110,7 @@ class VectorStoreManager:
                 return False
             
             # Generate unique ID
-            doc_id = doc_metadata.get('doc_id', self._generate_doc_id(doc_path, doc_metadata))
+            doc_id = doc_metadata.get('doc_id') or self._generate_doc_id(doc_path, doc_metadata)
             
             # Prepare metadata (ChromaDB requires simple types)
             metadata = {
@@ -244,8 +246,12 @@ class VectorStoreManager:
         return where if where else None
     
     def _generate_doc_id(self, doc_path: Path, doc_metadata: Dict) -> str:
-        """Generate unique document ID"""
-        # Use folder + filename for uniqueness
+        """Generate canonical (content-addressed) document ID"""
+        content_hash = hash_file(doc_path)
+        if content_hash is not None:
+            return canonical_doc_id(content_hash)
+        
+        # Unreadable file - fall back to folder + filename
         unique_str = f"{doc_metadata.get('folder', '')}/{doc_path.name}"
         return hashlib.md5(unique_str.encode()).hexdigest()
     
@@ -266,6 +272,19 @@ class VectorStoreManager:
             self.logger.error(f"Failed to get document {doc_id}: {e}")
             return None
     
+    def remove_documents(self, doc_ids: List[str]) -> bool:
+        """Remove documents from the collection (deleted or changed sources)"""
+        if not doc_ids:
+            return True
+        
+        try:
+            self.collection.delete(ids=list(doc_ids))
+            self.logger.info(f"Removed {len(doc_ids)} documents from vector store")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to remove documents: {e}")
+            return False
+    
     def get_collection_stats(self) -> Dict[str, Any]:
         """Get statistics about the vector store"""
         try:
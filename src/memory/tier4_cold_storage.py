@@ -15,6 +15,9 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 import logging
 
+from utils.archive_reader import open_source, source_exists
+from utils.ingestion import canonical_doc_id
+
 try:
     from cryptography.fernet import Fernet
     ENCRYPTION_AVAILABLE = True
@@ -141,6 +144,8 @@ class ColdStorageManager:
                         file_path: Path = None,
                         doc_path: Path = None,
                         doc_metadata: Dict[str, Any] = None,
+                        data: bytes = None,
+                        content_hash: str = None,
                         **kwargs) -> bool:
         """
         Encrypt document and store in vault
@@ -150,6 +155,9 @@ class ColdStorageManager:
             file_path: Path to original document (new naming)
             doc_path: Path to original document (old naming - deprecated)
             doc_metadata: Document metadata
+            data: Original bytes already read by the ingestion pipeline
+                (the file is only read here if omitted)
+            content_hash: SHA-256 of data, if already computed
             
         Returns:
             True if stored successfully
@@ -157,20 +165,25 @@ class ColdStorageManager:
         # Use whichever parameter was provided
         path = file_path or doc_path
         
-        if not path or not path.exists():
+        if not path or (data is None and not source_exists(path)):
             self.logger.error(f"Document not found: {path}")
             return False
         
         try:
-            # Generate unique doc ID
-            doc_id = self._generate_doc_id(path, doc_metadata or {})
-            
-            # Read original file
-            with open(path, 'rb') as f:
-                original_data = f.read()
+            # Read original file (unless the caller already has the bytes)
+            if data is None:
+                with open_source(path) as f:
+                    original_data = f.read()
+            else:
+                original_data = data
             
             # Calculate original hash
-            original_hash = hashlib.sha256(original_data).hexdigest()
+            if content_hash is None or data is None:
+                content_hash = hashlib.sha256(original_data).hexdigest()
+            original_hash = content_hash
+            
+            # Canonical doc ID (same as loader, vector store and manifest)
+            doc_id = (doc_metadata or {}).get('doc_id') or self._generate_doc_id(original_hash)
             
             # Encrypt data
             if self.cipher:
@@ -426,10 +439,9 @@ class ColdStorageManager:
             ]
         }
     
-    def _generate_doc_id(self, doc_path: Path, doc_metadata: Dict) -> str:
-        """Generate unique document ID"""
-        unique_str = f"{doc_metadata.get('folder', '')}/{doc_path.name}"
-        return hashlib.md5(unique_str.encode()).hexdigest()
+    def _generate_doc_id(self, content_hash: str) -> str:
+        """Generate canonical (content-addressed) document ID"""
+        return canonical_doc_id(content_hash)
     
     def get_status(self) -> Dict[str, Any]:
         """Get Tier 4 status"""
@@ -317,13 +317,36 @@ DON'T RESTATE THESE - FIND THE SMOKING GUN EVIDENCE
             return f"<phase_0_error>{e}</phase_0_error>"
     
     def _format_documents(self, documents: List[Dict], doc_type: str = "DISCLOSURE") -> str:
-        """Format documents for analysis"""
+        """
+        Format documents for analysis
+        
+        Documents from passage retrieval (with 'passages') send only those
+        passages, marked with their character offsets; others send their
+        content up to document_content_per_doc.
+        """
         if not documents:
             return "<no_documents>No documents provided</no_documents>"
         
         formatted = []
         for i, doc in enumerate(documents):
             metadata = doc.get('metadata', {})
+            
+            passages = doc.get('passages')
+            if passages:
+                excerpts = "\n\n".join(
+                    f"[chars {p['start']:,}-{p['end']:,}]\n{p['text'].strip()}" for p in passages
+                )
+                formatted.append(f"""
+[{doc_type}_DOC_{i}]
+Filename: {metadata.get('filename', doc.get('filename', 'unknown'))}
+Date: {metadata.get('date', 'unknown')}
+
+RELEVANT PASSAGES ({len(passages)} from {doc.get('content_chars', 0):,} chars):
+{excerpts}
+[END]
+""")
+                continue
+            
             content_limit = self.config.token_config.get('document_content_per_doc', 15000)
             content = doc.get('content', '')[:content_limit]
             
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Archive Reader for Lismore Litigation Intelligence System
+Streams documents straight out of ZIP productions - nothing is unpacked to disk
+British English throughout
+
+Members are addressed by virtual paths: bundle.zip!/folder/file.pdf, and
+nested archives chain the separator: bundle.zip!/inner.zip!/file.pdf.
+A virtual path behaves like a file path for stat/open/hash, so extraction,
+caching and the manifest treat archive members like any other file.
+
+Location: src/utils/archive_reader.py
+"""
+
+import io
+import os
+import threading
+import zipfile
+from collections import OrderedDict, namedtuple
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Iterable, Iterator, List, Tuple, Union
+
+
+ARCHIVE_FORMATS = {'.zip'}
+
+VIRTUAL_SEPARATOR = '!/'
+
+# Archives inside archives are followed this many levels deep
+MAX_ARCHIVE_DEPTH = 4
+
+# Nested archives are opened in memory (zip needs random access); larger
+# ones are skipped rather than spilled to disk
+MAX_NESTED_ARCHIVE_BYTES = 512 * 1024 * 1024
+
+# Open archives kept per process (central directory parsed once, not per member)
+OPEN_ARCHIVE_CACHE_SIZE = 8
+
+# Same shape as os.stat_result for the fields callers use
+MemberStat = namedtuple('MemberStat', ['st_size', 'st_mtime_ns'])
+
+
+_open_archives = OrderedDict()   # (chain, outer mtime_ns) -> ZipFile
+_open_lock = threading.Lock()
+
+
+def is_virtual_path(file_path: Union[str, Path]) -> bool:
+    """True for a path that points inside an archive"""
+    return VIRTUAL_SEPARATOR in str(file_path).replace('\\', '/')
+
+
+def is_archive(file_path: Union[str, Path]) -> bool:
+    return PurePosixPath(str(file_path)).suffix.lower() in ARCHIVE_FORMATS
+
+
+def virtual_path(archive_path: Union[str, Path], member: str) -> Path:
+    """Virtual path for a member of an archive (or of a nested archive)"""
+    return Path(f"{archive_path}{VIRTUAL_SEPARATOR}{member}")
+
+
+def split_virtual_path(file_path: Union[str, Path]) -> Tuple[Path, List[str]]:
+    """
+    Split a virtual path into the archive on disk and the member chain
+
+    Args:
+        file_path: e.g. D:/bundle.zip!/inner.zip!/a/b.pdf
+
+    Returns:
+        (Path('D:/bundle.zip'), ['inner.zip', 'a/b.pdf'])
+    """
+    parts = str(file_path).replace('\\', '/').split(VIRTUAL_SEPARATOR)
+    # Keep the native form of the on-disk part
+    outer = str(file_path)[:len(parts[0])]
+    return Path(outer), parts[1:]
+
+
+# ============================================================================
+# OPENING ARCHIVES
+# ============================================================================
+
+def _open_chain(outer: Path, chain: Tuple[str, ...]) -> zipfile.ZipFile:
+    """
+    ZipFile for an archive on disk or nested inside one, cached per process
+
+    Raises:
+        OSError / zipfile.BadZipFile / KeyError if the chain cannot be opened
+    """
+    outer_mtime = outer.stat().st_mtime_ns
+    key = (str(outer), chain, outer_mtime)
+
+    with _open_lock:
+        archive = _open_archives.get(key)
+        if archive is not None:
+            _open_archives.move_to_end(key)
+            return archive
+
+    if not chain:
+        archive = zipfile.ZipFile(outer)
+    else:
+        parent = _open_chain(outer, chain[:-1])
+        info = parent.getinfo(chain[-1])
+        if info.file_size > MAX_NESTED_ARCHIVE_BYTES:
+            raise OSError(f"Nested archive too large to open in memory: {chain[-1]}")
+        archive = zipfile.ZipFile(io.BytesIO(parent.read(info)))
+
+    with _open_lock:
+        _open_archives[key] = archive
+        while len(_open_archives) > OPEN_ARCHIVE_CACHE_SIZE:
+            _, evicted = _open_archives.popitem(last=False)
+            try:
+                evicted.close()
+            except Exception:
+                pass
+
+    return archive
+
+
+def _member_info(file_path: Union[str, Path]) -> Tuple[zipfile.ZipFile, zipfile.ZipInfo, Path]:
+    outer, members = split_virtual_path(file_path)
+    archive = _open_chain(outer, tuple(members[:-1]))
+    try:
+        info = archive.getinfo(members[-1])
+    except KeyError:
+        raise FileNotFoundError(f"No such archive member: {file_path}")
+    return archive, info, outer
+
+
+# ============================================================================
+# FILE-LIKE ACCESS (real or virtual paths)
+# ============================================================================
+
+def source_stat(file_path: Union[str, Path]):
+    """
+    stat() that also understands archive members
+
+    A member's size is its uncompressed size; its mtime is that of the
+    archive on disk, so replacing the archive invalidates every member.
+
+    Raises:
+        OSError if the file or member does not exist
+    """
+    if not is_virtual_path(file_path):
+        return os.stat(file_path)
+
+    try:
+        _, info, outer = _member_info(file_path)
+    except (zipfile.BadZipFile, KeyError, RuntimeError) as e:
+        raise OSError(str(e))
+    return MemberStat(st_size=info.file_size, st_mtime_ns=outer.stat().st_mtime_ns)
+
+
+def source_exists(file_path: Union[str, Path]) -> bool:
+    try:
+        source_stat(file_path)
+    except OSError:
+        return False
+    return True
+
+
+def open_source(file_path: Union[str, Path]) -> BinaryIO:
+    """
+    Binary stream over a file or archive member
+
+    Raises:
+        OSError if the file or member cannot be opened
+    """
+    if not is_virtual_path(file_path):
+        return open(file_path, 'rb')
+
+    try:
+        archive, info, _ = _member_info(file_path)
+        return archive.open(info)
+    except (zipfile.BadZipFile, KeyError, RuntimeError) as e:
+        # RuntimeError: encrypted member
+        raise OSError(str(e))
+
+
+# ============================================================================
+# DISCOVERY
+# ============================================================================
+
+def _iter_members(archive: zipfile.ZipFile, prefix: str, supported_formats: Iterable[str],
+                  outer: Path, chain: Tuple[str, ...], depth: int) -> Iterator[Path]:
+    for info in sorted(archive.infolist(), key=lambda i: i.filename):
+        if info.is_dir() or info.flag_bits & 0x1:
+            continue  # directories and encrypted members
+
+        name = info.filename
+        suffix = PurePosixPath(name).suffix.lower()
+
+        if suffix in ARCHIVE_FORMATS:
+            if depth >= MAX_ARCHIVE_DEPTH:
+                print(f"  ⚠️  Archive nesting too deep, skipped: {prefix}{VIRTUAL_SEPARATOR}{name}")
+                continue
+            try:
+                nested = _open_chain(outer, chain + (name,))
+            except (OSError, zipfile.BadZipFile, KeyError) as e:
+                print(f"  ⚠️  Cannot open nested archive {name}: {str(e)[:50]}")
+                continue
+            yield from _iter_members(nested, f"{prefix}{VIRTUAL_SEPARATOR}{name}",
+                                     supported_formats, outer, chain + (name,), depth + 1)
+
+        elif suffix in supported_formats:
+            yield Path(f"{prefix}{VIRTUAL_SEPARATOR}{name}")
+
+
+def iter_archive_members(archive_path: Path, supported_formats: Iterable[str]) -> Iterator[Path]:
+    """
+    Virtual paths of supported documents inside an archive, nested ones included
+
+    Only the central directories are read; no member is decompressed
+    except nested archives, which are opened in memory.
+
+    Args:
+        archive_path: ZIP file on disk
+        supported_formats: Suffixes to yield (e.g. DocumentLoader.SUPPORTED_FORMATS)
+
+    Yields:
+        Virtual member paths in name order
+    """
+    supported = {s.lower() for s in supported_formats} - ARCHIVE_FORMATS
+    try:
+        archive = _open_chain(Path(archive_path), ())
+    except (OSError, zipfile.BadZipFile) as e:
+        print(f"  ⚠️  Cannot open archive {Path(archive_path).name}: {str(e)[:50]}")
+        return
+
+    yield from _iter_members(archive, str(archive_path), supported, Path(archive_path), (), 1)
+
+
+def expand_archives(file_paths: Iterable[Path], supported_formats: Iterable[str]) -> List[Path]:
+    """Replace archives on disk with their member paths, keeping order"""
+    expanded = []
+    for file_path in file_paths:
+        if is_archive(file_path) and not is_virtual_path(file_path):
+            expanded.extend(iter_archive_members(file_path, supported_formats))
+        else:
+            expanded.append(Path(file_path))
+    return expanded
@@ -0,0 +1,586 @@
+#!/usr/bin/env python3
+"""
+Persistent BM25 Index for Lismore Litigation Intelligence System
+Built once from the knowledge graph, opened in milliseconds, updated incrementally
+British English throughout
+
+Location: src/utils/bm25_index.py
+"""
+
+import math
+import re
+import sqlite3
+import zlib
+from array import array
+from collections import Counter, OrderedDict, defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+
+import numpy as np
+
+
+# Bump when tokenisation or the on-disk layout changes - older indexes rebuild
+BM25_INDEX_VERSION = 3
+
+# Rebuild instead of patching once this share of indexed documents is dead
+MAX_TOMBSTONE_RATIO = 0.25
+
+# Decoded postings kept in memory between queries (terms, least recently used dropped)
+POSTINGS_CACHE_TERMS = 4096
+
+_POSTING_DTYPE = np.dtype('<u4')
+
+STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'with', 'was',
+    'this', 'that', 'from', 'have', 'has', 'had', 'been', 'were',
+    'will', 'would', 'could', 'should', 'may', 'might', 'must',
+    'can', 'shall', 'his', 'her', 'their', 'our', 'your', 'its',
+    'who', 'what', 'where', 'when', 'why', 'how', 'which', 'whom',
+    'said', 'did', 'does', 'done', 'being', 'able', 'about', 'above',
+    'after', 'all', 'also', 'any', 'because', 'before', 'between',
+    'both', 'during', 'each', 'few', 'into', 'more', 'most', 'other',
+    'out', 'over', 'same', 'some', 'such', 'than', 'then', 'there',
+    'these', 'those', 'through', 'under', 'until', 'very', 'while'
+})
+
+_TOKEN = re.compile(r'\b[a-z0-9]{3,}\b')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric terms of 3+ characters, stop words removed"""
+    return [w for w in _TOKEN.findall((text or '').lower()) if w not in STOP_WORDS]
+
+
+def _encode_postings(ordinals, tfs) -> bytes:
+    """Postings blob (one CSR row): all ordinals then all term frequencies, uint32"""
+    return (np.asarray(ordinals, dtype=_POSTING_DTYPE).tobytes()
+            + np.asarray(tfs, dtype=_POSTING_DTYPE).tobytes())
+
+
+def _decode_postings(blob: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """Zero-copy views of a postings blob: (ordinals, term frequencies)"""
+    values = np.frombuffer(blob, dtype=_POSTING_DTYPE)
+    half = len(values) // 2
+    return values[:half], values[half:]
+
+
+class BM25Index:
+    """
+    BM25 inverted index persisted in SQLite
+
+    Purpose:
+        - Pass 3, chat and the orchestrator each read every discovery_log
+          row and rebuilt a dict-of-dicts index on every process start
+
+    Strategy:
+        - Documents get dense ordinals; postings per term are one blob of
+          ordinals and term frequencies, sorted by ordinal
+        - Opening reads only the document table (ordinals, lengths);
+          postings are read per query term
+        - Scoring is vectorised: each term's postings are NumPy arrays,
+          document lengths are pre-folded into a dense normaliser array,
+          scores accumulate in a dense buffer and np.argpartition picks
+          the top k
+        - Each term stores its largest tf and shortest document, giving a
+          score upper bound; MaxScore uses the bounds to stop scoring
+          documents that cannot reach the top k (long Pass 3 topics)
+        - sync() compares the knowledge graph's signature (row count,
+          latest indexed_date) with the one recorded at the last sync and
+          indexes only new or changed documents
+        - Changed or removed documents are tombstoned; past
+          MAX_TOMBSTONE_RATIO the index is rebuilt
+        - format version recorded in the index: a tokeniser or layout
+          change forces a rebuild rather than mixing formats
+        - The indexed unit is a span of a document (start/end offsets);
+          here one span per document, PassageIndex indexes several
+    """
+
+    def __init__(self, db_path: Path, k1: float = 1.5, b: float = 0.75):
+        """
+        Open (or create) an index
+
+        Args:
+            db_path: SQLite database location
+            k1: Term frequency saturation
+            b: Length normalisation
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.k1 = k1
+        self.b = b
+        self._postings_cache: "OrderedDict[str, Tuple[np.ndarray, np.ndarray, int, int]]" = OrderedDict()
+
+        self.conn = sqlite3.connect(self.db_path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_database()
+        self._load_documents()
+
+    @property
+    def format_version(self) -> str:
+        """Layout identifier recorded in the index (mismatch = rebuild)"""
+        return str(BM25_INDEX_VERSION)
+
+    def _segment(self, text: str) -> List[Tuple[int, int, str]]:
+        """Spans of a document to index as separate units: [(start, end, text)]"""
+        return [(0, len(text), text)]
+
+    def _init_database(self):
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        """)
+
+        version = self._get_meta('format_version')
+        if version is not None and version != self.format_version:
+            # Older layout: dropped here, rebuilt by the next sync()
+            self.conn.execute("DROP TABLE IF EXISTS docs")
+            self.conn.execute("DROP TABLE IF EXISTS terms")
+
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS docs (
+                ordinal INTEGER PRIMARY KEY,
+                doc_id TEXT NOT NULL,
+                start_offset INTEGER NOT NULL,
+                end_offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                fingerprint INTEGER NOT NULL,
+                live INTEGER NOT NULL DEFAULT 1
+            )
+        """)
+
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS terms (
+                term TEXT PRIMARY KEY,
+                df INTEGER NOT NULL,
+                max_tf INTEGER NOT NULL,
+                min_len INTEGER NOT NULL,
+                postings BLOB NOT NULL
+            )
+        """)
+
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_docs_doc_id ON docs(doc_id)")
+        self.conn.commit()
+
+    def _load_documents(self):
+        """Document table into memory (ordinal-indexed arrays)"""
+        self.doc_ids: List[str] = []
+        self.ordinals_of: Dict[str, List[int]] = {}
+        self.fingerprints: Dict[str, int] = {}
+        self._postings_cache.clear()
+        spans = []
+        lengths = []
+        live_flags = []
+
+        for ordinal, doc_id, start, end, length, fingerprint, live in self.conn.execute(
+            "SELECT ordinal, doc_id, start_offset, end_offset, length, fingerprint, live "
+            "FROM docs ORDER BY ordinal"
+        ):
+            while len(self.doc_ids) < ordinal:   # ordinals are dense; guard anyway
+                self.doc_ids.append('')
+                spans.append((0, 0))
+                lengths.append(0)
+                live_flags.append(False)
+            self.doc_ids.append(doc_id)
+            spans.append((start, end))
+            lengths.append(length)
+            live_flags.append(bool(live))
+            if live:
+                self.ordinals_of.setdefault(doc_id, []).append(ordinal)
+                self.fingerprints[doc_id] = fingerprint
+
+        self.spans = np.array(spans, dtype=np.int64).reshape(-1, 2)
+        self.lengths = np.array(lengths, dtype=np.float64)
+        self.live = np.array(live_flags, dtype=bool)
+        self._refresh_collection_stats()
+
+    def _refresh_collection_stats(self):
+        self.N = int(np.count_nonzero(self.live))
+        self.avgdl = float(self.lengths[self.live].mean()) if self.N else 0.0
+        # BM25 denominator term k1 * (1 - b + b * |D| / avgdl), per ordinal
+        self.length_norm = self.k1 * (1 - self.b + self.b * self.lengths / (self.avgdl or 1.0))
+        self._has_tombstones = self.N < len(self.doc_ids)
+
+    # ========================================================================
+    # METADATA / STALENESS
+    # ========================================================================
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    @staticmethod
+    def source_signature(knowledge_graph) -> str:
+        """Row count and latest indexed_date of the discovery log"""
+        conn = knowledge_graph._get_connection()
+        try:
+            count, latest = conn.execute(
+                "SELECT COUNT(*), MAX(indexed_date) FROM discovery_log"
+            ).fetchone()
+        finally:
+            conn.close()
+        return f"{count}|{latest or ''}"
+
+    @staticmethod
+    def _latest_date(signature: str) -> str:
+        return signature.split('|', 1)[1]
+
+    def is_stale(self, knowledge_graph) -> bool:
+        """True if the index predates this format or the knowledge graph changed"""
+        if self._get_meta('format_version') != self.format_version:
+            return True
+        return self._get_meta('source_signature') != self.source_signature(knowledge_graph)
+
+    # ========================================================================
+    # BUILD / UPDATE
+    # ========================================================================
+
+    def sync(self, knowledge_graph) -> Dict:
+        """
+        Bring the index up to date with the knowledge graph
+
+        Returns:
+            {'action': 'current' | 'updated' | 'rebuilt', 'added': n, 'removed': n}
+        """
+        if self._get_meta('format_version') != self.format_version:
+            return self.rebuild(knowledge_graph)
+
+        signature = self.source_signature(knowledge_graph)
+        if self._get_meta('source_signature') == signature:
+            return {'action': 'current', 'added': 0, 'removed': 0}
+
+        since = self._get_meta('last_indexed_date') or ''
+        conn = knowledge_graph._get_connection()
+        try:
+            current_ids = {row[0] for row in conn.execute("SELECT doc_id FROM discovery_log")}
+            unseen = current_ids - set(self.ordinals_of)
+            removed = set(self.ordinals_of) - current_ids
+
+            candidates = {}
+            for doc_id, content, preview, indexed_date in conn.execute("""
+                SELECT doc_id, content, preview, indexed_date FROM discovery_log
+                WHERE indexed_date > ? OR indexed_date IS NULL
+            """, (since,)):
+                candidates[doc_id] = content or preview or ''
+            missing = [doc_id for doc_id in unseen if doc_id not in candidates]
+            for i in range(0, len(missing), 500):
+                chunk = missing[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                for doc_id, content, preview in conn.execute(f"""
+                    SELECT doc_id, content, preview FROM discovery_log WHERE doc_id IN ({placeholders})
+                """, chunk):
+                    candidates[doc_id] = content or preview or ''
+        finally:
+            conn.close()
+
+        changed = {
+            doc_id: text for doc_id, text in candidates.items()
+            if self.fingerprints.get(doc_id) != zlib.crc32(text.encode('utf-8'))
+        }
+
+        stale = list(removed) + [doc_id for doc_id in changed if doc_id in self.ordinals_of]
+        dead = len(self.doc_ids) - self.N + sum(len(self.ordinals_of[doc_id]) for doc_id in stale)
+        if self.doc_ids and dead / len(self.doc_ids) > MAX_TOMBSTONE_RATIO:
+            return self.rebuild(knowledge_graph)
+
+        self._tombstone(stale)
+        self._add_documents(changed.items())
+        self._record_sync(signature)
+        return {'action': 'updated', 'added': len(changed), 'removed': len(removed)}
+
+    def rebuild(self, knowledge_graph) -> Dict:
+        """Index every document in the knowledge graph from scratch"""
+        signature = self.source_signature(knowledge_graph)
+
+        self.conn.execute("DELETE FROM docs")
+        self.conn.execute("DELETE FROM terms")
+        self._load_documents()
+
+        conn = knowledge_graph._get_connection()
+        try:
+            documents = (
+                (doc_id, content or preview or '')
+                for doc_id, content, preview in conn.execute(
+                    "SELECT doc_id, content, preview FROM discovery_log ORDER BY doc_id"
+                )
+            )
+            added = self._add_documents(documents)
+        finally:
+            conn.close()
+
+        self._set_meta('format_version', self.format_version)
+        self._record_sync(signature)
+        return {'action': 'rebuilt', 'added': added, 'removed': 0}
+
+    def _record_sync(self, signature: str):
+        # Taken before reading documents: anything written meanwhile is newer
+        # and is picked up (or skipped by fingerprint) on the next sync
+        self._set_meta('source_signature', signature)
+        self._set_meta('last_indexed_date', self._latest_date(signature))
+        self._set_meta('synced_date', datetime.now().isoformat())
+        self.conn.commit()
+
+    def _tombstone(self, doc_ids: List[str]):
+        for doc_id in doc_ids:
+            ordinals = self.ordinals_of.pop(doc_id, None)
+            if ordinals is None:
+                continue
+            self.fingerprints.pop(doc_id, None)
+            self.live[ordinals] = False
+            self.conn.executemany("UPDATE docs SET live = 0 WHERE ordinal = ?", [(o,) for o in ordinals])
+        self._refresh_collection_stats()
+
+    def _add_documents(self, documents) -> int:
+        """
+        Append documents with new ordinals and merge their postings
+
+        Args:
+            documents: Iterable of (doc_id, text)
+
+        Returns:
+            Number of documents added
+        """
+        new_postings: Dict[str, Tuple[array, array]] = defaultdict(lambda: (array('I'), array('I')))
+        rows = []
+        spans = []
+        lengths = []
+        added = 0
+
+        for doc_id, text in documents:
+            fingerprint = zlib.crc32(text.encode('utf-8'))
+            self.fingerprints[doc_id] = fingerprint
+            self.ordinals_of[doc_id] = []
+            added += 1
+
+            for start, end, span_text in (self._segment(text) or [(0, len(text), text)]):
+                terms = tokenize(span_text)
+                ordinal = len(self.doc_ids)
+
+                self.doc_ids.append(doc_id)
+                self.ordinals_of[doc_id].append(ordinal)
+                spans.append((start, end))
+                lengths.append(len(terms))
+                rows.append((ordinal, doc_id, start, end, len(terms), fingerprint))
+
+                for term, tf in Counter(terms).items():
+                    ordinals, tfs = new_postings[term]
+                    ordinals.append(ordinal)
+                    tfs.append(tf)
+
+        if not rows:
+            return 0
+
+        self.conn.executemany(
+            "INSERT INTO docs (ordinal, doc_id, start_offset, end_offset, length, fingerprint, live) "
+            "VALUES (?, ?, ?, ?, ?, ?, 1)", rows
+        )
+
+        self.spans = np.concatenate([self.spans, np.array(spans, dtype=np.int64).reshape(-1, 2)])
+        self.lengths = np.concatenate([self.lengths, np.array(lengths, dtype=np.float64)])
+
+        # New ordinals are larger than any existing one, so appending keeps postings sorted.
+        # max_tf / min_len only ever widen, so they stay valid bounds for pruning
+        for term, (ordinals, tfs) in new_postings.items():
+            max_tf = max(tfs)
+            min_len = int(self.lengths[np.asarray(ordinals, dtype=np.int64)].min())
+            row = self.conn.execute(
+                "SELECT max_tf, min_len, postings FROM terms WHERE term = ?", (term,)
+            ).fetchone()
+            if row is not None:
+                old_ordinals, old_tfs = _decode_postings(row[2])
+                ordinals = np.concatenate([old_ordinals, np.asarray(ordinals, dtype=_POSTING_DTYPE)])
+                tfs = np.concatenate([old_tfs, np.asarray(tfs, dtype=_POSTING_DTYPE)])
+                max_tf = max(max_tf, row[0])
+                min_len = min(min_len, row[1])
+            self._postings_cache.pop(term, None)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO terms (term, df, max_tf, min_len, postings) VALUES (?, ?, ?, ?, ?)",
+                (term, len(ordinals), max_tf, min_len, _encode_postings(ordinals, tfs))
+            )
+
+        self.conn.commit()
+        self.live = np.concatenate([self.live, np.ones(len(lengths), dtype=bool)])
+        self._refresh_collection_stats()
+        return added
+
+    # ========================================================================
+    # SEARCH
+    # ========================================================================
+
+    def _postings(self, term: str) -> Optional[Tuple[np.ndarray, np.ndarray, int, int]]:
+        """Postings for a term (ordinals, tfs, max_tf, min_len), tombstones included"""
+        postings = self._postings_cache.get(term)
+        if postings is not None:
+            self._postings_cache.move_to_end(term)
+            return postings
+
+        row = self.conn.execute(
+            "SELECT postings, max_tf, min_len FROM terms WHERE term = ?", (term,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        postings = _decode_postings(row[0]) + (row[1], row[2])
+        self._postings_cache[term] = postings
+        if len(self._postings_cache) > POSTINGS_CACHE_TERMS:
+            self._postings_cache.popitem(last=False)
+        return postings
+
+    def search(self, query: str, top_k: int = 20) -> List[Tuple[str, float]]:
+        """
+        BM25 ranking
+
+        score(D,Q) = sum IDF(qi) * f(qi,D) * (k1 + 1) / (f(qi,D) + k1 * (1 - b + b * |D| / avgdl))
+
+        Args:
+            query: Natural-language query
+            top_k: Results to return
+
+        Returns:
+            [(doc_id, score), ...] best first
+        """
+        return [(self.doc_ids[ordinal], score) for ordinal, score in self.rank(query, top_k)]
+
+    def rank(self, query: str, top_k: int = 20,
+             doc_ids: Optional[List[str]] = None) -> List[Tuple[int, float]]:
+        """
+        Top-k indexed units for a query
+
+        Args:
+            query: Natural-language query
+            top_k: Results to return
+            doc_ids: Only rank units of these documents (None = all)
+
+        Returns:
+            [(ordinal, score), ...] best first
+        """
+        if not self.N:
+            return []
+
+        candidates = None
+        if doc_ids is not None:
+            candidates = np.array(sorted(
+                ordinal for doc_id in doc_ids for ordinal in self.ordinals_of.get(doc_id, [])
+            ), dtype=np.int64)
+            if not len(candidates):
+                return []
+
+        query_terms = tokenize(query)
+        if not query_terms:
+            return []
+
+        # Per-term weight and score upper bound. The bound uses the largest tf
+        # and the shortest document in the postings: the BM25 term score rises
+        # with tf and falls with length, so no posting can exceed it
+        avgdl = self.avgdl or 1.0
+        query = []
+        for term, query_tf in Counter(query_terms).items():   # repeated terms count per occurrence
+            postings = self._postings(term)
+            if postings is None:
+                continue
+            ordinals, tfs, max_tf, min_len = postings
+
+            df = int(np.count_nonzero(self.live[ordinals])) if self._has_tombstones else len(ordinals)
+            if not df:
+                continue
+            weight = query_tf * math.log((self.N - df + 0.5) / (df + 0.5) + 1.0) * (self.k1 + 1)
+            bound = weight * max_tf / (max_tf + self.k1 * (1 - self.b + self.b * min_len / avgdl))
+            query.append((bound * (1 + 1e-9), weight, ordinals, tfs))
+
+        if not query:
+            return []
+
+        return self._top_k(self._max_score(query, top_k, candidates), top_k)
+
+    def _max_score(self, query: List[Tuple], top_k: int,
+                   candidates: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Accumulate BM25 scores with MaxScore pruning
+
+        Terms are scored in descending order of upper bound. θ is the k-th
+        best score so far; once the bounds of the terms still to come sum
+        below θ, a document not yet matched cannot reach the top k. From
+        then on only candidates (score + remaining bound >= θ) are scored,
+        looked up in the sorted postings with np.searchsorted, and the
+        candidate set shrinks as θ rises and the remaining bound falls.
+
+        Args:
+            query: [(upper_bound, weight, ordinals, tfs), ...]
+            top_k: Results wanted
+            candidates: Sorted live ordinals to restrict scoring to (None = all)
+
+        Returns:
+            Dense score buffer; exact for every document that can be in the top k
+        """
+        query.sort(key=lambda t: t[0], reverse=True)
+        remaining = sum(t[0] for t in query)
+        scores = np.zeros(len(self.doc_ids))
+
+        for bound, weight, ordinals, tfs in query:
+            remaining -= bound
+
+            if candidates is None:
+                # Essential term: every live posting is scored
+                if self._has_tombstones:
+                    keep = self.live[ordinals]
+                    ordinals, tfs = ordinals[keep], tfs[keep]
+                tfs = tfs.astype(np.float64)
+                scores[ordinals] += weight * tfs / (tfs + self.length_norm[ordinals])
+
+                theta = self._kth_score(scores, top_k)
+                if theta > 0 and remaining < theta:
+                    candidates = np.flatnonzero(scores + remaining >= theta)
+                continue
+
+            # Non-essential term: candidates only (all live - they matched a live posting)
+            positions = np.searchsorted(ordinals, candidates)
+            positions[positions == len(ordinals)] = 0
+            hit = ordinals[positions] == candidates
+            matched = candidates[hit]
+            if len(matched):
+                tf = tfs[positions[hit]].astype(np.float64)
+                scores[matched] += weight * tf / (tf + self.length_norm[matched])
+
+            theta = self._kth_score(scores[candidates], top_k)
+            candidates = candidates[scores[candidates] + remaining >= theta]
+
+        return scores
+
+    @staticmethod
+    def _kth_score(scores: np.ndarray, k: int) -> float:
+        """k-th highest positive score (0 while fewer than k documents matched)"""
+        positive = scores[scores > 0]
+        if len(positive) < k:
+            return 0.0
+        return float(np.partition(positive, len(positive) - k)[len(positive) - k])
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, top_k: int) -> List[Tuple[int, float]]:
+        """Highest-scoring ordinals from a dense score buffer, best first"""
+        matched = np.flatnonzero(scores)
+        if len(matched) > top_k:
+            matched = matched[np.argpartition(scores[matched], -top_k)[-top_k:]]
+        ranked = matched[np.argsort(-scores[matched], kind='stable')]
+        return [(int(ordinal), float(scores[ordinal])) for ordinal in ranked]
+
+    def get_statistics(self) -> Dict:
+        terms = self.conn.execute("SELECT COUNT(*) FROM terms").fetchone()[0]
+        return {
+            'total_documents': len(self.ordinals_of),
+            'indexed_units': self.N,
+            'total_terms': terms,
+            'average_doc_length': round(self.avgdl, 1),
+            'tombstones': len(self.doc_ids) - self.N,
+            'index_size_mb': round(self.db_path.stat().st_size / (1024 * 1024), 2) if self.db_path.exists() else 0,
+            'format_version': self._get_meta('format_version'),
+            'synced_date': self._get_meta('synced_date')
+        }
+
+    def close(self):
+        self.conn.close()
@@ -14,8 +14,12 @@ class DocumentChunker:
     
     def __init__(self, config):
         self.config = config
-        self.max_tokens = config.token_config['max_input_tokens']
-        self.optimal_chunk_size = config.token_config['optimal_batch_size']
+        token_config = config.token_config
+        self.max_tokens = token_config.get(
+            'max_input_tokens',
+            token_config['max_context_tokens'] - token_config['context_buffer']
+        )
+        self.optimal_chunk_size = token_config.get('optimal_batch_size', self.max_tokens // 2)
     
     def chunk_by_semantic_boundaries(self,
                                     text: str,
@@ -23,6 +27,10 @@ class DocumentChunker:
         """
         Chunk text preserving semantic boundaries
         Returns list of chunk dictionaries with metadata
+        
+        Each chunk records start_char / end_char: text[start_char:end_char]
+        is the span of the original text it covers (headers included), so
+        chunks can be keyed back to their document.
         """
         
         max_chunk_tokens = max_chunk_tokens or self.optimal_chunk_size
@@ -31,28 +39,45 @@ class DocumentChunker:
         chunks = []
         
         # Split by major sections first
-        sections = self._split_by_sections(text)
+        sections = self._section_spans(text)
         
         current_chunk = {
             'content': '',
             'char_count': 0,
             'token_estimate': 0,
             'chunk_index': 0,
-            'section_boundaries': []
+            'section_boundaries': [],
+            'start_char': None,
+            'end_char': None
         }
         
-        for section_title, section_content in sections:
+        for section_title, span_start, content_start, content_end in sections:
+            section_content = text[content_start:content_end]
             section_chars = len(section_content)
             
-            # If single section exceeds limit, split further
+            # If single section exceeds limit, split further (in document order)
             if section_chars > max_chunk_chars:
+                if current_chunk['content']:
+                    chunks.append(current_chunk)
+                    current_chunk = {
+                        'content': '',
+                        'char_count': 0,
+                        'token_estimate': 0,
+                        'chunk_index': 0,
+                        'section_boundaries': [],
+                        'start_char': None,
+                        'end_char': None
+                    }
+                
                 sub_chunks = self._split_large_section(
                     section_content,
                     max_chunk_chars,
-                    section_title
+                    section_title,
+                    offset=content_start
                 )
                 
                 for sub_chunk in sub_chunks:
+                    sub_chunk['chunk_index'] = len(chunks)
                     chunks.append(sub_chunk)
             
             # If adding section exceeds limit, start new chunk
@@ -65,7 +90,9 @@ class DocumentChunker:
                     'char_count': section_chars,
                     'token_estimate': section_chars // 4,
                     'chunk_index': len(chunks),
-                    'section_boundaries': [section_title] if section_title else []
+                    'section_boundaries': [section_title] if section_title else [],
+                    'start_char': span_start,
+                    'end_char': content_end
                 }
             
             # Add to current chunk
@@ -73,6 +100,10 @@ class DocumentChunker:
                 current_chunk['content'] += '\n\n' + section_content
                 current_chunk['char_count'] += section_chars
                 current_chunk['token_estimate'] = current_chunk['char_count'] // 4
+                current_chunk['chunk_index'] = len(chunks)
+                if current_chunk['start_char'] is None:
+                    current_chunk['start_char'] = span_start
+                current_chunk['end_char'] = content_end
                 if section_title:
                     current_chunk['section_boundaries'].append(section_title)
         
@@ -229,6 +260,19 @@ class DocumentChunker:
     
     def _split_by_sections(self, text: str) -> List[Tuple[str, str]]:
         """Split text into sections based on headers/structure"""
+        return [
+            (title, text[content_start:content_end])
+            for title, _, content_start, content_end in self._section_spans(text)
+        ]
+    
+    def _section_spans(self, text: str) -> List[Tuple[Optional[str], int, int, int]]:
+        """
+        Sections as character offsets into text
+        
+        Returns:
+            [(title, span_start, content_start, content_end), ...] where
+            span_start is the header line (or content_start if none)
+        """
         
         sections = []
         
@@ -241,52 +285,82 @@ class DocumentChunker:
             r'^={3,}(.+?)={3,}$'  # Delimited sections
         ]
         
-        lines = text.split('\n')
-        current_section = []
         current_title = None
-        
-        for line in lines:
+        header_start = None
+        content_start = None
+        content_end = None
+        offset = 0
+        
+        for line in text.split('\n'):
+            line_start = offset
+            offset += len(line) + 1
+            
             # Check if line is section header
             is_header = False
             for pattern in section_patterns:
                 match = re.match(pattern, line)
                 if match:
                     # Save previous section
-                    if current_section:
+                    if content_start is not None:
                         sections.append((
                             current_title,
-                            '\n'.join(current_section)
+                            header_start if header_start is not None else content_start,
+                            content_start,
+                            content_end
                         ))
                     
                     # Start new section
                     current_title = match.group(1) if match.lastindex else line
-                    current_section = []
+                    header_start = line_start
+                    content_start = None
                     is_header = True
                     break
             
             if not is_header:
-                current_section.append(line)
+                if content_start is None:
+                    content_start = line_start
+                content_end = line_start + len(line)
         
         # Add final section
-        if current_section:
-            sections.append((current_title, '\n'.join(current_section)))
+        if content_start is not None:
+            sections.append((
+                current_title,
+                header_start if header_start is not None else content_start,
+                content_start,
+                content_end
+            ))
         
         # If no sections found, return whole text
         if not sections:
-            sections = [(None, text)]
+            sections = [(None, 0, 0, len(text))]
         
         return sections
     
     def _split_large_section(self,
                            text: str,
                            max_chars: int,
-                           section_title: str = None) -> List[Dict]:
-        """Split large section into smaller chunks"""
+                           section_title: str = None,
+                           offset: int = 0) -> List[Dict]:
+        """
+        Split large section into smaller chunks
+        
+        Paragraphs first; a paragraph still over the limit (extracted PDF
+        text often has no blank lines) is cut at line, sentence or word
+        boundaries. start_char / end_char are offset into the full text.
+        """
         
         chunks = []
         
         # Try to split by paragraphs
-        paragraphs = text.split('\n\n')
+        paragraphs = []
+        position = 0
+        for para in text.split('\n\n'):
+            start, end = position, position + len(para)
+            position = end + 2
+            if end - start > max_chars:
+                paragraphs.extend(self._split_span(text, start, end, max_chars))
+            else:
+                paragraphs.append((start, end))
         
         current_chunk = {
             'content': '',
@@ -294,30 +368,34 @@ class DocumentChunker:
             'token_estimate': 0,
             'chunk_index': len(chunks),
             'section_boundaries': [section_title] if section_title else [],
-            'is_continuation': False
+            'is_continuation': False,
+            'start_char': None,
+            'end_char': None
         }
         
-        for para in paragraphs:
-            para_chars = len(para)
+        for start, end in paragraphs:
+            para_chars = end - start
             
             if current_chunk['char_count'] + para_chars > max_chars:
                 if current_chunk['content']:
                     chunks.append(current_chunk)
                 
                 current_chunk = {
-                    'content': para,
+                    'content': text[start:end],
                     'char_count': para_chars,
                     'token_estimate': para_chars // 4,
                     'chunk_index': len(chunks),
                     'section_boundaries': [],
-                    'is_continuation': True
+                    'is_continuation': True,
+                    'start_char': offset + start,
+                    'end_char': offset + end
                 }
             else:
-                if current_chunk['content']:
-                    current_chunk['content'] += '\n\n' + para
-                else:
-                    current_chunk['content'] = para
-                current_chunk['char_count'] += para_chars
+                if current_chunk['start_char'] is None:
+                    current_chunk['start_char'] = offset + start
+                current_chunk['end_char'] = offset + end
+                current_chunk['content'] = text[current_chunk['start_char'] - offset:end]
+                current_chunk['char_count'] = len(current_chunk['content'])
                 current_chunk['token_estimate'] = current_chunk['char_count'] // 4
         
         if current_chunk['content']:
@@ -325,6 +403,24 @@ class DocumentChunker:
         
         return chunks
     
+    def _split_span(self, text: str, start: int, end: int, max_chars: int) -> List[Tuple[int, int]]:
+        """Cut text[start:end] into pieces of at most max_chars at the latest line, sentence or word break"""
+        pieces = []
+        
+        while end - start > max_chars:
+            window_end = start + max_chars
+            cut = window_end
+            for separator in ('\n', '. ', ' '):
+                position = text.rfind(separator, start + max_chars // 2, window_end)
+                if position != -1:
+                    cut = position + len(separator)
+                    break
+            pieces.append((start, cut))
+            start = cut
+        
+        pieces.append((start, end))
+        return pieces
+    
     def _score_relevance(self, document: Dict, focus: str) -> float:
         """Score document relevance to investigation focus"""
         
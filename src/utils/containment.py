@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Containment Detection for Lismore Litigation Intelligence System
+Finds documents that sit inside larger ones (exhibits in bundles, emails in chains)
+British English throughout
+
+Location: src/utils/containment.py
+"""
+
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+_MASK = np.uint64((1 << 32) - 1)
+
+
+def winnow_fingerprints(text: str, kgram: int = 8, window: int = 4) -> Set[int]:
+    """
+    Winnowing fingerprints of a text (Schleimer, Wilkerson & Aiken)
+
+    Word k-grams are hashed and the minimum hash of every window of
+    consecutive k-grams is kept. Any passage shared by two texts that is
+    at least kgram + window - 1 words long yields a shared fingerprint,
+    whatever surrounds it, so the fingerprints of an exhibit survive
+    inside a bundle.
+
+    Args:
+        text: Document text
+        kgram: Words per k-gram
+        window: K-grams per winnowing window
+
+    Returns:
+        Set of 32-bit fingerprints (empty for texts shorter than one k-gram)
+    """
+    tokens = re.findall(r'\w+', text.lower())
+    if len(tokens) < kgram:
+        return set()
+
+    token_hashes = np.fromiter((zlib.crc32(t.encode('utf-8')) for t in tokens),
+                               dtype=np.uint64, count=len(tokens))
+    count = len(tokens) - kgram + 1
+
+    hashes = np.zeros(count, dtype=np.uint64)
+    for offset in range(kgram):
+        hashes = hashes * np.uint64(1000003) ^ token_hashes[offset:offset + count]
+    hashes &= _MASK
+
+    if count <= window:
+        return {int(hashes.min())}
+
+    windows = np.lib.stride_tricks.sliding_window_view(hashes, window)
+    positions = np.unique(windows.argmin(axis=1) + np.arange(len(windows)))
+    return set(hashes[positions].tolist())
+
+
+class ContainmentIndex:
+    """
+    Inverted index of winnowing fingerprints for containment checks
+
+    Purpose:
+        - The prefix hash only catches copies that start the same way;
+          an exhibit inside a hearing bundle or an email quoted in a
+          longer chain was analysed (and paid for) twice
+
+    Strategy:
+        - containment(A in B) = |F(A) & F(B)| / |F(A)|
+        - A is contained in B when that reaches the threshold and B is
+          the larger document
+        - Fingerprints shared by more than max_postings documents are
+          boilerplate (disclaimers, letterheads) and stop counting
+        - Each contained document keeps its best container
+    """
+
+    def __init__(self,
+                 threshold: float = 0.8,
+                 kgram: int = 8,
+                 window: int = 4,
+                 min_fingerprints: int = 20,
+                 max_postings: int = 50):
+        """
+        Initialise containment index
+
+        Args:
+            threshold: Fraction of the smaller document's fingerprints found in the larger
+            kgram: Words per k-gram
+            window: Winnowing window
+            min_fingerprints: Documents with fewer are too short to judge
+            max_postings: Fingerprints in more documents than this are ignored
+        """
+        self.threshold = threshold
+        self.kgram = kgram
+        self.window = window
+        self.min_fingerprints = min_fingerprints
+        self.max_postings = max_postings
+
+        self.postings: Dict[int, List[str]] = defaultdict(list)
+        self.sizes: Dict[str, int] = {}
+        self.contained_in: Dict[str, Tuple[str, float]] = {}   # doc_id -> (container, score)
+
+    def add(self, doc_id: str, text: str) -> List[Tuple[str, str, float]]:
+        """
+        Index a document and find containment with those already indexed
+
+        Args:
+            doc_id: Document identifier
+            text: Full text
+
+        Returns:
+            New relationships as (contained_id, container_id, containment)
+        """
+        if doc_id in self.sizes:
+            return []
+
+        fingerprints = winnow_fingerprints(text, self.kgram, self.window)
+        if len(fingerprints) < self.min_fingerprints:
+            return []
+
+        shared: Dict[str, int] = defaultdict(int)
+        for fingerprint in fingerprints:
+            holders = self.postings.get(fingerprint)
+            if holders is None or len(holders) > self.max_postings:
+                continue
+            for other in holders:
+                shared[other] += 1
+
+        size = len(fingerprints)
+        found = []
+        for other, overlap in shared.items():
+            other_size = self.sizes[other]
+            if size <= other_size and overlap / size >= self.threshold:
+                found.append(self._record(doc_id, other, overlap / size))
+            elif other_size < size and overlap / other_size >= self.threshold:
+                found.append(self._record(other, doc_id, overlap / other_size))
+
+        for fingerprint in fingerprints:
+            holders = self.postings[fingerprint]
+            if len(holders) <= self.max_postings:
+                holders.append(doc_id)
+        self.sizes[doc_id] = size
+
+        return [relationship for relationship in found if relationship is not None]
+
+    def _record(self, contained: str, container: str, score: float) -> Optional[Tuple[str, str, float]]:
+        current = self.contained_in.get(contained)
+        if current is not None and current[1] >= score:
+            return None
+        self.contained_in[contained] = (container, score)
+        return contained, container, round(score, 3)
+
+    def container_of(self, doc_id: str) -> Optional[str]:
+        """Outermost document containing doc_id (follows chains A in B in C)"""
+        seen = {doc_id}
+        current = self.contained_in.get(doc_id)
+        container = None
+        while current is not None and current[0] not in seen:
+            container = current[0]
+            seen.add(container)
+            current = self.contained_in.get(container)
+        return container
+
+    def get_statistics(self) -> Dict:
+        return {
+            'documents_indexed': len(self.sizes),
+            'contained_documents': len(self.contained_in),
+            'fingerprints': len(self.postings)
+        }
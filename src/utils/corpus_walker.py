@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Corpus Walker for Lismore Litigation Intelligence System
+Parallel os.scandir discovery shared by the loader, manifest and disk tooling
+British English throughout
+
+Location: src/utils/corpus_walker.py
+"""
+
+import os
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+FileRecord = namedtuple('FileRecord', ['path', 'size', 'mtime_ns'])
+
+# Directory listings are I/O bound (network / synced drives), so more
+# threads than cores pays off
+DEFAULT_WALK_WORKERS = 8
+
+
+def _scan_directory(directory: str, extensions: Optional[frozenset]) -> Tuple[List[FileRecord], List[str]]:
+    """
+    List one directory
+
+    The extension filter runs on the name before any stat, and the stat
+    comes from the DirEntry (free on Windows, one lstat elsewhere).
+
+    Returns:
+        (file records, subdirectory paths)
+    """
+    files = []
+    subdirs = []
+
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    if extensions is not None and os.path.splitext(entry.name)[1].lower() not in extensions:
+                        continue
+                    stat = entry.stat(follow_symlinks=False)
+                    files.append(FileRecord(Path(entry.path), stat.st_size, stat.st_mtime_ns))
+                except OSError:
+                    continue
+    except OSError:
+        # PermissionError, FileNotFoundError, vanished sync placeholders
+        pass
+
+    return files, subdirs
+
+
+def iter_files(roots: Iterable[Path], extensions: Optional[Iterable[str]] = None,
+               max_workers: int = DEFAULT_WALK_WORKERS) -> Iterator[FileRecord]:
+    """
+    Walk directory trees on several threads, yielding files as found
+
+    Order is not deterministic - use walk_files() when it matters.
+
+    Args:
+        roots: Directories to walk
+        extensions: Suffixes to keep, e.g. {'.pdf', '.docx'} (None = all files)
+        max_workers: Directories listed concurrently
+
+    Yields:
+        FileRecord(path, size, mtime_ns)
+    """
+    wanted = frozenset(e.lower() for e in extensions) if extensions is not None else None
+    max_workers = max(1, max_workers)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='corpus-walk') as pool:
+        pending = {
+            pool.submit(_scan_directory, str(root), wanted)
+            for root in roots if os.path.isdir(root)
+        }
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                for subdir in subdirs:
+                    pending.add(pool.submit(_scan_directory, subdir, wanted))
+                yield from files
+
+
+def walk_files(roots: Iterable[Path], extensions: Optional[Iterable[str]] = None,
+               max_workers: int = DEFAULT_WALK_WORKERS) -> List[FileRecord]:
+    """
+    All files under the roots, in sorted path order
+
+    Same order as sorted(Path.rglob('*')), so documents, manifests and
+    checkpoints stay deterministic.
+    """
+    return sorted(iter_files(roots, extensions, max_workers), key=lambda record: record.path)
+
+
+def folder_size(folder_path: Path, max_workers: int = DEFAULT_WALK_WORKERS) -> int:
+    """Total bytes of every file under a folder"""
+    return sum(record.size for record in iter_files([folder_path], None, max_workers))
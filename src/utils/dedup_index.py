@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Dedup Index for Lismore Litigation Intelligence System
+Persistent duplicate-detection state shared by every phase and pass
+British English throughout
+
+Location: src/utils/dedup_index.py
+"""
+
+import json
+import sqlite3
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from datetime import datetime
+
+
+class DedupIndex:
+    """
+    On-disk store of everything DocumentDeduplicator has seen
+
+    Purpose:
+        - Exact hashes, prefix hashes and MinHash signatures survived only
+          as long as one run, so every run re-checked the whole corpus
+        - Phase 0 and Pass 1 deduplicated independently with no common
+          record of which documents were copies of which
+
+    Strategy:
+        - One row per (scope, doc_id): a scope is the phase or pass that
+          checked the document ('phase_0', 'pass_1'); duplicates are
+          judged within a scope, so Pass 1 still triages a document that
+          Phase 0 happened to read
+        - Cluster IDs are global: copies share a cluster whichever scope
+          saw them, and the cluster is the audit trail of what was dropped
+        - Duplicates are stored too (with what they duplicate), unique
+          documents also keep their signature and term vector so later
+          runs can verify new documents against them
+        - One connection held open with batched commits - the dedup loop
+          checks a document at a time and must not pay a commit each
+    """
+
+    COMMIT_EVERY = 200
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Initialise dedup index
+
+        Args:
+            db_path: SQLite database location (None = in memory, for one-off use)
+        """
+        if db_path is not None:
+            self.db_path = Path(db_path)
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(self.db_path, timeout=30)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        else:
+            self.db_path = None
+            self.conn = sqlite3.connect(':memory:')
+
+        self._uncommitted = 0
+        self._init_database()
+
+    def _init_database(self):
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS dedup_documents (
+                scope TEXT NOT NULL,
+                doc_id TEXT NOT NULL,
+                filename TEXT,
+                content_hash TEXT NOT NULL,
+                prefix_hash TEXT NOT NULL,
+                cluster_id TEXT NOT NULL,
+                duplicate_type TEXT NOT NULL,
+                duplicate_of TEXT,
+                signature BLOB,
+                vector BLOB,
+                checked_date TEXT,
+                PRIMARY KEY (scope, doc_id)
+            )
+        """)
+
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS dedup_containment (
+                scope TEXT NOT NULL,
+                contained_id TEXT NOT NULL,
+                container_id TEXT NOT NULL,
+                containment REAL NOT NULL,
+                recorded_date TEXT,
+                PRIMARY KEY (scope, contained_id)
+            )
+        """)
+
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_dedup_content ON dedup_documents(content_hash)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_dedup_prefix ON dedup_documents(prefix_hash)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_dedup_cluster ON dedup_documents(cluster_id)")
+
+        self.conn.commit()
+
+    def _maybe_commit(self):
+        self._uncommitted += 1
+        if self._uncommitted >= self.COMMIT_EVERY:
+            self.commit()
+
+    def commit(self):
+        self.conn.commit()
+        self._uncommitted = 0
+
+    def close(self):
+        self.commit()
+        self.conn.close()
+
+    # ========================================================================
+    # WRITE
+    # ========================================================================
+
+    def record(self, scope: str, doc_id: str, content_hash: str, prefix_hash: str,
+               cluster_id: str, duplicate_type: str, duplicate_of: Optional[str] = None,
+               filename: str = None, signature: Optional[bytes] = None,
+               vector: Optional[Dict[str, float]] = None):
+        """
+        Record the verdict for one document
+
+        Args:
+            scope: Phase or pass that checked it
+            doc_id: Document identifier
+            content_hash: Hash of the cleaned text
+            prefix_hash: Hash of the cleaned opening characters
+            cluster_id: Cluster the document belongs to
+            duplicate_type: 'unique' or the duplicate reason
+            duplicate_of: doc_id of the document it duplicates
+            filename: For the audit trail
+            signature: MinHash signature bytes (unique documents only)
+            vector: Term vector (unique documents only)
+        """
+        self.conn.execute("""
+            INSERT OR REPLACE INTO dedup_documents
+            (scope, doc_id, filename, content_hash, prefix_hash, cluster_id,
+             duplicate_type, duplicate_of, signature, vector, checked_date)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            scope, doc_id, filename, content_hash, prefix_hash, cluster_id,
+            duplicate_type, duplicate_of, signature,
+            zlib.compress(json.dumps(vector).encode('utf-8')) if vector is not None else None,
+            datetime.now().isoformat()
+        ))
+        self._maybe_commit()
+
+    def record_containment(self, scope: str, contained_id: str, container_id: str,
+                           containment: float):
+        """Record that one document sits inside another"""
+        self.conn.execute("""
+            INSERT OR REPLACE INTO dedup_containment
+            (scope, contained_id, container_id, containment, recorded_date)
+            VALUES (?, ?, ?, ?, ?)
+        """, (scope, contained_id, container_id, containment, datetime.now().isoformat()))
+        self._maybe_commit()
+
+    def remove_documents(self, scope: str, doc_ids: Iterable[str]) -> int:
+        """Forget documents whose source files changed or disappeared"""
+        doc_ids = list(doc_ids)
+        cursor = self.conn.executemany(
+            "DELETE FROM dedup_documents WHERE scope = ? AND doc_id = ?",
+            [(scope, doc_id) for doc_id in doc_ids]
+        )
+        removed = cursor.rowcount
+        self.conn.executemany(
+            "DELETE FROM dedup_containment WHERE scope = ? AND (contained_id = ? OR container_id = ?)",
+            [(scope, doc_id, doc_id) for doc_id in doc_ids]
+        )
+        self.commit()
+        return removed
+
+    def reset_scope(self, scope: str):
+        """Drop everything one phase or pass recorded (full re-runs)"""
+        self.conn.execute("DELETE FROM dedup_documents WHERE scope = ?", (scope,))
+        self.conn.execute("DELETE FROM dedup_containment WHERE scope = ?", (scope,))
+        self.commit()
+
+    # ========================================================================
+    # READ
+    # ========================================================================
+
+    def load_scope(self, scope: str) -> List[Dict]:
+        """
+        Unique documents recorded in a scope, in the order they were checked
+
+        Returns:
+            List of {doc_id, content_hash, prefix_hash, cluster_id, signature}
+        """
+        rows = self.conn.execute("""
+            SELECT doc_id, content_hash, prefix_hash, cluster_id, signature
+            FROM dedup_documents
+            WHERE scope = ? AND duplicate_type = 'unique'
+            ORDER BY rowid
+        """, (scope,)).fetchall()
+
+        return [{
+            'doc_id': row[0],
+            'content_hash': row[1],
+            'prefix_hash': row[2],
+            'cluster_id': row[3],
+            'signature': row[4]
+        } for row in rows]
+
+    def duplicates_of(self, scope: str, doc_ids: Iterable[str]) -> List[str]:
+        """doc_ids recorded as duplicates of any of these documents"""
+        doc_ids = list(dict.fromkeys(doc_ids))
+        duplicates = []
+        for start in range(0, len(doc_ids), 500):
+            chunk = doc_ids[start:start + 500]
+            duplicates.extend(row[0] for row in self.conn.execute(f"""
+                SELECT doc_id FROM dedup_documents
+                WHERE scope = ? AND duplicate_of IN ({','.join('?' * len(chunk))})
+                ORDER BY rowid
+            """, (scope, *chunk)))
+        return duplicates
+
+    def get_vector(self, scope: str, doc_id: str) -> Optional[Dict[str, float]]:
+        row = self.conn.execute(
+            "SELECT vector FROM dedup_documents WHERE scope = ? AND doc_id = ?", (scope, doc_id)
+        ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return json.loads(zlib.decompress(row[0]).decode('utf-8'))
+
+    def find_cluster(self, content_hash: str, prefix_hash: str) -> Optional[str]:
+        """Cluster of any document, in any scope, with the same text or opening"""
+        row = self.conn.execute(
+            "SELECT cluster_id FROM dedup_documents WHERE content_hash = ? LIMIT 1", (content_hash,)
+        ).fetchone()
+        if row is None:
+            row = self.conn.execute(
+                "SELECT cluster_id FROM dedup_documents WHERE prefix_hash = ? LIMIT 1", (prefix_hash,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_containment(self, scope: Optional[str] = None) -> List[Dict]:
+        """Recorded containment relationships (all scopes if None)"""
+        query = "SELECT scope, contained_id, container_id, containment FROM dedup_containment"
+        params = ()
+        if scope is not None:
+            query += " WHERE scope = ?"
+            params = (scope,)
+
+        return [{
+            'scope': row[0],
+            'contained_id': row[1],
+            'container_id': row[2],
+            'containment': row[3]
+        } for row in self.conn.execute(query + " ORDER BY rowid", params).fetchall()]
+
+    def get_cluster(self, cluster_id: str) -> List[Dict]:
+        """Every recorded member of a cluster, across scopes"""
+        rows = self.conn.execute("""
+            SELECT scope, doc_id, filename, duplicate_type, duplicate_of
+            FROM dedup_documents WHERE cluster_id = ?
+            ORDER BY rowid
+        """, (cluster_id,)).fetchall()
+
+        return [{
+            'scope': row[0],
+            'doc_id': row[1],
+            'filename': row[2],
+            'duplicate_type': row[3],
+            'duplicate_of': row[4]
+        } for row in rows]
+
+    def export_clusters(self, output_file: Path, min_size: int = 2) -> int:
+        """
+        Write every cluster with duplicates to JSON for audit
+
+        Returns:
+            Number of clusters written
+        """
+        cluster_ids = [row[0] for row in self.conn.execute("""
+            SELECT cluster_id FROM dedup_documents
+            GROUP BY cluster_id HAVING COUNT(*) >= ?
+            ORDER BY COUNT(*) DESC
+        """, (min_size,)).fetchall()]
+
+        clusters = {cluster_id: self.get_cluster(cluster_id) for cluster_id in cluster_ids}
+
+        output_file = Path(output_file)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(clusters, f, indent=2)
+
+        return len(clusters)
+
+    def get_statistics(self) -> Dict:
+        by_scope = {}
+        for scope, duplicate_type, count in self.conn.execute("""
+            SELECT scope, duplicate_type, COUNT(*) FROM dedup_documents
+            GROUP BY scope, duplicate_type
+        """).fetchall():
+            scope_stats = by_scope.setdefault(scope, {'unique': 0, 'duplicates': 0})
+            if duplicate_type == 'unique':
+                scope_stats['unique'] += count
+            else:
+                scope_stats['duplicates'] += count
+
+        clusters = self.conn.execute("""
+            SELECT COUNT(*) FROM (
+                SELECT cluster_id FROM dedup_documents
+                GROUP BY cluster_id HAVING COUNT(*) > 1
+            )
+        """).fetchone()[0]
+
+        contained = self.conn.execute("SELECT COUNT(*) FROM dedup_containment").fetchone()[0]
+
+        return {
+            'scopes': by_scope,
+            'clusters_with_duplicates': clusters,
+            'contained_documents': contained,
+            'db_path': str(self.db_path) if self.db_path else ':memory:'
+        }
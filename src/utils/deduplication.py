@@ -8,24 +8,420 @@ Location: src/utils/deduplication.py
 """
 
 import hashlib
+import json
+import mmap
 import re
-from typing import Dict, List, Tuple, Set
-from collections import defaultdict
+import tempfile
+import zlib
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Set
+from collections import OrderedDict, defaultdict
 import math
 
+import numpy as np
+
+from utils.dedup_index import DedupIndex
+
+
+# MinHash universal hashing: (a * x + b) mod p, truncated to 32 bits
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+# Fixed seed so signatures are comparable across runs and processes
+_MINHASH_SEED = 1
+
+# Shingle hashes are min-hashed in column blocks to bound memory on huge documents
+_SHINGLE_BLOCK = 8192
+
+
+def _lsh_false_rates(threshold: float, bands: int, rows: int, steps: int = 100) -> Tuple[float, float]:
+    """
+    Probability mass of false positives and false negatives for a band layout
+
+    A pair with Jaccard s shares at least one band with probability
+    1 - (1 - s^rows)^bands.
+    """
+    def collide(s):
+        return 1.0 - (1.0 - s ** rows) ** bands
+
+    fp = sum(collide(threshold * i / steps) for i in range(steps)) * threshold / steps
+    span = 1.0 - threshold
+    fn = sum(1.0 - collide(threshold + span * i / steps) for i in range(steps)) * span / steps
+    return fp, fn
+
+
+def optimal_lsh_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Bands and rows per band for a Jaccard threshold
+
+    False negatives are weighted above false positives: a missed
+    duplicate costs a triage call, a spurious candidate only costs one
+    verification.
+
+    Returns:
+        (bands, rows)
+    """
+    best, best_error = (num_perm, 1), float('inf')
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            fp, fn = _lsh_false_rates(threshold, bands, rows)
+            error = 0.3 * fp + 0.7 * fn
+            if error < best_error:
+                best, best_error = (bands, rows), error
+    return best
+
+
+class MinHashLSH:
+    """
+    Near-duplicate candidate index over word shingles
+
+    Purpose:
+        - Replaces comparing every new document with every one seen before
+        - Lookup cost depends on the number of bands, not the corpus size
+
+    Strategy:
+        - Word n-gram shingles hashed with crc32 (deterministic across runs)
+        - num_perm MinHash values per document, computed with NumPy
+        - Signatures cut into bands; documents sharing any band bucket
+          are candidates, to be verified by the caller
+    """
+
+    def __init__(self,
+                 threshold: float = 0.5,
+                 num_perm: int = 128,
+                 shingle_size: int = 3):
+        """
+        Initialise index
+
+        Args:
+            threshold: Jaccard similarity (of shingle sets) the bands are tuned for
+            num_perm: MinHash permutations per signature
+            shingle_size: Words per shingle
+        """
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = optimal_lsh_bands(threshold, num_perm)
+
+        generator = np.random.RandomState(_MINHASH_SEED)
+        self._a = generator.randint(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = generator.randint(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+
+        self._token_hashes: Dict[str, int] = {}
+        self.buckets: List[Dict[bytes, List[str]]] = [defaultdict(list) for _ in range(self.bands)]
+        self.signatures: Dict[str, np.ndarray] = {}
+
+    def _shingle_hashes(self, text: str) -> np.ndarray:
+        """Unique 32-bit hashes of the word shingles of a cleaned text"""
+        cache = self._token_hashes
+        token_hashes = []
+        for token in re.findall(r'\w+', text):
+            value = cache.get(token)
+            if value is None:
+                value = zlib.crc32(token.encode('utf-8'))
+                if len(cache) < 500000:
+                    cache[token] = value
+            token_hashes.append(value)
+
+        if not token_hashes:
+            return np.empty(0, dtype=np.uint64)
+
+        tokens = np.array(token_hashes, dtype=np.uint64)
+        width = min(self.shingle_size, len(tokens))
+        count = len(tokens) - width + 1
+
+        # Order-sensitive combination of the tokens in each window
+        shingles = np.zeros(count, dtype=np.uint64)
+        for offset in range(width):
+            shingles = shingles * np.uint64(1000003) ^ tokens[offset:offset + count]
+
+        return np.unique(shingles & _MAX_HASH)
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """
+        MinHash signature of a cleaned text
+
+        Returns:
+            uint64 array of num_perm values, or None for text with no words
+        """
+        shingles = self._shingle_hashes(text)
+        if shingles.size == 0:
+            return None
+
+        signature = np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        a = self._a[:, None]
+        b = self._b[:, None]
+        for start in range(0, shingles.size, _SHINGLE_BLOCK):
+            block = shingles[start:start + _SHINGLE_BLOCK][None, :]
+            hashed = ((a * block + b) % _MERSENNE_PRIME) & _MAX_HASH
+            np.minimum(signature, hashed.min(axis=1), out=signature)
+        return signature
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def query(self, signature: np.ndarray) -> List[str]:
+        """
+        Documents sharing at least one band with a signature
+
+        Returns:
+            Candidate doc_ids, most shared bands first
+        """
+        counts: Dict[str, int] = defaultdict(int)
+        for band, key in enumerate(self._band_keys(signature)):
+            for doc_id in self.buckets[band].get(key, ()):
+                counts[doc_id] += 1
+        return sorted(counts, key=counts.get, reverse=True)
+
+    def insert(self, doc_id: str, signature: np.ndarray):
+        for band, key in enumerate(self._band_keys(signature)):
+            self.buckets[band][key].append(doc_id)
+        self.signatures[doc_id] = signature
+
+    def estimate_jaccard(self, sig1: np.ndarray, sig2: np.ndarray) -> float:
+        return float(np.count_nonzero(sig1 == sig2)) / self.num_perm
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def remove(self, doc_ids: Set[str]):
+        """Drop documents from the index"""
+        for doc_id in doc_ids:
+            signature = self.signatures.pop(doc_id, None)
+            if signature is None:
+                continue
+            for band, key in enumerate(self._band_keys(signature)):
+                bucket = self.buckets[band].get(key)
+                if bucket and doc_id in bucket:
+                    bucket.remove(doc_id)
+
+    def clear(self):
+        self.buckets = [defaultdict(list) for _ in range(self.bands)]
+        self.signatures.clear()
+
+
+class SpillingVectorStore:
+    """
+    Term vectors for semantic verification, within a fixed RAM budget
+
+    Purpose:
+        - Every unique document's full term dict used to stay in memory
+          for the whole run, so RAM grew with the production
+
+    Strategy:
+        - Full vectors appended (zlib JSON) to an anonymous spill file and
+          read back through a memory map
+        - Only the max_in_memory most recently used vectors stay decoded
+          (LRU); the rest cost one mmap read when verified again
+        - A fixed-size sketch per document (signed feature hashing into
+          sketch_dims floats) stays in RAM; its cosine approximates the
+          full cosine, so candidates that are clearly too far apart are
+          rejected without touching the spill file
+    """
+
+    # Sketch cosine error is ~1/sqrt(dims) (0.06 at 256 dims); only
+    # candidates this far below the threshold are rejected on the sketch
+    SKETCH_MARGIN = 0.2
+
+    def __init__(self, max_in_memory: int = 5000, sketch_dims: int = 256,
+                 spill_dir: Optional[Path] = None):
+        """
+        Initialise store
+
+        Args:
+            max_in_memory: Decoded vectors kept in RAM
+            sketch_dims: Floats per sketch
+            spill_dir: Directory for the spill file (None = system temp)
+        """
+        self.max_in_memory = max(1, max_in_memory)
+        self.sketch_dims = sketch_dims
+        self.spill_dir = Path(spill_dir) if spill_dir is not None else None
+
+        self._cache: OrderedDict = OrderedDict()   # doc_id -> vector (LRU)
+        self._offsets: Dict[str, Tuple[int, int]] = {}
+        self._sketch_rows: Dict[str, int] = {}
+        self._sketches = np.zeros((0, sketch_dims), dtype=np.float32)
+        self._free_rows: List[int] = []
+
+        self._file = None
+        self._map = None
+        self._size = 0
+
+        self.stats = {'spill_reads': 0, 'cache_hits': 0, 'sketch_rejections': 0}
+
+    # ------------------------------------------------------------------
+    # Spill file
+    # ------------------------------------------------------------------
+
+    def _spill(self, data: bytes) -> Tuple[int, int]:
+        if self._file is None:
+            if self.spill_dir is not None:
+                self.spill_dir.mkdir(parents=True, exist_ok=True)
+            # Anonymous file: removed by the OS when closed or on exit
+            self._file = tempfile.TemporaryFile(
+                prefix='dedup_vectors_',
+                dir=str(self.spill_dir) if self.spill_dir is not None else None
+            )
+        offset = self._size
+        self._file.seek(offset)
+        self._file.write(data)
+        self._size += len(data)
+        return offset, len(data)
+
+    def _read(self, offset: int, length: int) -> bytes:
+        if self._map is None or offset + length > len(self._map):
+            self._file.flush()
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), self._size, access=mmap.ACCESS_READ)
+        return self._map[offset:offset + length]
+
+    # ------------------------------------------------------------------
+    # Sketches
+    # ------------------------------------------------------------------
+
+    def make_sketch(self, vector: Dict[str, float]) -> np.ndarray:
+        """Unit-length signed feature hash of a term vector"""
+        sketch = np.zeros(self.sketch_dims, dtype=np.float32)
+        for term, weight in vector.items():
+            h = zlib.crc32(term.encode('utf-8'))
+            sketch[h % self.sketch_dims] += weight if h & 0x80000000 else -weight
+        norm = float(np.linalg.norm(sketch))
+        if norm > 0:
+            sketch /= norm
+        return sketch
+
+    def _store_sketch(self, doc_id: str, sketch: np.ndarray):
+        row = self._sketch_rows.get(doc_id)
+        if row is None:
+            if self._free_rows:
+                row = self._free_rows.pop()
+            else:
+                row = len(self._sketch_rows) + len(self._free_rows)
+                if row >= len(self._sketches):
+                    grown = np.zeros((max(1024, 2 * len(self._sketches)), self.sketch_dims), dtype=np.float32)
+                    grown[:len(self._sketches)] = self._sketches
+                    self._sketches = grown
+            self._sketch_rows[doc_id] = row
+        self._sketches[row] = sketch
+
+    def sketch_similarity(self, doc_id: str, sketch: np.ndarray) -> Optional[float]:
+        """Approximate cosine with a stored document (None if it has no sketch)"""
+        row = self._sketch_rows.get(doc_id)
+        if row is None:
+            return None
+        return float(np.dot(self._sketches[row], sketch))
+
+    def can_reject(self, doc_id: str, sketch: np.ndarray, threshold: float) -> bool:
+        """True if the sketch shows the pair cannot reach the threshold"""
+        similarity = self.sketch_similarity(doc_id, sketch)
+        if similarity is not None and similarity < threshold - self.SKETCH_MARGIN:
+            self.stats['sketch_rejections'] += 1
+            return True
+        return False
+
+    # ------------------------------------------------------------------
+    # Mapping interface (used like the dict it replaces)
+    # ------------------------------------------------------------------
+
+    def __setitem__(self, doc_id: str, vector: Dict[str, float]):
+        data = zlib.compress(json.dumps(vector, separators=(',', ':')).encode('utf-8'))
+        self._offsets[doc_id] = self._spill(data)
+        self._store_sketch(doc_id, self.make_sketch(vector))
+        self._remember(doc_id, vector)
+
+    def _remember(self, doc_id: str, vector: Dict[str, float]):
+        self._cache[doc_id] = vector
+        self._cache.move_to_end(doc_id)
+        while len(self._cache) > self.max_in_memory:
+            self._cache.popitem(last=False)
+
+    def get(self, doc_id: str, default=None) -> Optional[Dict[str, float]]:
+        vector = self._cache.get(doc_id)
+        if vector is not None:
+            self._cache.move_to_end(doc_id)
+            self.stats['cache_hits'] += 1
+            return vector
+
+        location = self._offsets.get(doc_id)
+        if location is None:
+            return default
+
+        vector = json.loads(zlib.decompress(self._read(*location)).decode('utf-8'))
+        self.stats['spill_reads'] += 1
+        self._remember(doc_id, vector)
+        return vector
+
+    def pop(self, doc_id: str, default=None):
+        vector = self.get(doc_id, default)
+        self._cache.pop(doc_id, None)
+        self._offsets.pop(doc_id, None)   # bytes stay in the spill file until clear()
+        row = self._sketch_rows.pop(doc_id, None)
+        if row is not None:
+            self._free_rows.append(row)
+        return vector
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def clear(self):
+        self._cache.clear()
+        self._offsets.clear()
+        self._sketch_rows.clear()
+        self._free_rows.clear()
+        self._sketches = np.zeros((0, self.sketch_dims), dtype=np.float32)
+        self.close()
+
+    def close(self):
+        """Release the memory map and delete the spill file"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._size = 0
+
+    def get_statistics(self) -> Dict:
+        return {
+            **self.stats,
+            'vectors': len(self._offsets),
+            'vectors_in_memory': len(self._cache),
+            'spill_bytes': self._size
+        }
+
 
 class DocumentDeduplicator:
     """
     Detects duplicate and near-duplicate documents using:
     1. Content hashing for exact duplicates
     2. Fuzzy hashing for near-duplicates (first N pages)
-    3. TF-IDF cosine similarity for semantic duplicates
+    3. MinHash/LSH candidates verified by TF cosine similarity for
+       semantic duplicates
+    
+    With a DedupIndex the state persists between runs and is shared by
+    every phase and pass; each checks duplicates within its own scope.
     """
     
     def __init__(self, 
                  similarity_threshold: float = 0.85,
                  prefix_chars: int = 10000,
-                 enable_semantic: bool = True):
+                 enable_semantic: bool = True,
+                 lsh_threshold: float = 0.5,
+                 num_perm: int = 128,
+                 shingle_size: int = 3,
+                 index: Optional[DedupIndex] = None,
+                 scope: str = 'default',
+                 max_vectors_in_memory: int = 5000,
+                 sketch_dims: int = 256,
+                 spill_dir: Optional[Path] = None):
         """
         Initialise deduplicator
         
@@ -33,15 +429,41 @@ class DocumentDeduplicator:
             similarity_threshold: 0.0-1.0, documents above this are considered duplicates
             prefix_chars: Number of chars from start to check (simulates "first few pages")
             enable_semantic: Use semantic similarity (slower but more accurate)
+            lsh_threshold: Shingle Jaccard at which documents become candidates
+            num_perm: MinHash permutations per document
+            shingle_size: Words per shingle
+            index: Persistent store to load from and record into (None = this run only)
+            scope: Phase or pass name the verdicts are recorded under
+            max_vectors_in_memory: Full term vectors kept decoded in RAM
+            sketch_dims: Size of the in-RAM sketch kept per document
+            spill_dir: Where vectors beyond the limit are spilled (None = system temp)
         """
         self.similarity_threshold = similarity_threshold
         self.prefix_chars = prefix_chars
         self.enable_semantic = enable_semantic
+        self.index = index
         
-        # Track seen documents
-        self.seen_hashes = set()  # Exact duplicates
-        self.seen_fuzzy_hashes = set()  # Near-duplicates (prefix-based)
-        self.document_vectors = {}  # For semantic similarity
+        # Settings a worker process needs to reproduce compute_features()
+        self._feature_settings = {
+            'prefix_chars': prefix_chars,
+            'enable_semantic': enable_semantic,
+            'lsh_threshold': lsh_threshold,
+            'num_perm': num_perm,
+            'shingle_size': shingle_size
+        }
+        self.scope = scope
+        
+        # Track seen documents (hash -> doc_id of the first document seen)
+        self.seen_hashes = {}  # Exact duplicates
+        self.seen_fuzzy_hashes = {}  # Near-duplicates (prefix-based)
+        self.document_vectors = SpillingVectorStore(  # For semantic similarity
+            max_in_memory=max_vectors_in_memory,
+            sketch_dims=sketch_dims,
+            spill_dir=spill_dir
+        )
+        self.lsh = MinHashLSH(threshold=lsh_threshold, num_perm=num_perm, shingle_size=shingle_size)
+        self.clusters = {}  # doc_id -> cluster_id (unique documents)
+        self.checked_this_run = set()
         
         # Statistics
         self.stats = {
@@ -49,8 +471,67 @@ class DocumentDeduplicator:
             'exact_duplicates': 0,
             'fuzzy_duplicates': 0,
             'semantic_duplicates': 0,
-            'unique_documents': 0
+            'unique_documents': 0,
+            'lsh_candidates': 0,
+            'loaded_from_index': 0
         }
+        
+        if self.index is not None:
+            self.load_index()
+    
+    def load_index(self) -> int:
+        """
+        Load documents recorded in this scope by earlier runs
+        
+        Returns:
+            Number of unique documents loaded
+        """
+        entries = self.index.load_scope(self.scope)
+        for entry in entries:
+            doc_id = entry['doc_id']
+            self.seen_hashes.setdefault(entry['content_hash'], doc_id)
+            self.seen_fuzzy_hashes.setdefault(entry['prefix_hash'], doc_id)
+            self.clusters[doc_id] = entry['cluster_id']
+            if entry['signature'] is not None:
+                self.lsh.insert(doc_id, np.frombuffer(entry['signature'], dtype=np.uint64))
+        
+        self.stats['loaded_from_index'] = len(entries)
+        return len(entries)
+    
+    def flush(self):
+        """Write pending verdicts to the dedup index"""
+        if self.index is not None:
+            self.index.commit()
+    
+    def remove_documents(self, doc_ids: List[str]) -> List[str]:
+        """
+        Forget documents whose sources changed or were removed (incremental runs)
+        
+        Documents recorded as duplicates of a stale document lose their
+        verdict too - the copy they were dropped in favour of is gone, so
+        they must be checked (and triaged) again.
+        
+        Args:
+            doc_ids: Stale doc_ids
+            
+        Returns:
+            doc_ids of the orphaned duplicates, to be re-ingested
+        """
+        stale = set(doc_ids)
+        orphans = []
+        if not stale:
+            return orphans
+        if self.index is not None:
+            orphans = [d for d in self.index.duplicates_of(self.scope, stale) if d not in stale]
+            self.index.remove_documents(self.scope, stale.union(orphans))
+        
+        self.seen_hashes = {h: d for h, d in self.seen_hashes.items() if d not in stale}
+        self.seen_fuzzy_hashes = {h: d for h, d in self.seen_fuzzy_hashes.items() if d not in stale}
+        for doc_id in stale:
+            self.document_vectors.pop(doc_id, None)
+            self.clusters.pop(doc_id, None)
+        self.lsh.remove(stale)
+        return orphans
     
     def is_duplicate(self, 
                      doc_content: str, 
@@ -67,59 +548,232 @@ class DocumentDeduplicator:
         Returns:
             (is_duplicate: bool, reason: str)
         """
+        result = self.check(doc_content, doc_id, filename)
+        return result['is_duplicate'], result['reason']
+    
+    def compute_features(self, doc_content: str, semantic: bool = True) -> Dict:
+        """
+        Everything the verdict needs from the text itself
+        
+        Depends only on the text and the settings, never on what has been
+        seen, so it can be computed in any process and in any order.
+        
+        Args:
+            doc_content: Full document text
+            semantic: Include the MinHash signature and term vector
+            
+        Returns:
+            Dict with content_hash, prefix_hash and (if semantic) signature, vector
+        """
+        clean_content = self._clean_text(doc_content)
+        features = {
+            'clean': clean_content,
+            'content_hash': self._hash_content(clean_content),
+            'prefix_hash': self._hash_content(clean_content[:self.prefix_chars])
+        }
+        if semantic and self.enable_semantic:
+            features.update(self._semantic_features(clean_content))
+        return features
+    
+    def _semantic_features(self, clean_content: str) -> Dict:
+        return {
+            'signature': self.lsh.signature(clean_content),
+            'vector': self._vectorise_document(clean_content)
+        }
+    
+    def check(self, 
+              doc_content: str, 
+              doc_id: str,
+              filename: str = None,
+              features: Optional[Dict] = None,
+              file_hash: Optional[str] = None) -> Dict:
+        """
+        Check a document and record the verdict
+        
+        A document only ever matches other documents: a doc_id already
+        recorded by an earlier run (or another scope) is not a duplicate
+        of itself. Within one run a repeated doc_id is an exact duplicate
+        (doc_ids are content hashes, so it is a second copy of the file).
+        
+        Args:
+            doc_content: Full document text
+            doc_id: Document identifier
+            filename: Optional filename for the duplicate log
+            features: Precomputed compute_features() result (parallel mode)
+            file_hash: Source file content hash; for previews the exact
+                stage compares this, since equal previews are not equal files
+        
+        Returns:
+            Dict with is_duplicate, reason, duplicate_of and cluster_id
+        """
         self.stats['total_checked'] += 1
         
         if not doc_content or len(doc_content.strip()) < 100:
             # Too short to be meaningful
-            return False, "too_short"
+            return self._verdict(False, "too_short", None, None)
         
-        # Clean content for hashing
-        clean_content = self._clean_text(doc_content)
+        if doc_id and doc_id in self.checked_this_run:
+            self.stats['exact_duplicates'] += 1
+            return self._verdict(True, "exact_duplicate", doc_id, self.clusters.get(doc_id))
+        if doc_id:
+            self.checked_this_run.add(doc_id)
+        
+        # Clean content and hash it (the semantic part only if needed)
+        if features is None:
+            features = self.compute_features(doc_content, semantic=False)
         
         # ================================================================
         # STAGE 1: EXACT DUPLICATE CHECK (Fast)
         # ================================================================
-        content_hash = self._hash_content(clean_content)
+        content_hash = file_hash or features['content_hash']
+        fuzzy_hash = features['prefix_hash']
         
-        if content_hash in self.seen_hashes:
+        original = self.seen_hashes.get(content_hash)
+        if original is not None and original != doc_id:
             self.stats['exact_duplicates'] += 1
-            return True, "exact_duplicate"
+            return self._record_duplicate("exact_duplicate", original, doc_id, filename,
+                                          content_hash, fuzzy_hash)
         
         # ================================================================
         # STAGE 2: FUZZY DUPLICATE CHECK (First N chars - "First Few Pages")
         # ================================================================
-        prefix = clean_content[:self.prefix_chars]
-        fuzzy_hash = self._hash_content(prefix)
-        
-        if fuzzy_hash in self.seen_fuzzy_hashes:
+        original = self.seen_fuzzy_hashes.get(fuzzy_hash)
+        if original is not None and original != doc_id:
             self.stats['fuzzy_duplicates'] += 1
-            return True, "fuzzy_duplicate_prefix"
+            return self._record_duplicate("fuzzy_duplicate_prefix", original, doc_id, filename,
+                                          content_hash, fuzzy_hash)
         
         # ================================================================
         # STAGE 3: SEMANTIC SIMILARITY CHECK (Slower but catches variants)
         # ================================================================
-        if self.enable_semantic and len(self.document_vectors) > 0:
-            # Check similarity against all previously seen documents
+        signature = None
+        vector = None
+        
+        if self.enable_semantic:
+            if 'signature' not in features:
+                features.update(self._semantic_features(features['clean']))
+            signature = features['signature']
+            vector = features['vector']
+        
+        if signature is not None and len(self.lsh) > 0:
+            # Check similarity against LSH candidates only
             is_similar, similar_to = self._check_semantic_similarity(
-                clean_content, 
+                vector,
+                signature,
                 doc_id
             )
             
             if is_similar:
                 self.stats['semantic_duplicates'] += 1
-                return True, f"semantic_duplicate_of_{similar_to}"
+                return self._record_duplicate(f"semantic_duplicate_of_{similar_to}", similar_to,
+                                              doc_id, filename, content_hash, fuzzy_hash)
         
         # ================================================================
         # NOT A DUPLICATE - Register this document
         # ================================================================
-        self.seen_hashes.add(content_hash)
-        self.seen_fuzzy_hashes.add(fuzzy_hash)
+        self.seen_hashes.setdefault(content_hash, doc_id)
+        self.seen_fuzzy_hashes.setdefault(fuzzy_hash, doc_id)
         
-        if self.enable_semantic:
-            self.document_vectors[doc_id] = self._vectorise_document(clean_content)
+        if signature is not None:
+            self.document_vectors[doc_id] = vector
+            if doc_id not in self.lsh.signatures:
+                self.lsh.insert(doc_id, signature)
+        
+        cluster_id = self.clusters.get(doc_id)
+        if cluster_id is None and self.index is not None:
+            cluster_id = self.index.find_cluster(content_hash, fuzzy_hash)
+        cluster_id = cluster_id or doc_id
+        self.clusters[doc_id] = cluster_id
+        
+        if self.index is not None:
+            self.index.record(
+                self.scope, doc_id, content_hash, fuzzy_hash, cluster_id, 'unique',
+                filename=filename,
+                signature=signature.tobytes() if signature is not None else None,
+                vector=vector
+            )
         
         self.stats['unique_documents'] += 1
-        return False, "unique"
+        return self._verdict(False, "unique", None, cluster_id)
+    
+    def check_stream(self, documents: Iterable[Dict], max_workers: int = 1,
+                     batch_size: int = 500) -> Iterator[Tuple[Dict, Dict]]:
+        """
+        Check a stream of loader documents, in parallel when max_workers > 1
+        
+        Each batch is sharded across worker processes by doc_id hash; the
+        workers compute text features only. The merge then applies check()
+        to the batch in stream order, so the first-seen copy survives and
+        the verdicts are identical to a serial run on any number of cores.
+        
+        Args:
+            documents: Dicts with content (or preview), doc_id and filename
+            max_workers: Feature processes (1 = serial, no pool)
+            batch_size: Documents per parallel batch
+            
+        Yields:
+            (document, verdict) in input order
+        """
+        if max_workers <= 1:
+            for doc in documents:
+                content, doc_id, filename = _dedup_fields(doc)
+                yield doc, self.check(content, doc_id, filename, file_hash=_preview_file_hash(doc))
+            return
+        
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_dedup_worker,
+                                 initargs=(self._feature_settings,)) as pool:
+            batch = []
+            for doc in documents:
+                batch.append(doc)
+                if len(batch) >= batch_size:
+                    yield from self._check_batch(batch, pool, max_workers)
+                    batch = []
+            if batch:
+                yield from self._check_batch(batch, pool, max_workers)
+    
+    def _check_batch(self, batch: List[Dict], pool: ProcessPoolExecutor,
+                     shards: int) -> Iterator[Tuple[Dict, Dict]]:
+        fields = [_dedup_fields(doc) for doc in batch]
+        
+        # Shard by doc_id hash: copies of one file always land together
+        shard_positions = defaultdict(list)
+        for position, (_, doc_id, _) in enumerate(fields):
+            shard_positions[zlib.crc32((doc_id or '').encode('utf-8')) % shards].append(position)
+        
+        futures = {
+            shard: pool.submit(_features_for_shard, [fields[p][0] for p in positions])
+            for shard, positions in shard_positions.items()
+        }
+        
+        features = [None] * len(batch)
+        for shard, positions in shard_positions.items():
+            for position, shard_features in zip(positions, futures[shard].result()):
+                features[position] = shard_features
+        
+        # Merge: serial decisions, stream order
+        for doc, (content, doc_id, filename), doc_features in zip(batch, fields, features):
+            yield doc, self.check(content, doc_id, filename, features=doc_features,
+                                  file_hash=_preview_file_hash(doc))
+    
+    def _verdict(self, is_duplicate: bool, reason: str,
+                 duplicate_of: Optional[str], cluster_id: Optional[str]) -> Dict:
+        return {
+            'is_duplicate': is_duplicate,
+            'reason': reason,
+            'duplicate_of': duplicate_of,
+            'cluster_id': cluster_id
+        }
+    
+    def _record_duplicate(self, reason: str, original: str, doc_id: str, filename: str,
+                          content_hash: str, fuzzy_hash: str) -> Dict:
+        cluster_id = self.clusters.get(original, original)
+        if self.index is not None:
+            self.index.record(
+                self.scope, doc_id, content_hash, fuzzy_hash, cluster_id, reason,
+                duplicate_of=original, filename=filename
+            )
+        return self._verdict(True, reason, original, cluster_id)
     
     def _clean_text(self, text: str) -> str:
         """
@@ -146,20 +800,37 @@ class DocumentDeduplicator:
         return hashlib.sha256(content.encode('utf-8')).hexdigest()
     
     def _check_semantic_similarity(self, 
-                                   content: str, 
-                                   doc_id: str) -> Tuple[bool, str]:
+                                   current_vector: Dict[str, float], 
+                                   signature: np.ndarray,
+                                   doc_id: str = None) -> Tuple[bool, str]:
         """
-        Check semantic similarity against all previously seen documents
-        Uses TF-IDF + Cosine Similarity (no external dependencies)
+        Check semantic similarity against previously seen near neighbours
+        
+        The LSH index proposes candidates; each is verified with the
+        exact TF cosine similarity, so only candidates are compared.
         
         Returns:
             (is_similar: bool, similar_to_doc_id: str)
         """
-        # Vectorise current document
-        current_vector = self._vectorise_document(content)
+        candidates = self.lsh.query(signature)
+        self.stats['lsh_candidates'] += len(candidates)
+        current_sketch = self.document_vectors.make_sketch(current_vector)
         
-        # Compare against all seen documents
-        for seen_doc_id, seen_vector in self.document_vectors.items():
+        for seen_doc_id in candidates:
+            if seen_doc_id == doc_id:
+                continue
+            if self.document_vectors.can_reject(seen_doc_id, current_sketch, self.similarity_threshold):
+                continue
+            
+            seen_vector = self.document_vectors.get(seen_doc_id)
+            if seen_vector is None and self.index is not None:
+                # Recorded by an earlier run - bring it into the bounded store
+                seen_vector = self.index.get_vector(self.scope, seen_doc_id)
+                if seen_vector is not None:
+                    self.document_vectors[seen_doc_id] = seen_vector
+            if seen_vector is None:
+                continue
+            
             similarity = self._cosine_similarity(current_vector, seen_vector)
             
             if similarity >= self.similarity_threshold:
@@ -244,6 +915,7 @@ class DocumentDeduplicator:
         """Get deduplication statistics"""
         return {
             **self.stats,
+            'vector_store': self.document_vectors.get_statistics(),
             'deduplication_rate': (
                 (self.stats['exact_duplicates'] + 
                  self.stats['fuzzy_duplicates'] + 
@@ -254,19 +926,68 @@ class DocumentDeduplicator:
         }
     
     def reset(self):
-        """Reset deduplicator (clear all seen documents)"""
+        """Reset deduplicator (clear all seen documents, including this scope's index entries)"""
         self.seen_hashes.clear()
         self.seen_fuzzy_hashes.clear()
         self.document_vectors.clear()
+        self.lsh.clear()
+        self.clusters.clear()
+        self.checked_this_run.clear()
+        if self.index is not None:
+            self.index.reset_scope(self.scope)
         self.stats = {
             'total_checked': 0,
             'exact_duplicates': 0,
             'fuzzy_duplicates': 0,
             'semantic_duplicates': 0,
-            'unique_documents': 0
+            'unique_documents': 0,
+            'lsh_candidates': 0,
+            'loaded_from_index': 0
         }
 
 
+# ================================================================
+# PARALLEL FEATURE WORKERS
+# ================================================================
+
+_WORKER_DEDUPLICATOR = None
+
+
+def _dedup_fields(doc: Dict) -> Tuple[str, str, str]:
+    """(content, doc_id, filename) of a loader document"""
+    return (
+        doc.get('content', '') or doc.get('preview', ''),
+        doc.get('doc_id', ''),
+        doc.get('filename', '')
+    )
+
+
+def _preview_file_hash(doc: Dict) -> Optional[str]:
+    """File content hash of a preview extraction (None for full text)"""
+    metadata = doc.get('metadata') or {}
+    if metadata.get('extraction_mode') != 'preview':
+        return None
+    return metadata.get('content_hash')
+
+
+def _init_dedup_worker(settings: Dict):
+    global _WORKER_DEDUPLICATOR
+    _WORKER_DEDUPLICATOR = DocumentDeduplicator(**settings)
+
+
+def _features_for_shard(contents: List[str]) -> List[Optional[Dict]]:
+    """Features for one shard of a batch (None where check() stops before hashing)"""
+    results = []
+    for content in contents:
+        if not content or len(content.strip()) < 100:
+            results.append(None)
+            continue
+        features = _WORKER_DEDUPLICATOR.compute_features(content)
+        del features['clean']   # not needed once hashed - keeps the result small
+        results.append(features)
+    return results
+
+
 # ================================================================
 # INTEGRATION FUNCTIONS
 # ================================================================
@@ -300,29 +1021,36 @@ def deduplicate_document_list(documents: List[Dict],
     deduplicator = DocumentDeduplicator(
         similarity_threshold=settings['similarity_threshold'],
         prefix_chars=settings['prefix_chars'],
-        enable_semantic=settings['enable_semantic']
+        enable_semantic=settings['enable_semantic'],
+        lsh_threshold=settings.get('lsh_jaccard_threshold', 0.5),
+        num_perm=settings.get('minhash_permutations', 128),
+        shingle_size=settings.get('shingle_size', 3),
+        max_vectors_in_memory=settings.get('max_vectors_in_memory', 5000),
+        sketch_dims=settings.get('vector_sketch_dims', 256),
+        spill_dir=settings.get('vector_spill_dir')
     )
     
     unique_documents = []
     duplicate_log = []
     
-    for doc in documents:
-        content = doc.get('content', '') or doc.get('preview', '')
-        doc_id = doc.get('doc_id', '')
-        filename = doc.get('filename', '')
-        
-        is_dup, reason = deduplicator.is_duplicate(content, doc_id, filename)
-        
-        if not is_dup:
+    checked = deduplicator.check_stream(
+        documents,
+        max_workers=settings.get('parallel_workers', 1),
+        batch_size=settings.get('parallel_batch_size', 500)
+    )
+    
+    for doc, verdict in checked:
+        if not verdict['is_duplicate']:
             unique_documents.append(doc)
         else:
             duplicate_log.append({
-                'doc_id': doc_id,
-                'filename': filename,
-                'duplicate_type': reason
+                'doc_id': doc.get('doc_id', ''),
+                'filename': doc.get('filename', ''),
+                'duplicate_type': verdict['reason']
             })
     
     stats = deduplicator.get_statistics()
     stats['duplicate_log'] = duplicate_log
+    deduplicator.document_vectors.close()
     
     return unique_documents, stats
\ No newline at end of file
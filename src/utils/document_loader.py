@@ -10,37 +10,112 @@ import PyPDF2
 import fitz  # PyMuPDF
 import pdfplumber
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 import json
 from datetime import datetime
 import hashlib
+from collections import OrderedDict
+
+from utils.extraction_cache import ExtractionCache
+from utils.extraction_supervisor import ExtractionSupervisor
+from utils.page_store import PageStore
+from utils.ocr_queue import OCRQueue
+from utils.docx_extractor import extract_docx_text
+from utils.corpus_walker import DEFAULT_WALK_WORKERS, walk_files
+from utils.archive_reader import ARCHIVE_FORMATS, expand_archives, is_virtual_path, source_stat, split_virtual_path
+from utils.ingestion import SourceFile, canonical_doc_id, hash_file, read_source, sample_hash
+from utils.email_loader import EMAIL_FORMATS, format_email_text, parse_email_file
 
 
 class DocumentLoader:
     """Loads and processes documents from source folders"""
     
-    SUPPORTED_FORMATS = ['.pdf', '.docx', '.doc', '.txt', '.json', '.html', '.md']
+    SUPPORTED_FORMATS = ['.pdf', '.docx', '.doc', '.txt', '.json', '.html', '.md', '.eml', '.msg', '.zip']
     
     # File size protection (added by fix_large_files.py)
     MAX_FILE_SIZE_MB = 500      # Skip files > 500 MB
     MAX_PDF_PAGES = 100         # Only extract first 100 pages of huge PDFs
     MAX_CHARS_EXTRACT = 100000  # Max 100K chars per document
     
+    # Preview mode (Pass 1 triage) - enough text for dedup prefix and triage.
+    # PDF pages are read until PREVIEW_CHARS is reached; the page cap only
+    # bounds scans and blank pages that yield no text
+    PREVIEW_CHARS = 10000
+    PREVIEW_MAX_PAGES = 50
+    
+    # PDF extraction tuning
+    PDF_TIMEOUT_SECONDS = 300   # Stop extracting a single PDF after 5 minutes
+    PDF_LOW_YIELD_CHARS = 80    # PyMuPDF pages below this go to pdfplumber
+    
+    # Bump whenever extraction output changes (invalidates the extraction cache)
+    EXTRACTOR_VERSION = 5
+    
+    # Extraction outcomes that count as a failed load (worker killed or died)
+    FAILED_STATUSES = {'crashed', 'timeout', 'oom'}
+    
+    # Extraction outcomes that are not cached (may succeed on a re-run)
+    UNCACHEABLE_STATUSES = {'crashed', 'timeout', 'oom', 'partial_timeout'}
+    
+    # Recently read files whose hash is kept in memory for doc_id lookups
+    HASH_MEMO_SIZE = 4096
+    
     def __init__(self, config):
         """
         Initialise document loader
         
         Args:
-            config: Config object with folder mapping
+            config: Config object with folder mapping (None inside worker processes)
         """
         self.config = config
-        self.folder_mapping = config.folder_mapping
+        self.folder_mapping = config.folder_mapping if config is not None else None
+        
+        # Parallel extraction settings
+        self.loader_config = dict(getattr(config, 'loader_config', {}) or {})
+        dedup_config = getattr(config, 'deduplication_config', None) or {}
+        self.PREVIEW_CHARS = self.loader_config.get(
+            'preview_chars', dedup_config.get('prefix_chars', self.PREVIEW_CHARS)
+        )
+        self.PREVIEW_MAX_PAGES = self.loader_config.get('preview_max_pages', self.PREVIEW_MAX_PAGES)
+        
+        # Persistent extraction cache (parent process only)
+        self.extraction_cache = None
+        cache_config = getattr(config, 'extraction_cache_config', None) or {}
+        if cache_config.get('enabled', False):
+            try:
+                self.extraction_cache = ExtractionCache(
+                    cache_dir=cache_config['cache_dir'],
+                    max_size_mb=cache_config.get('max_size_mb', 2048)
+                )
+            except Exception as e:
+                print(f"⚠️  Extraction cache unavailable: {e}")
+        
+        # path -> (size, mtime_ns, content_hash) for files read this session
+        self._hash_memo = OrderedDict()
+        
+        # Per-page text store for random-access page loading
+        self.page_store = None
+        page_store_config = getattr(config, 'page_store_config', None) or {}
+        if page_store_config.get('enabled', False):
+            try:
+                self.page_store = PageStore(page_store_config['store_dir'])
+            except Exception as e:
+                print(f"⚠️  Page store unavailable: {e}")
+        
+        # Scanned PDFs are queued here and OCR'd off the triage path
+        self.ocr_queue = None
+        ocr_config = getattr(config, 'ocr_config', None) or {}
+        if ocr_config.get('enabled', False):
+            try:
+                self.ocr_queue = OCRQueue(ocr_config['queue_db'])
+            except Exception as e:
+                print(f"⚠️  OCR queue unavailable: {e}")
         
         # Stats
         self.stats = {
             'total_loaded': 0,
             'successful': 0,
             'failed': 0,
+            'worker_crashes': 0,
             'by_format': {},
             'by_folder': {},
             'by_priority': {}
@@ -50,6 +125,9 @@ class DocumentLoader:
         """
         Load all documents from specified folders
         
+        Materialises everything in memory - prefer iter_documents() for
+        corpus-sized runs.
+        
         Args:
             folders: List of folder paths. If None, uses Pass 1 folders from config
             
@@ -59,18 +137,12 @@ class DocumentLoader:
         if folders is None:
             folders = self.config.get_pass_1_folders()
         
-        documents = []
-        
         print(f"\n{'=' * 70}")
         print(f"LOADING DOCUMENTS")
         print(f"{'=' * 70}")
         print(f"Folders to load: {len(folders)}\n")
         
-        for folder_path in folders:
-            print(f"Loading: {folder_path.name}")
-            folder_docs = self.load_folder(folder_path)
-            documents.extend(folder_docs)
-            print(f"  Loaded: {len(folder_docs)} documents\n")
+        documents = list(self.iter_documents(folders))
         
         print(f"{'=' * 70}")
         print(f"Total documents loaded: {len(documents)}")
@@ -78,6 +150,33 @@ class DocumentLoader:
         
         return documents
     
+    def iter_documents(self, folders: Optional[List[Path]] = None,
+                       preview_only: bool = False) -> Iterator[Dict]:
+        """
+        Stream documents from specified folders
+        
+        Documents are yielded one at a time in folder then sorted path order;
+        at most a bounded window of files is being extracted or waiting to be
+        yielded, so memory stays flat however large the corpus is.
+        
+        Args:
+            folders: List of folder paths. If None, uses Pass 1 folders from config
+            preview_only: Extract only the first page(s) / PREVIEW_CHARS
+            
+        Yields:
+            Document dictionaries
+        """
+        if folders is None:
+            folders = self.config.get_pass_1_folders()
+        
+        for folder_path in folders:
+            print(f"Loading: {folder_path.name}")
+            count = 0
+            for doc in self.iter_folder(folder_path, preview_only=preview_only):
+                count += 1
+                yield doc
+            print(f"  Loaded: {count} documents\n")
+    
     def load_folder(self, folder_path: Path) -> List[Dict]:
         """
         Load all documents from a folder
@@ -88,49 +187,670 @@ class DocumentLoader:
         Returns:
             List of document dictionaries
         """
-        documents = []
+        return list(self.iter_folder(folder_path))
+    
+    def iter_folder(self, folder_path: Path, preview_only: bool = False) -> Iterator[Dict]:
+        """
+        Stream all documents from a folder
+        
+        Files are extracted in a process pool when parallel loading is
+        enabled and the folder is large enough; documents always come back
+        in sorted path order.
         
+        Args:
+            folder_path: Path to folder
+            preview_only: Extract only the first page(s) / PREVIEW_CHARS
+            
+        Yields:
+            Document dictionaries
+        """
         # Get folder metadata from mapping
         folder_name = folder_path.name
         folder_metadata = self._extract_folder_metadata(folder_name)
         
-        # Find all supported files
-        for file_path in folder_path.rglob('*'):
-            if file_path.is_file() and file_path.suffix.lower() in self.SUPPORTED_FORMATS:
-                try:
-                    doc = self.load_document(file_path, folder_metadata)
-                    if doc:
-                        documents.append(doc)
-                        self.stats['successful'] += 1
+        # Find all supported files (sorted for deterministic order)
+        file_paths = self.list_folder_files(folder_path)
+        
+        count = 0
+        for doc in self.iter_files(file_paths, preview_only=preview_only):
+            count += 1
+            doc['folder_name'] = folder_name
+            doc['folder_category'] = folder_metadata['category']
+            doc['folder_priority'] = folder_metadata['priority']
+            yield doc
+        
+        # Update stats
+        self.stats['by_folder'][folder_name] = count
+    
+    def list_folder_files(self, folder_path: Path) -> List[Path]:
+        """
+        Supported files under a folder, in sorted path order
+        
+        Directories are listed on several threads and filtered by suffix
+        during the walk. ZIP archives are replaced by their members'
+        virtual paths (bundle.zip!/folder/file.pdf), nested archives included.
+        """
+        records = walk_files(
+            [folder_path], self.SUPPORTED_FORMATS,
+            self.loader_config.get('discovery_workers', DEFAULT_WALK_WORKERS)
+        )
+        return expand_archives([record.path for record in records], self.SUPPORTED_FORMATS)
+    
+    def load_files(self, file_paths: List[Path], preview_only: bool = False) -> List[Dict]:
+        """
+        Load an explicit list of files (e.g. the delta from a manifest scan)
+        
+        Args:
+            file_paths: Files to load
+            preview_only: Extract only the first page(s) / PREVIEW_CHARS
+            
+        Returns:
+            List of document dictionaries, in the order given
+        """
+        return list(self.iter_files(file_paths, preview_only))
+    
+    def iter_files(self, file_paths: List[Path], preview_only: bool = False) -> Iterator[Dict]:
+        """
+        Stream an explicit list of files
+        
+        Args:
+            file_paths: Files to load (archives are expanded to their members)
+            preview_only: Extract only the first page(s) / PREVIEW_CHARS
+            
+        Yields:
+            Document dictionaries, in the order given (failures skipped)
+        """
+        file_paths = expand_archives(file_paths, self.SUPPORTED_FORMATS)
+        
+        if self._use_supervisor(len(file_paths)):
+            results = self._iter_files_supervised(file_paths, preview_only)
+        else:
+            results = self._iter_files_serial(file_paths, preview_only)
+        
+        for file_path, doc in zip(file_paths, results):
+            if self._record_result(file_path, doc):
+                yield doc
+    
+    def _use_supervisor(self, file_count: int) -> bool:
+        """Decide whether to extract a batch of files in supervised workers"""
+        if not self.loader_config.get('parallel_enabled', False):
+            return False
+        return file_count >= self.loader_config.get('parallel_min_files', 1)
+    
+    def _record_result(self, file_path: Path, doc: Optional[Dict]) -> bool:
+        """
+        Merge one extraction result into the loader stats
+        
+        Returns:
+            True if the document should be kept
+        """
+        self.stats['total_loaded'] += 1
+        
+        if not doc:
+            self.stats['failed'] += 1
+            return False
+        
+        suffix = file_path.suffix.lower()
+        self.stats['by_format'][suffix] = self.stats['by_format'].get(suffix, 0) + 1
+        
+        if doc.get('metadata', {}).get('extraction_status') in self.FAILED_STATUSES:
+            self.stats['failed'] += 1
+        else:
+            self.stats['successful'] += 1
+        
+        self._queue_for_ocr(file_path, doc)
+        
+        return True
+    
+    def _queue_for_ocr(self, file_path: Path, doc: Dict):
+        """Put a PDF with image-only pages on the OCR queue (parent process only)"""
+        if self.ocr_queue is None:
+            return
+        
+        metadata = doc.get('metadata', {})
+        page_engines = metadata.get('page_engines') or []
+        content_hash = metadata.get('content_hash')
+        if 'image_only' not in page_engines or not content_hash:
+            return
+        
+        # Exact pages when every page was seen, else let OCR find them
+        pages = None
+        if metadata.get('pages_extracted') == metadata.get('total_pages'):
+            pages = [i + 1 for i, engine in enumerate(page_engines) if engine == 'image_only']
+        
+        try:
+            if self.ocr_queue.enqueue(file_path, content_hash, doc.get('doc_id', ''), pages):
+                self.stats['ocr_queued'] = self.stats.get('ocr_queued', 0) + 1
+            metadata['ocr_status'] = 'queued'
+        except Exception as e:
+            print(f"   ⚠️  OCR queue write failed: {str(e)[:50]}")
+    
+    def _apply_ocr_pages(self, extraction: Dict, content_hash: Optional[str]):
+        """Fill image-only pages with finished OCR text, if any"""
+        if self.ocr_queue is None or not content_hash:
+            return
+        if not any(page['engine'] == 'image_only' for page in extraction['pages']):
+            return
+        
+        try:
+            ocr_pages = self.ocr_queue.get_pages(content_hash)
+        except Exception:
+            return
+        
+        for page in extraction['pages']:
+            if page['engine'] == 'image_only' and ocr_pages.get(page['page'], '').strip():
+                page['text'] = ocr_pages[page['page']]
+                page['engine'] = 'ocr'
+    
+    def apply_ocr_result(self, file_path: Path) -> Dict:
+        """
+        Re-extract a document once its OCR text is ready
+        
+        Drops the text-less cached extractions and page store copy, then
+        loads the full document again with OCR text merged in (which
+        re-populates the cache and page store).
+        
+        Args:
+            file_path: Source file
+            
+        Returns:
+            Full document dictionary
+        """
+        file_path = Path(file_path)
+        content_hash = self.content_hash(file_path)
+        
+        if self.extraction_cache is not None and content_hash:
+            self.extraction_cache.invalidate_content(content_hash)
+        if self.page_store is not None:
+            self.page_store.remove([file_path])
+        
+        return self.load_document(file_path, preview_only=False)
+    
+    def _iter_files_serial(self, file_paths: List[Path],
+                           preview_only: bool = False) -> Iterator[Optional[Dict]]:
+        """Extract files one at a time in this process"""
+        for file_path in file_paths:
+            try:
+                yield self.load_document(file_path, preview_only)
+            except Exception as e:
+                print(f"  ⚠️  Failed to load: {file_path.name} ({str(e)[:50]})")
+                yield None
+    
+    def _iter_files_supervised(self, file_paths: List[Path],
+                               preview_only: bool = False) -> Iterator[Optional[Dict]]:
+        """
+        Extract files in supervised worker processes
+        
+        Each file runs under a hard wall-clock and RSS limit enforced by
+        ExtractionSupervisor; a hung or bloated worker is killed, respawned,
+        and the file recorded as 'timeout' / 'oom' instead of stalling the
+        run. A worker that crashes outright gets max_crash_retries re-runs
+        before its file is quarantined as 'crashed'.
+        
+        Only a bounded window of files is queued at once, and submission
+        pauses while too many finished documents are waiting behind a slow
+        one in the reorder buffer (back-pressure on the consumer).
+        
+        Args:
+            file_paths: Files to extract
+            preview_only: Extract only the first page(s) / PREVIEW_CHARS
+            
+        Yields:
+            Results in the same order as file_paths (None for failures)
+        """
+        total = len(file_paths)
+        max_workers = max(1, min(self.loader_config.get('max_workers', 2), total))
+        window = max_workers * self.loader_config.get('tasks_per_worker', 2)
+        max_pending = window * 4
+        max_retries = self.loader_config.get('max_crash_retries', 1)
+        
+        ready = {}            # idx -> result waiting to be yielded in order
+        crash_counts = {}
+        cache_keys = {}
+        next_submit = 0
+        next_yield = 0
+        completed = 0
+        
+        if total > 1:
+            print(f"  ⚙️  Supervised extraction: {total} files, {max_workers} workers")
+        
+        supervisor = ExtractionSupervisor(
+            task=_load_document_in_worker,
+            max_workers=max_workers,
+            initializer=_init_loader_worker,
+            init_args=(self.worker_settings(),
+                       str(self.page_store.store_dir) if self.page_store else None,
+                       str(self.ocr_queue.db_path) if self.ocr_queue else None),
+            timeout_seconds=self.loader_config.get('file_timeout_seconds', 600),
+            max_rss_mb=self.loader_config.get('max_worker_rss_mb')
+        )
+        
+        with supervisor:
+            while next_yield < total:
+                while (next_submit < total and supervisor.pending < window
+                       and next_submit - next_yield < max_pending):
+                    idx = next_submit
+                    next_submit += 1
+                    
+                    # Serve cache hits here; only misses go to the workers.
+                    # Unknown hashes are not computed here - the worker's
+                    # single read produces the hash along with the text
+                    cached, cache_keys[idx] = self._cache_lookup(
+                        file_paths[idx], preview_only, allow_hashing=False
+                    )
+                    if cached is not None:
+                        ready[idx] = cached
+                        del cache_keys[idx]
                     else:
-                        self.stats['failed'] += 1
+                        supervisor.submit(idx, (str(file_paths[idx]), preview_only))
                 
-                except Exception as e:
-                    print(f"  ⚠️  Failed to load: {file_path.name} ({str(e)[:50]})")
-                    self.stats['failed'] += 1
+                # Nothing to wait for while every file so far was a cache hit
+                finished = supervisor.poll() if supervisor.pending else []
+                for idx, status, payload in finished:
+                    file_path = file_paths[idx]
+                    
+                    if status == 'ok':
+                        ready[idx] = payload
+                        cache_key = cache_keys.pop(idx, None)
+                        if cache_key is None and payload:
+                            cache_key = self._cache_key_from_result(file_path, preview_only, payload)
+                        self._cache_store(cache_key, payload)
+                    
+                    elif status == 'error':
+                        print(f"  ⚠️  Failed to load: {file_path.name} ({payload[:50]})")
+                        ready[idx] = None
+                    
+                    elif status == 'crashed' and crash_counts.get(idx, 0) < max_retries:
+                        crash_counts[idx] = crash_counts.get(idx, 0) + 1
+                        self.stats['worker_crashes'] += 1
+                        print(f"\n  ⚠️  Worker crashed on {file_path.name} - retrying")
+                        supervisor.submit(idx, (str(file_path), preview_only))
+                        continue
+                    
+                    else:
+                        # timeout / oom / repeated crash
+                        if status == 'crashed':
+                            self.stats['worker_crashes'] += 1
+                        print(f"\n  ❌ {status.upper()}: {file_path.name} ({payload})")
+                        ready[idx] = self._failed_document(file_path, status, payload)
+                    
+                    completed += 1
+                    if completed % 100 == 0:
+                        print(f"  Progress: {completed:,}/{total:,} files extracted")
                 
-                self.stats['total_loaded'] += 1
+                # Reorder buffer: release everything now contiguous
+                while next_yield in ready:
+                    yield ready.pop(next_yield)
+                    next_yield += 1
+    
+    def _failed_document(self, file_path: Path, status: str, reason: str = '') -> Dict:
+        """Build placeholder document for a file whose worker was killed or died"""
+        try:
+            file_size_mb = source_stat(file_path).st_size / (1024 * 1024)
+        except OSError:
+            file_size_mb = 0.0
         
-        # Update stats
-        self.stats['by_folder'][folder_name] = len(documents)
+        labels = {
+            'timeout': 'EXTRACTION TIMEOUT: Worker killed at the per-file time limit',
+            'oom': 'EXTRACTION OUT OF MEMORY: Worker killed at the memory limit',
+            'crashed': 'EXTRACTION CRASHED: File repeatedly killed its worker process'
+        }
         
-        return documents
+        return {
+            'filename': file_path.name,
+            'doc_id': self._generate_doc_id(file_path),
+            'content': f"[{labels.get(status, 'EXTRACTION FAILED')}]",
+            'preview': f'Extraction {status} on this file',
+            'metadata': {
+                'file_type': file_path.suffix.lower().lstrip('.'),
+                'size_mb': file_size_mb,
+                'filepath': str(file_path),
+                'extraction_status': status,
+                'error': reason or f'Extraction {status}'
+            }
+        }
     
+    def worker_settings(self) -> Dict:
+        """Picklable snapshot of the extraction limits for worker processes"""
+        return {
+            'max_file_size_mb': self.MAX_FILE_SIZE_MB,
+            'max_pdf_pages': self.MAX_PDF_PAGES,
+            'max_chars_extract': self.MAX_CHARS_EXTRACT,
+            'preview_chars': self.PREVIEW_CHARS,
+            'preview_max_pages': self.PREVIEW_MAX_PAGES
+        }
+    
+    def apply_worker_settings(self, settings: Dict):
+        """Apply limits captured by worker_settings() in a worker process"""
+        self.MAX_FILE_SIZE_MB = settings['max_file_size_mb']
+        self.MAX_PDF_PAGES = settings['max_pdf_pages']
+        self.MAX_CHARS_EXTRACT = settings['max_chars_extract']
+        self.PREVIEW_CHARS = settings['preview_chars']
+        self.PREVIEW_MAX_PAGES = settings['preview_max_pages']
     
     def load_document(self, file_path: Path, preview_only: bool = False) -> Dict:
         """
+        Load document, serving unchanged files from the extraction cache
+        
+        Preview and full extractions are cached separately, so triage
+        previews never stand in for a full document.
+        
+        Args:
+            file_path: Path to document
+            preview_only: If True, only extract first page(s) / PREVIEW_CHARS
+            
+        Returns:
+            Document dictionary
+        """
+        file_path = Path(file_path)
+        
+        # A file with no recorded hash is read once here; the same bytes
+        # serve the cache key, the doc_id and (on a miss) extraction
+        source = None
+        if self._skips_extraction(file_path):
+            # Placeholder only - never read (or hash) the whole file
+            return self._load_document_uncached(file_path, preview_only)
+        if self.extraction_cache is not None and self.known_hash(file_path) is None:
+            source = self._read_source(file_path)
+        
+        cached, cache_key = self._cache_lookup(file_path, preview_only, source)
+        if cached is not None:
+            return cached
+        
+        document = self._load_document_uncached(file_path, preview_only, source)
+        self._cache_store(cache_key, document)
+        
+        return document
+    
+    # ========================================================================
+    # CONTENT HASHES AND DOC IDS
+    # ========================================================================
+    
+    def _remember_hash(self, file_path: Path, size: int, mtime_ns: int, content_hash: str):
+        self._hash_memo[str(file_path)] = (size, mtime_ns, content_hash)
+        self._hash_memo.move_to_end(str(file_path))
+        while len(self._hash_memo) > self.HASH_MEMO_SIZE:
+            self._hash_memo.popitem(last=False)
+    
+    def known_hash(self, file_path: Path) -> Optional[str]:
+        """Content hash without reading the file (None if it would need a read)"""
+        try:
+            stat = source_stat(file_path)
+        except OSError:
+            return None
+        
+        memo = self._hash_memo.get(str(file_path))
+        if memo and memo[0] == stat.st_size and memo[1] == stat.st_mtime_ns:
+            return memo[2]
+        
+        if self.extraction_cache is not None:
+            content_hash = self.extraction_cache.known_hash(file_path)
+            if content_hash is not None:
+                self._remember_hash(file_path, stat.st_size, stat.st_mtime_ns, content_hash)
+                return content_hash
+        
+        return None
+    
+    def _read_source(self, file_path: Path) -> Optional[SourceFile]:
+        """Read a file once, recording its hash for the cache and doc_id"""
+        source = read_source(file_path)
+        if source is None:
+            return None
+        
+        self._remember_hash(file_path, source.size, source.mtime_ns, source.content_hash)
+        if self.extraction_cache is not None:
+            try:
+                self.extraction_cache.record_hash(
+                    file_path, source.content_hash, source.size, source.mtime_ns
+                )
+            except Exception:
+                pass
+        
+        return source
+    
+    def content_hash(self, file_path: Path) -> Optional[str]:
+        """
+        SHA-256 of a file's bytes, reusing recorded hashes where possible
+        
+        Files that are skipped without extraction (PST, archives, over
+        MAX_FILE_SIZE_MB) get ingestion.sample_hash instead, so a multi-GB
+        file costs two small reads rather than a full one.
+        
+        Args:
+            file_path: File to fingerprint
+            
+        Returns:
+            Hex digest, or None if the file cannot be read
+        """
+        file_path = Path(file_path)
+        content_hash = self.known_hash(file_path)
+        if content_hash is not None:
+            return content_hash
+        
+        try:
+            stat = source_stat(file_path)
+        except OSError:
+            return None
+        
+        if self._skips_extraction(file_path):
+            content_hash = sample_hash(file_path)
+        elif self.extraction_cache is not None:
+            content_hash = self.extraction_cache.content_hash(file_path)
+        else:
+            content_hash = hash_file(file_path)
+        
+        if content_hash is not None:
+            self._remember_hash(file_path, stat.st_size, stat.st_mtime_ns, content_hash)
+        
+        return content_hash
+    
+    # ========================================================================
+    # EXTRACTION CACHE
+    # ========================================================================
+    
+    def _cache_key(self, file_path: Path, preview_only: bool,
+                   content_hash: Optional[str]) -> Optional[str]:
+        limits = self.worker_settings()
+        limits['preview_only'] = preview_only
+        return self.extraction_cache.cache_key(
+            file_path, self.EXTRACTOR_VERSION, limits, content_hash=content_hash
+        )
+    
+    def _cache_key_from_result(self, file_path: Path, preview_only: bool,
+                               document: Dict) -> Optional[str]:
+        """Cache key for a worker result, using the hash the worker computed"""
+        if self.extraction_cache is None:
+            return None
+        
+        content_hash = document.get('metadata', {}).get('content_hash')
+        if not content_hash:
+            return None
+        
+        try:
+            self.extraction_cache.record_hash(file_path, content_hash)
+            return self._cache_key(file_path, preview_only, content_hash)
+        except Exception:
+            return None
+    
+    def _cache_lookup(self, file_path: Path, preview_only: bool = False,
+                      source: Optional[SourceFile] = None,
+                      allow_hashing: bool = True):
+        """
+        Look up a file in the extraction cache
+        
+        Args:
+            file_path: Source file
+            preview_only: Extraction mode
+            source: Bytes already read (their hash is used)
+            allow_hashing: If False, files with no recorded hash are
+                treated as misses rather than read here
+        
+        Returns:
+            Tuple of (cached document or None, cache key or None)
+        """
+        if self.extraction_cache is None:
+            return None, None
+        
+        try:
+            if source is not None:
+                content_hash = source.content_hash
+            elif allow_hashing:
+                content_hash = self.content_hash(file_path)
+            else:
+                content_hash = self.known_hash(file_path)
+            
+            if content_hash is None:
+                return None, None
+            
+            cache_key = self._cache_key(file_path, preview_only, content_hash)
+            if cache_key is None:
+                return None, None
+            
+            cached = self.extraction_cache.get(cache_key)
+        except Exception as e:
+            print(f"   ⚠️  Extraction cache lookup failed: {str(e)[:50]}")
+            return None, None
+        
+        if cached is not None:
+            # Same bytes may live at several paths - identity comes from this one
+            cached['filename'] = file_path.name
+            cached['doc_id'] = canonical_doc_id(content_hash)
+            cached.setdefault('metadata', {})['filepath'] = str(file_path)
+            cached['metadata']['content_hash'] = content_hash
+            cached['metadata']['cache_hit'] = True
+        
+        return cached, cache_key
+    
+    def _cache_store(self, cache_key: Optional[str], document: Optional[Dict]):
+        """Store an extraction result unless it is transient"""
+        if self.extraction_cache is None or not cache_key or not document:
+            return
+        
+        if document.get('metadata', {}).get('extraction_status') in self.UNCACHEABLE_STATUSES:
+            return
+        
+        try:
+            self.extraction_cache.put(cache_key, document, self.EXTRACTOR_VERSION)
+        except Exception as e:
+            print(f"   ⚠️  Extraction cache store failed: {str(e)[:50]}")
+    
+    def _store_pages(self, file_path: Path, extraction: Dict):
+        """Persist per-page text from a PDF extraction (best effort)"""
+        if self.page_store is None or not extraction.get('pages'):
+            return
+        
+        complete = (not extraction['timed_out']
+                    and len(extraction['pages']) >= extraction['total_pages'])
+        try:
+            self.page_store.put_pages(
+                file_path, extraction['pages'], extraction['total_pages'], complete
+            )
+        except Exception as e:
+            print(f"   ⚠️  Page store write failed: {str(e)[:50]}")
+    
+    def load_pages(self, file_path: Path, start: int = 1,
+                   end: Optional[int] = None) -> List[Dict]:
+        """
+        Load a page range, extracting the whole file only on first request
+        
+        The first call for a file extracts every page with no character or
+        page limits and stores them in the page store; later calls are a
+        single seek + read. Non-PDF files are a single page.
+        
+        Args:
+            file_path: Path to document
+            start: First page (1-based)
+            end: Last page, inclusive (None = last page)
+            
+        Returns:
+            List of {'page', 'text', 'engine'} dictionaries
+        """
+        file_path = Path(file_path)
+        
+        if self.page_store is not None:
+            pages = self.page_store.get_pages(file_path, start, end)
+            if pages is not None:
+                return pages
+        
+        if file_path.suffix.lower() == '.pdf':
+            extraction = self._extract_pdf_pages(file_path, max_pages=None, char_limit=None)
+            if self.ocr_queue is not None:
+                self._apply_ocr_pages(extraction, self.content_hash(file_path))
+            all_pages = extraction['pages']
+            if self.page_store is not None:
+                self._store_pages(file_path, extraction)
+        else:
+            text = self._extract_document(file_path, False, char_limit=None).get('content', '')
+            all_pages = [{'page': 1, 'text': text, 'engine': 'text'}]
+            if self.page_store is not None:
+                self._store_pages(file_path, {'pages': all_pages, 'total_pages': 1, 'timed_out': False})
+        
+        last = end if end is not None else len(all_pages)
+        return [page for page in all_pages if start <= page['page'] <= last]
+    
+    def load_full_text(self, file_path: Path) -> str:
+        """Full untruncated text of a document, via the page store"""
+        pages = self.load_pages(file_path)
+        return '\n\n'.join(page['text'] for page in pages if page['text'])
+    
+    def _load_document_uncached(self, file_path: Path, preview_only: bool = False,
+                                source: Optional[SourceFile] = None) -> Dict:
+        """Extract a document without consulting the cache (one read of the file)"""
+        if source is None and not self._skips_extraction(file_path):
+            source = self._read_source(file_path)
+        
+        document = self._extract_document(file_path, preview_only, source)
+        metadata = document.setdefault('metadata', {})
+        metadata['filepath'] = str(file_path)
+        metadata['extraction_mode'] = 'preview' if preview_only else 'full'
+        if is_virtual_path(file_path):
+            metadata['archive_path'] = str(split_virtual_path(file_path)[0])
+        if source is not None:
+            document['doc_id'] = source.doc_id
+            metadata['content_hash'] = source.content_hash
+        return document
+    
+    def _skips_extraction(self, file_path: Path) -> bool:
+        """True for files _extract_document replaces with a placeholder (PST, archive, too large)"""
+        if file_path.suffix.lower() == '.pst' or file_path.suffix.lower() in ARCHIVE_FORMATS:
+            return True
+        try:
+            return source_stat(file_path).st_size / (1024 * 1024) > self.MAX_FILE_SIZE_MB
+        except OSError:
+            return False
+    
+    def _char_limit(self, preview_only: bool, char_limit: Optional[int] = -1) -> Optional[int]:
+        """Effective character limit for an extraction mode (an explicit char_limit wins)"""
+        if char_limit != -1:
+            return char_limit
+        if not preview_only:
+            return self.MAX_CHARS_EXTRACT
+        if self.MAX_CHARS_EXTRACT:
+            return min(self.PREVIEW_CHARS, self.MAX_CHARS_EXTRACT)
+        return self.PREVIEW_CHARS
+    
+    def _extract_document(self, file_path: Path, preview_only: bool = False,
+                          source: Optional[SourceFile] = None,
+                          char_limit: Optional[int] = -1) -> Dict:
+        """
         Load document with size protection
         
         Args:
             file_path: Path to document
             preview_only: If True, only extract first page/preview
+            source: Bytes already read
+            char_limit: Character cap (-1 = mode default, None = no limit)
             
         Returns:
             Document dictionary
         """
         
+        # Archive members have no file on disk for extractors to open
+        if source is None and is_virtual_path(file_path) and not self._skips_extraction(file_path):
+            source = self._read_source(file_path)
+        
         # Check file size BEFORE loading
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
+        file_size_mb = source_stat(file_path).st_size / (1024 * 1024)
         
         # Skip PST files (email archives - handle separately)
         if file_path.suffix.lower() == '.pst':
@@ -146,17 +866,17 @@ class DocumentLoader:
                 }
             }
         
-        # Skip MSG files (individual emails - handle in Phase 5)
-        if file_path.suffix.lower() == '.msg':
+        # Archives are expanded into members by iter_files, never extracted whole
+        if file_path.suffix.lower() in ARCHIVE_FORMATS:
             return {
                 'filename': file_path.name,
                 'doc_id': self._generate_doc_id(file_path),
-                'content': f'[EMAIL MESSAGE: {file_size_mb:.1f} MB - Process in Phase 5]',
-                'preview': f'Outlook email message ({file_size_mb:.1f} MB)',
+                'content': f'[ARCHIVE: {file_size_mb:.1f} MB - load through iter_files to read its members]',
+                'preview': f'Archive ({file_size_mb:.1f} MB)',
                 'metadata': {
-                    'file_type': 'msg',
+                    'file_type': file_path.suffix.lower().lstrip('.'),
                     'size_mb': file_size_mb,
-                    'skip_reason': 'Email message - process in Phase 5 email analysis'
+                    'skip_reason': 'Archive - members are loaded individually'
                 }
             }
         
@@ -178,13 +898,18 @@ class DocumentLoader:
         suffix = file_path.suffix.lower()
         
         if suffix == '.pdf':
-            return self._load_pdf_safe(file_path, file_size_mb)
+            return self._load_pdf_safe(file_path, file_size_mb, preview_only, source, char_limit)
         elif suffix in ['.docx', '.doc']:
-            return self._load_word_document(file_path)
+            return self._load_word_document(file_path, preview_only, source, char_limit)
+        elif suffix in EMAIL_FORMATS:
+            return self._load_email_document(file_path, preview_only, source, char_limit)
         else:
-            return self._load_text_document(file_path)
+            return self._load_text_document(file_path, preview_only, source, char_limit)
     
-    def _load_pdf_safe(self, file_path: Path, file_size_mb: float) -> Dict:
+    def _load_pdf_safe(self, file_path: Path, file_size_mb: float,
+                       preview_only: bool = False,
+                       source: Optional[SourceFile] = None,
+                       char_limit: Optional[int] = -1) -> Dict:
         """
         Load PDF with comprehensive error handling and progress tracking
         Handles: corrupted PDFs, None errors, timeouts, large files
@@ -192,6 +917,9 @@ class DocumentLoader:
         Args:
             file_path: Path to PDF file
             file_size_mb: File size in megabytes
+            preview_only: Extract pages until PREVIEW_CHARS (at most PREVIEW_MAX_PAGES)
+            source: Bytes already read (parsed in memory instead of re-read)
+            char_limit: Character cap (-1 = mode default, None = no limit)
             
         Returns:
             Document dictionary with extracted content
@@ -203,21 +931,25 @@ class DocumentLoader:
         print(f"   📄 PROGRESS: Loading {file_path.name} ({file_size_mb:.1f} MB)...", end='', flush=True)
         
         try:
-            import pdfplumber
-            
             # Determine extraction strategy
-            if file_size_mb > 100:
+            if preview_only:
+                max_pages = self.PREVIEW_MAX_PAGES
+            elif file_size_mb > 100:
                 max_pages = self.MAX_PDF_PAGES
             else:
                 max_pages = None
             
-            text_parts = []
-            total_pages = 0
-            pages_extracted = 0
+            char_limit = self._char_limit(preview_only, char_limit)
             
-            # Open PDF with error handling
             try:
-                pdf = pdfplumber.open(file_path)
+                extraction = self._extract_pdf_pages(
+                    file_path,
+                    max_pages=max_pages,
+                    deadline=start_time + self.PDF_TIMEOUT_SECONDS,
+                    show_progress=file_size_mb > 50,
+                    char_limit=char_limit,
+                    source=source
+                )
             except Exception as open_error:
                 print(f" ❌ FAILED (cannot open)")
                 return {
@@ -232,99 +964,44 @@ class DocumentLoader:
                     }
                 }
             
-            try:
-                # CRITICAL: Check if pages exist and is not None
-                if not hasattr(pdf, 'pages') or pdf.pages is None:
-                    pdf.close()
-                    print(f" ❌ FAILED (no pages)")
-                    return {
-                        'filename': file_path.name,
-                        'doc_id': self._generate_doc_id(file_path),
-                        'content': '[CORRUPTED PDF: No pages found]',
-                        'preview': 'PDF appears corrupted - no readable pages',
-                        'metadata': {
-                            'file_type': 'pdf',
-                            'size_mb': file_size_mb,
-                            'error': 'No pages attribute or pages is None'
-                        }
-                    }
-                
-                total_pages = len(pdf.pages)
-                
-                # CRITICAL: Handle None or 0 pages
-                if total_pages is None or total_pages == 0:
-                    pdf.close()
-                    print(f" ❌ FAILED (0 pages)")
-                    return {
-                        'filename': file_path.name,
-                        'doc_id': self._generate_doc_id(file_path),
-                        'content': '[EMPTY PDF: 0 pages]',
-                        'preview': 'PDF has no readable pages',
-                        'metadata': {
-                            'file_type': 'pdf',
-                            'size_mb': file_size_mb,
-                            'total_pages': 0,
-                            'error': 'Empty PDF'
-                        }
-                    }
-                
-                # Calculate pages to extract
-                if max_pages is not None:
-                    pages_to_extract = min(total_pages, max_pages)
-                else:
-                    pages_to_extract = total_pages
-                
-                print(f" extracting {pages_to_extract}/{total_pages} pages...", end='', flush=True)
-                
-                # Extract text from pages with timeout protection
-                for i in range(pages_to_extract):
-                    # Check if taking too long (5 minutes per file max)
-                    if time.time() - start_time > 300:
-                        print(f" ⚠️ TIMEOUT after {pages_extracted} pages")
-                        break
-                    
-                    try:
-                        page_text = pdf.pages[i].extract_text()
-                        if page_text:
-                            text_parts.append(page_text)
-                        pages_extracted += 1
-                        
-                        # Progress indicator for large files
-                        if pages_extracted % 20 == 0 and file_size_mb > 50:
-                            print(f" [{pages_extracted}/{pages_to_extract}]", end='', flush=True)
-                        
-                        # Stop if we've extracted enough chars
-                        if len(''.join(text_parts)) > self.MAX_CHARS_EXTRACT:
-                            break
-                            
-                    except Exception as page_error:
-                        # Skip problematic pages but continue
-                        continue
-                
-                pdf.close()
-                
-            except Exception as extract_error:
-                if 'pdf' in locals():
-                    try:
-                        pdf.close()
-                    except:
-                        pass
-                print(f" ❌ FAILED (extraction error)")
+            total_pages = extraction['total_pages']
+            pages_extracted = len(extraction['pages'])
+            
+            # CRITICAL: Handle None or 0 pages
+            if not total_pages:
+                print(f" ❌ FAILED (0 pages)")
                 return {
                     'filename': file_path.name,
                     'doc_id': self._generate_doc_id(file_path),
-                    'content': f'[PDF EXTRACTION ERROR: {str(extract_error)[:100]}]',
-                    'preview': f'Error during extraction: {str(extract_error)[:100]}',
+                    'content': '[EMPTY PDF: 0 pages]',
+                    'preview': 'PDF has no readable pages',
                     'metadata': {
                         'file_type': 'pdf',
                         'size_mb': file_size_mb,
-                        'error': str(extract_error)[:200]
+                        'total_pages': 0,
+                        'error': 'Empty PDF'
                     }
                 }
             
+            if extraction['timed_out']:
+                print(f" ⚠️ TIMEOUT after {pages_extracted} pages", end='')
+            
+            self._apply_ocr_pages(
+                extraction, source.content_hash if source is not None else self.known_hash(file_path)
+            )
+            
+            if not preview_only:
+                self._store_pages(file_path, extraction)
+            
             # Combine extracted text
+            text_parts = [page['text'] for page in extraction['pages'] if page['text']]
             full_text = '\n\n'.join(text_parts)
             
+            page_engines = [page['engine'] for page in extraction['pages']]
+            engine_counts = {}
+            for engine in page_engines:
+                engine_counts[engine] = engine_counts.get(engine, 0) + 1
+            
             # Handle case where no text was extracted
             if not full_text or len(full_text.strip()) == 0:
                 elapsed = time.time() - start_time
@@ -339,31 +1016,41 @@ class DocumentLoader:
                         'size_mb': file_size_mb,
                         'total_pages': total_pages,
                         'pages_extracted': pages_extracted,
+                        'page_engines': page_engines,
+                        'engine_counts': engine_counts,
                         'warning': 'No text extracted - possibly scanned images'
                     }
                 }
             
             # Truncate if still too long
-            if len(full_text) > self.MAX_CHARS_EXTRACT:
-                full_text = full_text[:self.MAX_CHARS_EXTRACT]
-                full_text += f"\n\n[TRUNCATED - {total_pages} pages total, extracted {pages_extracted} pages]"
+            if char_limit and len(full_text) > char_limit:
+                full_text = full_text[:char_limit]
+                if not preview_only:
+                    full_text += f"\n\n[TRUNCATED - {total_pages} pages total, extracted {pages_extracted} pages]"
             
             elapsed = time.time() - start_time
             print(f" ✅ OK ({elapsed:.1f}s, {len(full_text):,} chars)")
             
+            metadata = {
+                'file_type': 'pdf',
+                'size_mb': file_size_mb,
+                'total_pages': total_pages,
+                'pages_extracted': pages_extracted,
+                'truncated': pages_extracted < total_pages,
+                'page_engines': page_engines,
+                'engine_counts': engine_counts,
+                'extraction_time_seconds': round(elapsed, 1)
+            }
+            
+            if extraction['timed_out']:
+                metadata['extraction_status'] = 'partial_timeout'
+            
             return {
                 'filename': file_path.name,
                 'doc_id': self._generate_doc_id(file_path),
                 'content': full_text,
                 'preview': full_text[:300],
-                'metadata': {
-                    'file_type': 'pdf',
-                    'size_mb': file_size_mb,
-                    'total_pages': total_pages,
-                    'pages_extracted': pages_extracted,
-                    'truncated': pages_extracted < total_pages,
-                    'extraction_time_seconds': round(elapsed, 1)
-                }
+                'metadata': metadata
             }
             
         except Exception as e:
@@ -379,21 +1066,158 @@ class DocumentLoader:
                     'size_mb': file_size_mb
                 }
             }
+    
+    def _extract_pdf_pages(self, file_path: Path, max_pages: Optional[int] = None,
+                           deadline: Optional[float] = None,
+                           show_progress: bool = False,
+                           char_limit: Optional[int] = -1,
+                           source: Optional[SourceFile] = None) -> Dict:
+        """
+        Tiered per-page PDF extraction
+        
+        PyMuPDF extracts every page first (an order of magnitude faster than
+        pdfplumber). Only low-yield pages - little text but not an image-only
+        scan - are re-extracted with pdfplumber, which copes better with
+        table-heavy layouts; the longer result wins. If PyMuPDF cannot open
+        the file at all, pdfplumber handles every page.
+        
+        Args:
+            file_path: Path to PDF
+            max_pages: Page cap (None = all pages)
+            deadline: time.time() after which extraction stops
+            show_progress: Print page progress for large files
+            char_limit: Stop after this many chars (-1 = MAX_CHARS_EXTRACT, None = no limit)
+            source: Bytes already read (parsed in memory instead of re-read)
+            
+        Returns:
+            Dict with total_pages, pages [{page, text, engine}], timed_out
+        
+        Raises:
+            Exception if neither engine can open the file
+        """
+        import time
+        
+        result = {'total_pages': 0, 'pages': [], 'timed_out': False}
+        plumber_pdf = None
+        
+        if char_limit == -1:
+            char_limit = self.MAX_CHARS_EXTRACT
+        
+        if source is None and is_virtual_path(file_path):
+            source = self._read_source(file_path)
+        
+        in_memory = source is not None and source.has_data
+        
+        def open_plumber():
+            return pdfplumber.open(source.open() if in_memory else file_path)
+        
+        try:
+            if in_memory:
+                fitz_doc = fitz.open(stream=source.data, filetype='pdf')
+            else:
+                fitz_doc = fitz.open(file_path)
+        except Exception:
+            fitz_doc = None
+        
+        try:
+            if fitz_doc is not None:
+                total_pages = fitz_doc.page_count
+            else:
+                plumber_pdf = open_plumber()
+                if not hasattr(plumber_pdf, 'pages') or plumber_pdf.pages is None:
+                    return result
+                total_pages = len(plumber_pdf.pages)
+            
+            result['total_pages'] = total_pages or 0
+            pages_to_extract = min(total_pages, max_pages) if max_pages else total_pages
+            
+            if deadline is not None:
+                print(f" extracting {pages_to_extract}/{total_pages} pages...", end='', flush=True)
+            
+            chars_so_far = 0
+            
+            for i in range(pages_to_extract):
+                if deadline is not None and time.time() > deadline:
+                    result['timed_out'] = True
+                    break
+                
+                text, engine = '', 'none'
+                escalate = True
+                
+                # Tier 1: PyMuPDF
+                if fitz_doc is not None:
+                    try:
+                        page = fitz_doc.load_page(i)
+                        text = page.get_text() or ''
+                        engine = 'pymupdf'
+                        
+                        stripped = text.strip()
+                        if not stripped and page.get_images():
+                            # Scanned page - pdfplumber has no text layer to find either
+                            engine = 'image_only'
+                            escalate = False
+                        else:
+                            escalate = len(stripped) < self.PDF_LOW_YIELD_CHARS
+                    except Exception:
+                        pass
+                
+                # Tier 2: pdfplumber for low-yield pages
+                if escalate:
+                    try:
+                        if plumber_pdf is None:
+                            plumber_pdf = open_plumber()
+                        plumber_text = plumber_pdf.pages[i].extract_text() or ''
+                        if len(plumber_text.strip()) > len(text.strip()):
+                            text, engine = plumber_text, 'pdfplumber'
+                    except Exception:
+                        pass
+                
+                result['pages'].append({'page': i + 1, 'text': text, 'engine': engine})
+                chars_so_far += len(text)
+                
+                # Progress indicator for large files
+                if show_progress and (i + 1) % 20 == 0:
+                    print(f" [{i + 1}/{pages_to_extract}]", end='', flush=True)
+                
+                # Stop if we've extracted enough chars
+                if char_limit and chars_so_far > char_limit:
+                    break
+            
+            return result
+        
+        finally:
+            if fitz_doc is not None:
+                try:
+                    fitz_doc.close()
+                except Exception:
+                    pass
+            if plumber_pdf is not None:
+                try:
+                    plumber_pdf.close()
+                except Exception:
+                    pass
 
     
-    def _load_word_document(self, file_path: Path) -> Dict:
+    def _load_word_document(self, file_path: Path, preview_only: bool = False,
+                            source: Optional[SourceFile] = None,
+                            char_limit: Optional[int] = -1) -> Dict:
         """
         Load Word document (.docx, .doc)
         
         Args:
             file_path: Path to Word document
+            preview_only: Keep only the first PREVIEW_CHARS
+            source: Bytes already read (parsed in memory instead of re-read)
+            char_limit: Character cap (-1 = mode default, None = no limit)
             
         Returns:
             Document dictionary with extracted text
         """
         try:
-            # Use the existing _extract_docx_text method
-            text = self._extract_docx_text(file_path)
+            char_limit = self._char_limit(preview_only, char_limit)
+            text = self._extract_docx_text(
+                file_path, max_chars=char_limit + 1 if preview_only else None, source=source
+            )
             
             if not text or len(text) < 10:
                 return {
@@ -408,9 +1232,10 @@ class DocumentLoader:
                 }
             
             # Truncate if too long
-            if len(text) > self.MAX_CHARS_EXTRACT:
-                text = text[:self.MAX_CHARS_EXTRACT]
-                text += "\n\n[TRUNCATED - document continues]"
+            if char_limit and len(text) > char_limit:
+                text = text[:char_limit]
+                if not preview_only:
+                    text += "\n\n[TRUNCATED - document continues]"
             
             return {
                 'filename': file_path.name,
@@ -433,18 +1258,96 @@ class DocumentLoader:
                 'metadata': {'error': str(e)}
             }
     
-    def _load_text_document(self, file_path: Path) -> Dict:
+    def _load_email_document(self, file_path: Path, preview_only: bool = False,
+                             source: Optional[SourceFile] = None,
+                             char_limit: Optional[int] = -1) -> Dict:
+        """
+        Load email message (.eml, .msg) with headers, body and attachment text
+        
+        Args:
+            file_path: Path to email file
+            preview_only: Headers and body only (attachments listed, not extracted)
+            source: Bytes already read (parsed in memory instead of re-read)
+            char_limit: Character cap (-1 = mode default, None = no limit)
+            
+        Returns:
+            Document dictionary with email text and threading metadata
+        """
+        file_type = file_path.suffix.lower().lstrip('.')
+        
+        try:
+            char_limit = self._char_limit(preview_only, char_limit)
+            email_data = parse_email_file(
+                file_path,
+                data=source.data if source is not None and source.has_data else None,
+                include_attachments=not preview_only,
+                attachment_chars=char_limit
+            )
+            text = format_email_text(email_data)
+            
+            # Truncate if too long
+            if char_limit and len(text) > char_limit:
+                text = text[:char_limit]
+                if not preview_only:
+                    text += "\n\n[TRUNCATED - email continues]"
+            
+            return {
+                'filename': file_path.name,
+                'doc_id': self._generate_doc_id(file_path),
+                'content': text,
+                'preview': f"{email_data['subject']} - {email_data['body'].strip()[:250]}",
+                'metadata': {
+                    'file_type': file_type,
+                    'doc_type': 'email',
+                    'text_length': len(text),
+                    'message_id': email_data['message_id'],
+                    'in_reply_to': email_data['in_reply_to'],
+                    'references': email_data['references'],
+                    'subject': email_data['subject'],
+                    'sender_name': email_data['sender_name'],
+                    'sender_email': email_data['sender_email'],
+                    'recipients': email_data['recipients'],
+                    'cc': email_data['cc'],
+                    'sent_time': email_data['sent_time'],
+                    'has_attachments': bool(email_data['attachments']),
+                    'attachments': [a['filename'] for a in email_data['attachments']]
+                }
+            }
+            
+        except Exception as e:
+            print(f"   ❌ Error loading email: {file_path.name} - {str(e)[:100]}")
+            return {
+                'filename': file_path.name,
+                'doc_id': self._generate_doc_id(file_path),
+                'content': f'[ERROR LOADING EMAIL: {str(e)[:200]}]',
+                'preview': 'Error loading email',
+                'metadata': {
+                    'file_type': file_type,
+                    'doc_type': 'email',
+                    'error': str(e)[:500]
+                }
+            }
+    
+    def _load_text_document(self, file_path: Path, preview_only: bool = False,
+                            source: Optional[SourceFile] = None,
+                            char_limit: Optional[int] = -1) -> Dict:
         """
         Load plain text document (.txt, .md, etc.)
         
         Args:
             file_path: Path to text file
+            preview_only: Read only the first PREVIEW_CHARS
+            source: Bytes already read (decoded instead of re-read)
+            char_limit: Character cap (-1 = mode default, None = no limit)
             
         Returns:
             Document dictionary with text content
         """
         try:
-            text = self._extract_text_file(file_path)
+            char_limit = self._char_limit(preview_only, char_limit)
+            text = self._extract_text_file(
+                file_path, max_chars=char_limit + 1 if preview_only else None, source=source
+            )
             
             if not text:
                 return {
@@ -456,9 +1359,10 @@ class DocumentLoader:
                 }
             
             # Truncate if too long
-            if len(text) > self.MAX_CHARS_EXTRACT:
-                text = text[:self.MAX_CHARS_EXTRACT]
-                text += "\n\n[TRUNCATED - file continues]"
+            if char_limit and len(text) > char_limit:
+                text = text[:char_limit]
+                if not preview_only:
+                    text += "\n\n[TRUNCATED - file continues]"
             
             return {
                 'filename': file_path.name,
@@ -522,6 +1426,9 @@ class DocumentLoader:
         """
         ext = file_path.suffix.lower()
         
+        if is_virtual_path(file_path):
+            return self._extract_document(file_path).get('content', '')
+        
         if ext == '.pdf':
             return self._extract_pdf_text(file_path)
         elif ext in ['.docx', '.doc']:
@@ -532,69 +1439,79 @@ class DocumentLoader:
             return self._extract_json_text(file_path)
         elif ext == '.html':
             return self._extract_html_text(file_path)
+        elif ext in EMAIL_FORMATS:
+            try:
+                return format_email_text(parse_email_file(file_path))
+            except Exception:
+                return ""
         else:
             return ""
     
     def _extract_pdf_text(self, file_path: Path) -> str:
         """
         Extract text from PDF using multiple methods
-        Tries PyMuPDF first, falls back to pdfplumber, then PyPDF2
+        Tiered PyMuPDF/pdfplumber per page, then PyPDF2 as a last resort
         """
         text = ""
         
-        # Method 1: PyMuPDF (fitz) - fastest and most reliable
-        try:
-            with fitz.open(file_path) as doc:
-                text = ""
-                for page in doc:
-                    text += page.get_text()
-                
-                if text.strip():
-                    return text
-        except Exception as e:
-            pass
-        
-        # Method 2: pdfplumber - good for tables and complex layouts
+        # Methods 1 & 2: PyMuPDF per page, pdfplumber for low-yield pages
         try:
-            with pdfplumber.open(file_path) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-                
-                if text.strip():
-                    return text
+            extraction = self._extract_pdf_pages(file_path)
+            text = "\n".join(page['text'] for page in extraction['pages'] if page['text'])
+            
+            if text.strip():
+                return text
         except Exception as e:
             pass
         
         # Method 3: PyPDF2 - fallback
         try:
-            with open(file_path, 'rb', encoding = 'utf-8') as f:
+            with open(file_path, 'rb') as f:
                 pdf_reader = PyPDF2.PdfReader(f)
                 text = ""
                 for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
+                    text += (page.extract_text() or "") + "\n"
                 
                 return text
         except Exception as e:
             return ""
     
-    def _extract_docx_text(self, file_path: Path) -> str:
-        """Extract text from Word document"""
+    def _extract_docx_text(self, file_path: Path, max_chars: Optional[int] = None,
+                           source: Optional[SourceFile] = None) -> str:
+        """
+        Extract text from Word document
+        
+        Streams body, tables, notes, headers and footers straight from the
+        zip; python-docx (body paragraphs only) is the fallback for files
+        the streaming parser rejects.
+        """
+        in_memory = source is not None and source.has_data
+        
+        try:
+            return extract_docx_text(source.open() if in_memory else file_path, max_chars=max_chars)
+        except Exception:
+            pass
+        
         try:
             from docx import Document
-            doc = Document(file_path)
+            doc = Document(source.open() if in_memory else file_path)
             text = "\n".join([para.text for para in doc.paragraphs])
             return text
         except Exception as e:
             return ""
     
-    def _extract_text_file(self, file_path: Path) -> str:
-        """Extract text from plain text file"""
+    def _extract_text_file(self, file_path: Path, max_chars: Optional[int] = None,
+                           source: Optional[SourceFile] = None) -> str:
+        """Extract text from plain text file (optionally only the first max_chars)"""
         try:
+            if source is not None and source.has_data:
+                # Same decoding and newline handling as reading in text mode
+                data = source.data[:max_chars * 4] if max_chars else source.data
+                text = data.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+                return text[:max_chars] if max_chars else text
+            
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                return f.read()
+                return f.read(max_chars) if max_chars else f.read()
         except Exception as e:
             return ""
     
@@ -620,14 +1537,21 @@ class DocumentLoader:
     
     def _generate_doc_id(self, file_path: Path) -> str:
         """
-        Generate unique document ID from file path
+        Generate canonical document ID from file content
+        
+        Shared by every store (see utils.ingestion.canonical_doc_id); files
+        read this session or recorded in the extraction cache are not re-read.
         
         Args:
             file_path: Path to file
             
         Returns:
-            SHA256 hash of file path
+            First 16 hex chars of the content SHA-256 (path hash if unreadable)
         """
+        content_hash = self.content_hash(Path(file_path))
+        if content_hash is not None:
+            return canonical_doc_id(content_hash)
+        
         path_str = str(file_path)
         return hashlib.sha256(path_str.encode()).hexdigest()[:16]
     
@@ -695,6 +1619,32 @@ class DocumentLoader:
         print(f"\n💾 Document index saved: {output_file}")
 
 
+# ============================================================================
+# PROCESS POOL WORKERS
+# ============================================================================
+
+_WORKER_LOADER = None
+
+
+def _init_loader_worker(settings: Dict, page_store_dir: Optional[str] = None,
+                        ocr_queue_db: Optional[str] = None):
+    """Create the per-process loader used by extraction workers"""
+    global _WORKER_LOADER
+    _WORKER_LOADER = DocumentLoader(config=None)
+    _WORKER_LOADER.apply_worker_settings(settings)
+    if page_store_dir:
+        _WORKER_LOADER.page_store = PageStore(page_store_dir)
+    if ocr_queue_db:
+        # Read-only use: finished OCR text is merged into new extractions
+        _WORKER_LOADER.ocr_queue = OCRQueue(ocr_queue_db)
+
+
+def _load_document_in_worker(task) -> Optional[Dict]:
+    """Extract a single (file_path, preview_only) task inside a worker process"""
+    file_path, preview_only = task
+    return _WORKER_LOADER.load_document(Path(file_path), preview_only)
+
+
 if __name__ == "__main__":
     # Test document loader
     from src.core.config import Config
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Streaming DOCX Extractor for Lismore Litigation Intelligence System
+Reads WordprocessingML parts straight from the zip - no document object model
+British English throughout
+
+Location: src/utils/docx_extractor.py
+"""
+
+import re
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional, Union
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as etree
+    LXML_AVAILABLE = False
+
+
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+TAG_P = W_NS + 'p'
+TAG_R = W_NS + 'r'
+TAG_T = W_NS + 't'
+TAG_TAB = W_NS + 'tab'
+TAG_BR = W_NS + 'br'
+TAG_CR = W_NS + 'cr'
+TAG_TBL = W_NS + 'tbl'
+TAG_TR = W_NS + 'tr'
+TAG_TC = W_NS + 'tc'
+
+
+def _part_number(name: str) -> int:
+    match = re.search(r'(\d+)\.xml$', name)
+    return int(match.group(1)) if match else 0
+
+
+def docx_text_parts(archive: zipfile.ZipFile) -> List[str]:
+    """
+    Text-bearing parts in reading order
+
+    Body first, then notes, then headers and footers (which repeat
+    on every page, so they matter least for triage).
+    """
+    names = set(archive.namelist())
+    parts = [n for n in ('word/document.xml', 'word/footnotes.xml', 'word/endnotes.xml') if n in names]
+    for prefix in ('word/header', 'word/footer'):
+        parts.extend(sorted(
+            (n for n in names if n.startswith(prefix) and n.endswith('.xml')),
+            key=_part_number
+        ))
+    return parts
+
+
+def _release(elem, parent):
+    """Free a processed element and detach it so the tree never grows"""
+    elem.clear()
+    if parent is not None:
+        parent.remove(elem)
+
+
+def iter_part_blocks(stream) -> Iterator[str]:
+    """
+    Stream text blocks from one WordprocessingML part
+
+    Body paragraphs come out one per block; each table row comes out as
+    one block with cells joined by ' | '. Nested tables are flattened
+    into their enclosing cell. Deleted revisions (w:delText) and field
+    codes (w:instrText) are skipped.
+
+    Args:
+        stream: Binary file object for the XML part
+
+    Yields:
+        Text blocks in document order
+    """
+    runs: List[str] = []
+    tables: List[dict] = []  # stack of {'row': [...], 'cell': [...]}
+    open_elements = []       # ancestors of the current element
+
+    for event, elem in etree.iterparse(stream, events=('start', 'end')):
+        tag = elem.tag
+
+        if event == 'start':
+            open_elements.append(elem)
+            if tag == TAG_TBL:
+                tables.append({'row': [], 'cell': []})
+            elif tag == TAG_TR and tables:
+                tables[-1]['row'] = []
+            elif tag == TAG_TC and tables:
+                tables[-1]['cell'] = []
+            continue
+
+        open_elements.pop()
+        parent = open_elements[-1] if open_elements else None
+
+        if tag == TAG_T:
+            if elem.text:
+                runs.append(elem.text)
+        elif tag == TAG_TAB and parent is not None and parent.tag == TAG_R:
+            # w:tab is also a tab-stop definition under w:pPr/w:tabs
+            runs.append('\t')
+        elif tag in (TAG_BR, TAG_CR):
+            runs.append('\n')
+        elif tag == TAG_P:
+            text = ''.join(runs)
+            runs = []
+            if tables:
+                if text:
+                    tables[-1]['cell'].append(text)
+            else:
+                if text.strip():
+                    yield text
+                _release(elem, parent)
+        elif tag == TAG_TC and tables:
+            tables[-1]['row'].append('\n'.join(tables[-1]['cell']).strip())
+            tables[-1]['cell'] = []
+        elif tag == TAG_TR and tables:
+            row = [cell for cell in tables[-1]['row'] if cell]
+            tables[-1]['row'] = []
+            if row:
+                row_text = ' | '.join(row)
+                if len(tables) > 1:
+                    tables[-2]['cell'].append(row_text)
+                else:
+                    yield row_text
+        elif tag == TAG_TBL and tables:
+            tables.pop()
+            if not tables:
+                _release(elem, parent)
+
+
+def iter_docx_blocks(file_path: Union[Path, BinaryIO]) -> Iterator[str]:
+    """
+    Stream text blocks from every text-bearing part of a DOCX file
+
+    Identical header/footer parts (common with multiple sections) are
+    emitted once.
+
+    Raises:
+        zipfile.BadZipFile if the file is not a DOCX (e.g. legacy .doc)
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        seen_furniture = set()
+
+        for part in docx_text_parts(archive):
+            is_furniture = part.startswith(('word/header', 'word/footer'))
+            with archive.open(part) as stream:
+                if not is_furniture:
+                    yield from iter_part_blocks(stream)
+                    continue
+
+                blocks = list(iter_part_blocks(stream))
+
+            key = '\n'.join(blocks)
+            if key and key not in seen_furniture:
+                seen_furniture.add(key)
+                yield from blocks
+
+
+def extract_docx_text(file_path: Union[Path, BinaryIO], max_chars: Optional[int] = None) -> str:
+    """
+    Extract text from a DOCX file in a single streaming pass
+
+    Args:
+        file_path: Path to .docx, or a binary stream over its bytes
+        max_chars: Stop once this many characters are collected (None = all)
+
+    Returns:
+        Extracted text (paragraphs and table rows separated by newlines)
+    """
+    blocks = []
+    total = 0
+
+    for block in iter_docx_blocks(file_path):
+        blocks.append(block)
+        total += len(block) + 1
+        if max_chars and total >= max_chars:
+            break
+
+    return '\n'.join(blocks)
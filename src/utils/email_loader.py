@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Email Loader for Lismore Litigation Intelligence System
+Pure-Python parsing of .eml and Outlook .msg files - no Outlook needed
+British English throughout
+
+Location: src/utils/email_loader.py
+"""
+
+import hashlib
+import io
+import re
+from email import policy
+from email.parser import BytesParser
+from email.utils import getaddresses, parseaddr, parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utils.docx_extractor import extract_docx_text
+
+try:
+    import extract_msg
+    EXTRACT_MSG_AVAILABLE = True
+except ImportError:
+    EXTRACT_MSG_AVAILABLE = False
+
+try:
+    import fitz  # PyMuPDF
+    FITZ_AVAILABLE = True
+except ImportError:
+    FITZ_AVAILABLE = False
+
+try:
+    from bs4 import BeautifulSoup
+    BS4_AVAILABLE = True
+except ImportError:
+    BS4_AVAILABLE = False
+
+
+EMAIL_FORMATS = {'.eml', '.msg'}
+
+# Attachment types whose text is worth extracting
+TEXT_ATTACHMENTS = {'.txt', '.csv', '.md', '.json', '.xml', '.htm', '.html'}
+
+MAX_ATTACHMENT_BYTES = 50 * 1024 * 1024
+
+
+def fallback_message_id(sender_email: str, subject: str, sent_time: str, body: str) -> str:
+    """
+    Message ID for mail without a Message-ID header
+
+    Only used when the header is missing, so it is stable across re-runs of
+    this loader but does not match the ids extract_emails_overnightpy
+    writes (that script hashes every message, with Outlook's own SentOn
+    formatting).
+    """
+    unique_string = f"{sender_email}|{subject}|{sent_time}|{body[:200]}"
+    return hashlib.md5(unique_string.encode()).hexdigest()
+
+
+def html_to_text(html: str) -> str:
+    """Plain text from an HTML body"""
+    if BS4_AVAILABLE:
+        return BeautifulSoup(html, 'html.parser').get_text('\n')
+    text = re.sub(r'(?is)<(script|style).*?</\1>', ' ', html)
+    text = re.sub(r'(?i)<br\s*/?>|</p>|</div>', '\n', text)
+    return re.sub(r'<[^>]+>', ' ', text)
+
+
+def _split_references(value: str) -> List[str]:
+    return re.findall(r'<[^>]+>', value or '')
+
+
+def extract_attachment_text(filename: str, data: bytes,
+                            max_chars: Optional[int] = None) -> str:
+    """
+    Best-effort text from an attachment's bytes
+
+    Handles PDF (PyMuPDF), DOCX, plain text/HTML and nested emails.
+    Anything else (images, spreadsheets, archives) returns ''.
+    """
+    if not data or len(data) > MAX_ATTACHMENT_BYTES:
+        return ''
+
+    suffix = Path(filename or '').suffix.lower()
+
+    try:
+        if suffix == '.pdf' and FITZ_AVAILABLE:
+            parts = []
+            total = 0
+            with fitz.open(stream=data, filetype='pdf') as pdf:
+                for page in pdf:
+                    text = page.get_text() or ''
+                    parts.append(text)
+                    total += len(text)
+                    if max_chars and total >= max_chars:
+                        break
+            text = '\n'.join(parts)
+
+        elif suffix == '.docx':
+            text = extract_docx_text(io.BytesIO(data), max_chars=max_chars)
+
+        elif suffix in ('.htm', '.html'):
+            text = html_to_text(data.decode('utf-8', errors='ignore'))
+
+        elif suffix in TEXT_ATTACHMENTS:
+            text = data.decode('utf-8', errors='ignore')
+
+        elif suffix in EMAIL_FORMATS:
+            nested = parse_email_bytes(data, suffix, include_attachments=False)
+            text = format_email_text(nested)
+
+        else:
+            return ''
+    except Exception:
+        return ''
+
+    return text[:max_chars] if max_chars else text
+
+
+# ============================================================================
+# .EML
+# ============================================================================
+
+def _parse_eml(data: bytes, include_attachments: bool,
+               attachment_chars: Optional[int]) -> Dict:
+    message = BytesParser(policy=policy.default).parsebytes(data)
+
+    body = ''
+    body_part = message.get_body(preferencelist=('plain', 'html'))
+    if body_part is not None:
+        try:
+            body = body_part.get_content()
+        except (LookupError, ValueError):
+            body = body_part.get_payload(decode=True).decode('utf-8', errors='ignore')
+        if body_part.get_content_type() == 'text/html':
+            body = html_to_text(body)
+
+    attachments = []
+    for part in message.iter_attachments():
+        filename = part.get_filename() or ''
+        if part.get_content_type() == 'message/rfc822' and not filename:
+            filename = 'attached_message.eml'
+        try:
+            if part.get_content_type() == 'message/rfc822':
+                payload = part.get_payload(0).as_bytes() if part.is_multipart() else part.get_payload(decode=True)
+            else:
+                payload = part.get_payload(decode=True) or b''
+        except Exception:
+            payload = b''
+
+        attachments.append({
+            'filename': filename,
+            'size': len(payload or b''),
+            'text': extract_attachment_text(filename, payload, attachment_chars) if include_attachments else ''
+        })
+
+    sender_name, sender_email = parseaddr(str(message.get('From', '')))
+
+    sent_time = ''
+    if message.get('Date'):
+        try:
+            sent_time = parsedate_to_datetime(str(message['Date'])).isoformat()
+        except (TypeError, ValueError):
+            sent_time = str(message['Date'])
+
+    return {
+        'message_id': str(message.get('Message-ID', '')).strip(),
+        'in_reply_to': ' '.join(_split_references(str(message.get('In-Reply-To', '')))),
+        'references': _split_references(str(message.get('References', ''))),
+        'subject': str(message.get('Subject', '')),
+        'sender_name': sender_name,
+        'sender_email': sender_email,
+        'recipients': [addr for _, addr in getaddresses([str(v) for v in message.get_all('To', [])]) if addr],
+        'cc': [addr for _, addr in getaddresses([str(v) for v in message.get_all('Cc', [])]) if addr],
+        'sent_time': sent_time,
+        'body': body,
+        'attachments': attachments
+    }
+
+
+# ============================================================================
+# .MSG (OLE compound file)
+# ============================================================================
+
+def _parse_msg(data: bytes, include_attachments: bool,
+               attachment_chars: Optional[int]) -> Dict:
+    if not EXTRACT_MSG_AVAILABLE:
+        raise ImportError("extract_msg not installed - pip install extract-msg")
+
+    msg = extract_msg.openMsg(data) if hasattr(extract_msg, 'openMsg') else extract_msg.Message(data)
+    try:
+        body = msg.body or ''
+        if not body.strip() and getattr(msg, 'htmlBody', None):
+            html = msg.htmlBody
+            body = html_to_text(html.decode('utf-8', errors='ignore') if isinstance(html, bytes) else html)
+
+        # Transport headers carry the threading fields when present
+        header = getattr(msg, 'header', None)
+        in_reply_to = str(header.get('In-Reply-To', '')) if header is not None else ''
+        references = str(header.get('References', '')) if header is not None else ''
+
+        attachments = []
+        for attachment in getattr(msg, 'attachments', []) or []:
+            filename = (getattr(attachment, 'longFilename', None)
+                        or getattr(attachment, 'shortFilename', None) or '')
+            payload = getattr(attachment, 'data', None)
+            if not isinstance(payload, (bytes, bytearray)):
+                # Embedded message - take its text directly
+                text = ''
+                if payload is not None and include_attachments:
+                    text = f"Subject: {getattr(payload, 'subject', '')}\n\n{getattr(payload, 'body', '') or ''}"
+                attachments.append({'filename': filename or 'attached_message.msg',
+                                    'size': len(text), 'text': text})
+                continue
+
+            attachments.append({
+                'filename': filename,
+                'size': len(payload),
+                'text': extract_attachment_text(filename, bytes(payload), attachment_chars) if include_attachments else ''
+            })
+
+        sender_name, sender_email = parseaddr(msg.sender or '')
+
+        sent_time = ''
+        if msg.date:
+            sent_time = msg.date.isoformat() if hasattr(msg.date, 'isoformat') else str(msg.date)
+
+        return {
+            'message_id': (getattr(msg, 'messageId', None) or '').strip(),
+            'in_reply_to': ' '.join(_split_references(in_reply_to)),
+            'references': _split_references(references),
+            'subject': msg.subject or '',
+            'sender_name': sender_name,
+            'sender_email': sender_email,
+            'recipients': [addr for _, addr in getaddresses([msg.to or '']) if addr],
+            'cc': [addr for _, addr in getaddresses([msg.cc or '']) if addr],
+            'sent_time': sent_time,
+            'body': body,
+            'attachments': attachments
+        }
+    finally:
+        try:
+            msg.close()
+        except Exception:
+            pass
+
+
+# ============================================================================
+# PUBLIC API
+# ============================================================================
+
+def parse_email_bytes(data: bytes, suffix: str,
+                      include_attachments: bool = True,
+                      attachment_chars: Optional[int] = None) -> Dict:
+    """
+    Parse an email from its bytes
+
+    Args:
+        data: Raw file bytes
+        suffix: '.eml' or '.msg'
+        include_attachments: Extract attachment text (names are always listed)
+        attachment_chars: Per-attachment character cap
+
+    Returns:
+        Dict with message_id, in_reply_to, references, subject, sender_name,
+        sender_email, recipients, cc, sent_time, body, attachments
+        [{filename, size, text}]
+
+    Raises:
+        ImportError for .msg when extract_msg is not installed
+    """
+    if suffix.lower() == '.msg':
+        email_data = _parse_msg(data, include_attachments, attachment_chars)
+    else:
+        email_data = _parse_eml(data, include_attachments, attachment_chars)
+
+    if not email_data['message_id']:
+        email_data['message_id'] = fallback_message_id(
+            email_data['sender_email'], email_data['subject'],
+            email_data['sent_time'], email_data['body']
+        )
+
+    return email_data
+
+
+def parse_email_file(file_path: Path, data: Optional[bytes] = None, **kwargs) -> Dict:
+    """Parse an .eml/.msg file (pass data to avoid re-reading it)"""
+    file_path = Path(file_path)
+    if data is None:
+        data = file_path.read_bytes()
+    return parse_email_bytes(data, file_path.suffix, **kwargs)
+
+
+def format_email_text(email_data: Dict) -> str:
+    """Render a parsed email as document text (headers, body, attachments)"""
+    sender = email_data['sender_email']
+    if email_data['sender_name'] and email_data['sender_name'] != sender:
+        sender = f"{email_data['sender_name']} <{sender}>" if sender else email_data['sender_name']
+
+    lines = [
+        f"From: {sender}",
+        f"To: {', '.join(email_data['recipients'])}",
+    ]
+    if email_data['cc']:
+        lines.append(f"Cc: {', '.join(email_data['cc'])}")
+    lines.append(f"Date: {email_data['sent_time']}")
+    lines.append(f"Subject: {email_data['subject']}")
+
+    if email_data['attachments']:
+        names = ', '.join(a['filename'] or '(unnamed)' for a in email_data['attachments'])
+        lines.append(f"Attachments: {names}")
+
+    lines.append('')
+    lines.append(email_data['body'].strip())
+
+    for attachment in email_data['attachments']:
+        if attachment['text'].strip():
+            lines.append('')
+            lines.append(f"[ATTACHMENT: {attachment['filename']}]")
+            lines.append(attachment['text'].strip())
+
+    return '\n'.join(lines)
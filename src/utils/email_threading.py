@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Email Threading for Lismore Litigation Intelligence System
+Rebuilds conversation trees and collapses quoted reply history
+British English throughout
+
+Location: src/utils/email_threading.py
+"""
+
+import hashlib
+import json
+import re
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+# Subject prefixes added by mail clients (English and common European)
+SUBJECT_PREFIX = re.compile(r'^\s*((re|fw|fwd|aw|wg|sv|vs|tr|rif|antw)\s*(\[\d+\])?\s*:\s*)+', re.IGNORECASE)
+
+# Lines that start the quoted copy of an earlier message
+REPLY_MARKERS = [
+    re.compile(r'^\s*-{2,}\s*Original Message\s*-{2,}\s*$', re.IGNORECASE),
+    re.compile(r'^\s*_{10,}\s*$'),                                   # Outlook separator
+    re.compile(r'^\s*On .{4,200}(wrote|writes):\s*$', re.IGNORECASE),
+    re.compile(r'^\s*From:\s.+$', re.IGNORECASE),                    # Outlook header block
+    re.compile(r'^\s*Begin forwarded message:\s*$', re.IGNORECASE),
+    re.compile(r'^\s*-{2,}\s*Forwarded message\s*-{2,}\s*$', re.IGNORECASE),
+]
+
+# Outlook header block needs a second header line to count as a marker
+OUTLOOK_HEADER_FOLLOW = re.compile(r'^\s*(Sent|Date|To|Subject):\s', re.IGNORECASE)
+
+ATTACHMENT_MARKER = '\n\n[ATTACHMENT: '
+
+
+def normalise_subject(subject: str) -> str:
+    """Subject without RE:/FW: prefixes, case or surrounding whitespace"""
+    return ' '.join(SUBJECT_PREFIX.sub('', subject or '').lower().split())
+
+
+def strip_quoted_text(body: str) -> Tuple[str, int]:
+    """
+    Keep only the novel part of an email body
+
+    Cuts at the first reply/forward marker and drops '>'-quoted lines.
+
+    Args:
+        body: Message body
+
+    Returns:
+        Tuple of (novel text, characters removed)
+    """
+    lines = body.splitlines()
+    kept = []
+
+    for i, line in enumerate(lines):
+        marker = next((m for m in REPLY_MARKERS if m.match(line)), None)
+        if marker is not None:
+            if marker is not REPLY_MARKERS[3]:
+                break
+            following = lines[i + 1:i + 4]
+            if any(OUTLOOK_HEADER_FOLLOW.match(f) for f in following):
+                break
+        if line.lstrip().startswith('>'):
+            continue
+        kept.append(line)
+
+    novel = '\n'.join(kept).rstrip()
+    return novel, max(0, len(body) - len(novel))
+
+
+def split_email_text(content: str) -> Tuple[str, str, str]:
+    """
+    Split loader email text into (headers, body, attachments)
+
+    Relies on the layout produced by email_loader.format_email_text.
+    """
+    header, sep, rest = content.partition('\n\n')
+    if not sep:
+        return content, '', ''
+
+    body, marker, attachments = rest.partition(ATTACHMENT_MARKER)
+    return header, body, (marker + attachments) if marker else ''
+
+
+def collapse_email_content(content: str) -> Tuple[str, int]:
+    """
+    Email text with quoted history removed from the body
+
+    Returns:
+        Tuple of (collapsed text, characters removed)
+    """
+    header, body, attachments = split_email_text(content)
+    novel, removed = strip_quoted_text(body)
+    if not removed:
+        return content, 0
+    return f"{header}\n\n{novel}{attachments}", removed
+
+
+def sent_time_key(sent_time: str) -> Tuple[int, datetime]:
+    """
+    Sort key for a message's sent time, normalised to UTC
+
+    ISO strings carrying different UTC offsets do not order correctly as
+    text, so the time is parsed first. Naive times are taken as UTC; missing
+    or unparsable dates sort before every dated message.
+    """
+    parsed = None
+    if sent_time:
+        try:
+            parsed = datetime.fromisoformat(sent_time.strip())
+        except ValueError:
+            try:
+                parsed = parsedate_to_datetime(sent_time)
+            except (TypeError, ValueError, IndexError):
+                parsed = None
+
+    if parsed is None:
+        return 0, datetime.min.replace(tzinfo=timezone.utc)
+    if parsed.tzinfo is None:
+        return 1, parsed.replace(tzinfo=timezone.utc)
+    return 1, parsed.astimezone(timezone.utc)
+
+
+def is_email_document(doc: Dict) -> bool:
+    return doc.get('metadata', {}).get('doc_type') == 'email'
+
+
+class EmailThreader:
+    """
+    Conversation trees over ingested emails
+
+    Purpose:
+        - Reply chains repeat the same quoted history in every message;
+          each copy would otherwise be triaged, embedded and analysed
+        - Thread structure tells analysis who replied to what, and when
+
+    Strategy:
+        - Parent from In-Reply-To, else the last References entry
+        - Messages with neither fall back to a subject heuristic: same
+          normalised subject and a shared participant, latest earlier
+          message wins
+        - message_id is the Message-ID header, or the loader's
+          fallback_message_id() hash for mail without one
+        - Quoted history is only dropped for analysis when the quoted
+          message is itself in the corpus, so no text is ever lost
+    """
+
+    def __init__(self):
+        self.messages: Dict[str, Dict] = {}   # message_id -> message record
+        self.threads: Dict[str, List[str]] = {}
+        self._parents: Dict[str, Optional[str]] = {}
+
+        self.stats = {
+            'emails_seen': 0,
+            'chars_before': 0,
+            'chars_after': 0
+        }
+
+    # ========================================================================
+    # INGEST
+    # ========================================================================
+
+    def add_document(self, doc: Dict) -> Dict:
+        """
+        Register an email and return it with quoted history collapsed
+
+        Non-email documents are returned unchanged. During triage every
+        reply is collapsed; the full text stays in the loader for
+        rehydration (see collapse_for_analysis).
+
+        Args:
+            doc: Loader document
+
+        Returns:
+            Document (a copy when the content was changed)
+        """
+        if not is_email_document(doc):
+            return doc
+
+        metadata = doc.get('metadata', {})
+        message_id = metadata.get('message_id') or doc.get('doc_id', '')
+        content = doc.get('content', '') or ''
+
+        self.messages[message_id] = {
+            'message_id': message_id,
+            'doc_id': doc.get('doc_id', ''),
+            'filename': doc.get('filename', ''),
+            'subject': metadata.get('subject', ''),
+            'normalised_subject': normalise_subject(metadata.get('subject', '')),
+            'sender_email': (metadata.get('sender_email') or '').lower(),
+            'participants': sorted({
+                p.lower() for p in [metadata.get('sender_email', '')]
+                + list(metadata.get('recipients', [])) + list(metadata.get('cc', [])) if p
+            }),
+            'sent_time': metadata.get('sent_time', ''),
+            'in_reply_to': metadata.get('in_reply_to', ''),
+            'references': list(metadata.get('references', [])),
+        }
+        self._parents = {}
+
+        collapsed, removed = collapse_email_content(content)
+        self.stats['emails_seen'] += 1
+        self.stats['chars_before'] += len(content)
+        self.stats['chars_after'] += len(collapsed)
+
+        if not removed:
+            return doc
+
+        doc = doc.copy()
+        doc['content'] = collapsed
+        doc['metadata'] = {**metadata, 'quoted_chars_removed': removed}
+        return doc
+
+    def remove_documents(self, doc_ids: List[str]):
+        """Forget messages whose source documents are stale"""
+        stale = set(doc_ids)
+        self.messages = {
+            mid: m for mid, m in self.messages.items() if m['doc_id'] not in stale
+        }
+        self._parents = {}
+
+    # ========================================================================
+    # THREADING
+    # ========================================================================
+
+    def _resolve_parents(self) -> Dict[str, Optional[str]]:
+        if self._parents:
+            return self._parents
+
+        parents = {}
+        by_subject: Dict[str, List[Dict]] = {}
+        for message in self.messages.values():
+            by_subject.setdefault(message['normalised_subject'], []).append(message)
+        for group in by_subject.values():
+            group.sort(key=lambda m: sent_time_key(m['sent_time']))
+
+        for message_id, message in self.messages.items():
+            parent = None
+
+            # Header-based parent (may point outside the corpus)
+            if message['in_reply_to']:
+                parent = message['in_reply_to'].split()[-1]
+            elif message['references']:
+                parent = message['references'][-1]
+
+            if parent is None and message['normalised_subject']:
+                participants = set(message['participants'])
+                for candidate in by_subject[message['normalised_subject']]:
+                    if candidate['message_id'] == message_id:
+                        break
+                    if participants & set(candidate['participants']):
+                        parent = candidate['message_id']
+
+            parents[message_id] = parent if parent != message_id else None
+
+        self._parents = parents
+        return parents
+
+    def parent_in_corpus(self, message_id: str) -> bool:
+        """True if the message's parent was ingested too"""
+        parent = self._resolve_parents().get(message_id)
+        return parent is not None and parent in self.messages
+
+    def _thread_root(self, message_id: str, parents: Dict[str, Optional[str]]) -> str:
+        seen = set()
+        current = message_id
+        while current not in seen:
+            seen.add(current)
+            parent = parents.get(current)
+            if parent is None:
+                return current
+            if parent not in self.messages:
+                return parent      # root is a message we never saw
+            current = parent
+        return current
+
+    def build_threads(self) -> Dict[str, List[str]]:
+        """
+        Group messages into conversations
+
+        Returns:
+            thread_id -> message_ids ordered by sent time
+        """
+        parents = self._resolve_parents()
+        threads: Dict[str, List[str]] = {}
+
+        for message_id in self.messages:
+            root = self._thread_root(message_id, parents)
+            thread_id = hashlib.md5(root.encode()).hexdigest()[:16]
+            threads.setdefault(thread_id, []).append(message_id)
+
+        for message_ids in threads.values():
+            message_ids.sort(key=lambda mid: sent_time_key(self.messages[mid]['sent_time']))
+
+        self.threads = threads
+        return threads
+
+    def collapse_for_analysis(self, doc: Dict) -> Dict:
+        """
+        Collapse quoted history of a fully loaded email if its parent is present
+
+        Replies whose parent never made it into the corpus keep their quoted
+        text - it is the only copy of that earlier message.
+        """
+        if not is_email_document(doc):
+            return doc
+
+        metadata = doc.get('metadata', {})
+        message_id = metadata.get('message_id') or doc.get('doc_id', '')
+        if not self.parent_in_corpus(message_id):
+            return doc
+
+        collapsed, removed = collapse_email_content(doc.get('content', '') or '')
+        if not removed:
+            return doc
+
+        doc = doc.copy()
+        doc['content'] = collapsed
+        doc['metadata'] = {**metadata, 'quoted_chars_removed': removed}
+        return doc
+
+    # ========================================================================
+    # PERSISTENCE
+    # ========================================================================
+
+    def save(self, path: Path):
+        """Write threads and message records to JSON"""
+        threads = self.build_threads()
+        parents = self._resolve_parents()
+
+        thread_of = {mid: tid for tid, mids in threads.items() for mid in mids}
+        messages = []
+        for message_id, message in self.messages.items():
+            messages.append({
+                **message,
+                'thread_id': thread_of.get(message_id),
+                'parent_message_id': parents.get(message_id),
+                'parent_in_corpus': self.parent_in_corpus(message_id)
+            })
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'thread_count': len(threads),
+                'message_count': len(messages),
+                'threads': threads,
+                'messages': messages
+            }, f, indent=2, ensure_ascii=False)
+
+    def load(self, path: Path) -> bool:
+        """Load message records saved by save() (for incremental runs)"""
+        path = Path(path)
+        if not path.exists():
+            return False
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        for message in data.get('messages', []):
+            record = {k: v for k, v in message.items()
+                      if k not in ('thread_id', 'parent_message_id', 'parent_in_corpus')}
+            self.messages[record['message_id']] = record
+        self._parents = {}
+        return True
+
+    def get_statistics(self) -> Dict:
+        threads = self.threads or self.build_threads()
+        before = self.stats['chars_before']
+        after = self.stats['chars_after']
+        return {
+            'emails': len(self.messages),
+            'threads': len(threads),
+            'largest_thread': max((len(m) for m in threads.values()), default=0),
+            'chars_before': before,
+            'chars_after': after,
+            'reduction_percent': round(100 * (before - after) / before, 1) if before else 0.0
+        }
+
+    def print_stats(self):
+        stats = self.get_statistics()
+        if not stats['emails']:
+            return
+        print(f"\n📧 Email threading: {stats['emails']:,} emails in {stats['threads']:,} threads "
+              f"(largest {stats['largest_thread']})")
+        print(f"   Quoted history collapsed: {stats['chars_before']:,} → {stats['chars_after']:,} chars "
+              f"({stats['reduction_percent']}% less)")
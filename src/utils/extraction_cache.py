@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+"""
+Extraction Cache for Lismore Litigation Intelligence System
+Persistent content-addressed cache of extracted document text
+British English throughout
+
+Location: src/utils/extraction_cache.py
+"""
+
+import json
+import zlib
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Dict, Optional, Any
+from datetime import datetime
+
+from utils.archive_reader import source_stat
+from utils.ingestion import hash_file
+
+
+class ExtractionCache:
+    """
+    On-disk cache of DocumentLoader extraction results
+
+    Purpose:
+        - Skip re-extracting unchanged PDFs on every pass1/phase0/search run
+        - Survive crashes and prompt changes (extraction is independent of both)
+        - Stay within a fixed disk budget
+
+    Strategy:
+        - Entries keyed by (file size, content hash, extractor version, limits)
+        - Path index records (size, mtime) -> content hash so unchanged files
+          are never re-hashed; a changed size or mtime forces a fresh hash
+        - Documents stored as zlib-compressed JSON in SQLite (WAL mode)
+        - Least-recently-used entries evicted beyond max_size_mb
+    """
+
+    def __init__(self, cache_dir: Path, max_size_mb: int = 2048):
+        """
+        Initialise extraction cache
+
+        Args:
+            cache_dir: Directory holding the cache database
+            max_size_mb: Compressed payload budget before LRU eviction
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / "extraction_cache.db"
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+
+        self._conn = None
+        self._init_database()
+        self._total_bytes = self._query_total_bytes()
+
+        # Session statistics
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'evictions': 0,
+            'hashes_computed': 0,
+            'hashes_reused': 0
+        }
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get (lazily opened) database connection"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
+
+    def _init_database(self):
+        """Create cache tables"""
+        conn = self._get_connection()
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS path_index (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                content_hash TEXT NOT NULL
+            )
+        """)
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS extractions (
+                cache_key TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                extractor_version TEXT,
+                file_type TEXT,
+                payload BLOB NOT NULL,
+                payload_bytes INTEGER NOT NULL,
+                raw_bytes INTEGER NOT NULL,
+                created_date TEXT,
+                last_accessed TEXT,
+                access_count INTEGER DEFAULT 0
+            )
+        """)
+
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_extractions_accessed
+            ON extractions(last_accessed)
+        """)
+
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_extractions_hash
+            ON extractions(content_hash)
+        """)
+
+        conn.commit()
+
+    def _query_total_bytes(self) -> int:
+        row = self._get_connection().execute(
+            "SELECT COALESCE(SUM(payload_bytes), 0) FROM extractions"
+        ).fetchone()
+        return int(row[0])
+
+    # ========================================================================
+    # KEYS
+    # ========================================================================
+
+    def known_hash(self, file_path: Path) -> Optional[str]:
+        """
+        Stored SHA-256 of a file if its size and mtime are unchanged
+
+        Never reads the file - returns None when it would have to.
+        """
+        try:
+            stat = source_stat(file_path)
+        except OSError:
+            return None
+
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT size, mtime_ns, content_hash FROM path_index WHERE path = ?",
+            (str(file_path),)
+        ).fetchone()
+
+        if row and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+            self.stats['hashes_reused'] += 1
+            return row[2]
+
+        return None
+
+    def record_hash(self, file_path: Path, content_hash: str,
+                    size: Optional[int] = None, mtime_ns: Optional[int] = None):
+        """
+        Record a hash computed elsewhere (e.g. while reading for extraction)
+
+        Args:
+            file_path: File the hash belongs to
+            content_hash: SHA-256 hex digest
+            size: Size at read time (stat now if omitted)
+            mtime_ns: Modification time at read time (stat now if omitted)
+        """
+        if size is None or mtime_ns is None:
+            try:
+                stat = source_stat(file_path)
+            except OSError:
+                return
+            size, mtime_ns = stat.st_size, stat.st_mtime_ns
+
+        conn = self._get_connection()
+        conn.execute("""
+            INSERT OR REPLACE INTO path_index (path, size, mtime_ns, content_hash)
+            VALUES (?, ?, ?, ?)
+        """, (str(file_path), size, mtime_ns, content_hash))
+        conn.commit()
+
+    def content_hash(self, file_path: Path) -> Optional[str]:
+        """
+        Get SHA-256 of a file, reusing the stored hash if size and mtime match
+
+        Args:
+            file_path: File to fingerprint
+
+        Returns:
+            Hex digest, or None if the file cannot be read
+        """
+        content_hash = self.known_hash(file_path)
+        if content_hash is not None:
+            return content_hash
+
+        try:
+            stat = source_stat(file_path)
+        except OSError:
+            return None
+
+        content_hash = hash_file(file_path)
+        if content_hash is None:
+            return None
+
+        self.stats['hashes_computed'] += 1
+        self.record_hash(file_path, content_hash, stat.st_size, stat.st_mtime_ns)
+
+        return content_hash
+
+    def cache_key(self, file_path: Path, extractor_version: Any,
+                  limits: Dict, content_hash: Optional[str] = None) -> Optional[str]:
+        """
+        Build cache key for a file under given extractor settings
+
+        Args:
+            file_path: Source file
+            extractor_version: Bumped whenever extraction output changes
+            limits: Char/page limits the extraction ran under
+            content_hash: Hash already computed by the caller (skips lookup)
+
+        Returns:
+            Cache key, or None if the file cannot be fingerprinted
+        """
+        if content_hash is None:
+            content_hash = self.content_hash(file_path)
+        if content_hash is None:
+            return None
+
+        try:
+            size = source_stat(file_path).st_size
+        except OSError:
+            return None
+
+        key_material = json.dumps({
+            'size': size,
+            'content_hash': content_hash,
+            'extractor_version': str(extractor_version),
+            'limits': limits
+        }, sort_keys=True)
+
+        return f"{content_hash[:16]}-{hashlib.sha256(key_material.encode()).hexdigest()[:32]}"
+
+    # ========================================================================
+    # GET / PUT
+    # ========================================================================
+
+    def get(self, cache_key: str) -> Optional[Dict]:
+        """
+        Retrieve cached document
+
+        Args:
+            cache_key: Key from cache_key()
+
+        Returns:
+            Document dictionary or None on miss
+        """
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT payload FROM extractions WHERE cache_key = ?", (cache_key,)
+        ).fetchone()
+
+        if not row:
+            self.stats['misses'] += 1
+            return None
+
+        try:
+            document = json.loads(zlib.decompress(row[0]).decode('utf-8'))
+        except (zlib.error, ValueError):
+            # Corrupt entry - drop it and treat as a miss
+            self.invalidate(cache_key)
+            self.stats['misses'] += 1
+            return None
+
+        conn.execute("""
+            UPDATE extractions
+            SET last_accessed = ?, access_count = access_count + 1
+            WHERE cache_key = ?
+        """, (datetime.now().isoformat(), cache_key))
+        conn.commit()
+
+        self.stats['hits'] += 1
+        return document
+
+    def put(self, cache_key: str, document: Dict, extractor_version: Any = None):
+        """
+        Store extracted document
+
+        Args:
+            cache_key: Key from cache_key()
+            document: Document dictionary from DocumentLoader
+            extractor_version: Recorded for statistics
+        """
+        raw = json.dumps(document, ensure_ascii=False).encode('utf-8')
+        payload = zlib.compress(raw, 6)
+        now = datetime.now().isoformat()
+
+        conn = self._get_connection()
+
+        existing = conn.execute(
+            "SELECT payload_bytes FROM extractions WHERE cache_key = ?", (cache_key,)
+        ).fetchone()
+        if existing:
+            self._total_bytes -= existing[0]
+
+        conn.execute("""
+            INSERT OR REPLACE INTO extractions
+            (cache_key, content_hash, extractor_version, file_type, payload,
+             payload_bytes, raw_bytes, created_date, last_accessed, access_count)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+        """, (
+            cache_key,
+            cache_key.split('-', 1)[0],
+            str(extractor_version) if extractor_version is not None else None,
+            document.get('metadata', {}).get('file_type'),
+            payload,
+            len(payload),
+            len(raw),
+            now,
+            now
+        ))
+        conn.commit()
+
+        self._total_bytes += len(payload)
+        self.stats['stores'] += 1
+
+        if self._total_bytes > self.max_size_bytes:
+            self.evict()
+
+    def invalidate(self, cache_key: str):
+        """Remove a single entry"""
+        conn = self._get_connection()
+        conn.execute("DELETE FROM extractions WHERE cache_key = ?", (cache_key,))
+        conn.commit()
+        self._total_bytes = self._query_total_bytes()
+
+    def invalidate_content(self, content_hash: str) -> int:
+        """
+        Remove every entry extracted from the given bytes (all modes and limits)
+
+        Used when text for a file arrives from elsewhere (e.g. OCR).
+
+        Returns:
+            Number of entries removed
+        """
+        conn = self._get_connection()
+        cursor = conn.execute(
+            "DELETE FROM extractions WHERE content_hash = ?", (content_hash[:16],)
+        )
+        conn.commit()
+        self._total_bytes = self._query_total_bytes()
+        return cursor.rowcount
+
+    def evict(self, target_fraction: float = 0.9) -> int:
+        """
+        Evict least-recently-used entries until under budget
+
+        Args:
+            target_fraction: Fraction of max size to shrink to
+
+        Returns:
+            Number of entries evicted
+        """
+        target_bytes = int(self.max_size_bytes * target_fraction)
+        conn = self._get_connection()
+
+        cursor = conn.execute("""
+            SELECT cache_key, payload_bytes FROM extractions
+            ORDER BY last_accessed ASC
+        """)
+
+        to_delete = []
+        total = self._total_bytes
+        for cache_key, payload_bytes in cursor:
+            if total <= target_bytes:
+                break
+            to_delete.append((cache_key,))
+            total -= payload_bytes
+
+        conn.executemany("DELETE FROM extractions WHERE cache_key = ?", to_delete)
+        conn.commit()
+
+        self._total_bytes = total
+        self.stats['evictions'] += len(to_delete)
+
+        return len(to_delete)
+
+    def clear(self):
+        """Remove all cached extractions (path index is kept)"""
+        conn = self._get_connection()
+        conn.execute("DELETE FROM extractions")
+        conn.commit()
+        conn.execute("VACUUM")
+        self._total_bytes = 0
+
+    def close(self):
+        """Close database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ========================================================================
+    # STATISTICS
+    # ========================================================================
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        conn = self._get_connection()
+
+        entries, payload_bytes, raw_bytes, total_hits = conn.execute("""
+            SELECT COUNT(*), COALESCE(SUM(payload_bytes), 0),
+                   COALESCE(SUM(raw_bytes), 0), COALESCE(SUM(access_count), 0)
+            FROM extractions
+        """).fetchone()
+
+        by_type = dict(conn.execute("""
+            SELECT COALESCE(file_type, 'unknown'), COUNT(*)
+            FROM extractions GROUP BY file_type
+        """).fetchall())
+
+        by_version = dict(conn.execute("""
+            SELECT COALESCE(extractor_version, 'unknown'), COUNT(*)
+            FROM extractions GROUP BY extractor_version
+        """).fetchall())
+
+        oldest, newest = conn.execute(
+            "SELECT MIN(last_accessed), MAX(last_accessed) FROM extractions"
+        ).fetchone()
+
+        indexed_paths = conn.execute("SELECT COUNT(*) FROM path_index").fetchone()[0]
+
+        lookups = self.stats['hits'] + self.stats['misses']
+
+        return {
+            'entries': entries,
+            'indexed_paths': indexed_paths,
+            'size_mb': payload_bytes / (1024 * 1024),
+            'uncompressed_mb': raw_bytes / (1024 * 1024),
+            'max_size_mb': self.max_size_bytes / (1024 * 1024),
+            'compression_ratio': (raw_bytes / payload_bytes) if payload_bytes else 0.0,
+            'lifetime_hits': total_hits,
+            'by_file_type': by_type,
+            'by_extractor_version': by_version,
+            'least_recent_access': oldest,
+            'most_recent_access': newest,
+            'session': dict(self.stats),
+            'session_hit_rate': (self.stats['hits'] / lookups) if lookups else 0.0,
+            'db_path': str(self.db_path)
+        }
+
+    def print_stats(self):
+        """Print cache statistics"""
+        stats = self.get_statistics()
+
+        print(f"\n{'=' * 70}")
+        print(f"EXTRACTION CACHE")
+        print(f"{'=' * 70}")
+        print(f"Location: {stats['db_path']}")
+        print(f"Entries: {stats['entries']:,} ({stats['indexed_paths']:,} paths indexed)")
+        print(f"Size: {stats['size_mb']:.1f} MB / {stats['max_size_mb']:.0f} MB "
+              f"({stats['uncompressed_mb']:.1f} MB uncompressed, "
+              f"{stats['compression_ratio']:.1f}x)")
+        print(f"Lifetime hits: {stats['lifetime_hits']:,}")
+
+        if stats['by_file_type']:
+            print(f"\nBy file type:")
+            for file_type, count in sorted(stats['by_file_type'].items()):
+                print(f"  {file_type}: {count:,}")
+
+        if stats['by_extractor_version']:
+            print(f"\nBy extractor version:")
+            for version, count in sorted(stats['by_extractor_version'].items()):
+                print(f"  {version}: {count:,}")
+
+        if stats['least_recent_access']:
+            print(f"\nLeast recent access: {stats['least_recent_access']}")
+            print(f"Most recent access:  {stats['most_recent_access']}")
+
+        print(f"{'=' * 70}\n")
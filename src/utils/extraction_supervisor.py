@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Extraction Supervisor for Lismore Litigation Intelligence System
+Runs document extraction in killable worker processes
+British English throughout
+
+Location: src/utils/extraction_supervisor.py
+"""
+
+import time
+import signal
+import multiprocessing
+from multiprocessing.connection import wait as wait_connections
+from collections import deque
+from typing import Any, Callable, List, Optional, Tuple
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+def _supervised_worker_main(conn, initializer: Callable, init_args: Tuple, task: Callable):
+    """Worker loop: receive (task_id, arg), send back (task_id, status, payload)"""
+    # Leave Ctrl+C to the supervisor
+    try:
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+    except (ValueError, AttributeError):
+        pass
+
+    if initializer is not None:
+        initializer(*init_args)
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+
+        if message is None:
+            break
+
+        task_id, arg = message
+        try:
+            conn.send((task_id, 'ok', task(arg)))
+        except Exception as e:
+            conn.send((task_id, 'error', f"{type(e).__name__}: {str(e)[:200]}"))
+
+
+def get_process_rss_mb(pid: int) -> Optional[float]:
+    """
+    Resident memory of a process in MB
+
+    Uses psutil when installed, otherwise /proc on Linux.
+    Returns None when neither is available.
+    """
+    if PSUTIL_AVAILABLE:
+        try:
+            return psutil.Process(pid).memory_info().rss / (1024 * 1024)
+        except Exception:
+            return None
+
+    try:
+        with open(f"/proc/{pid}/status", 'r') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+
+    return None
+
+
+class _WorkerHandle:
+    """One supervised worker process and the task it is running"""
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.task_id = None
+        self.arg = None
+        self.started_at = None
+
+    @property
+    def busy(self) -> bool:
+        return self.task_id is not None
+
+    def assign(self, task_id, arg):
+        self.task_id = task_id
+        self.arg = arg
+        self.started_at = time.time()
+        self.conn.send((task_id, arg))
+
+    def release(self):
+        self.task_id = None
+        self.arg = None
+        self.started_at = None
+
+
+class ExtractionSupervisor:
+    """
+    Pool of worker processes with hard per-task limits
+
+    Purpose:
+        - A pathological page can hang inside a PDF library where no
+          in-process timeout check ever runs; only killing the process works
+        - Memory blow-ups on one exhibit must not take down the run
+
+    Strategy:
+        - Each worker runs one task at a time over its own pipe, so the
+          supervisor always knows exactly which file a worker is on
+        - Busy workers are polled: over the wall-clock limit -> 'timeout',
+          over the RSS limit -> 'oom'; the worker is killed and respawned
+        - A worker that dies on its own reports 'crashed' (or 'oom' when it
+          was SIGKILLed, which is what the kernel OOM killer does)
+
+    Results are (task_id, status, payload) with status one of
+    'ok', 'error', 'timeout', 'oom', 'crashed'.
+    """
+
+    def __init__(self,
+                 task: Callable[[Any], Any],
+                 max_workers: int = 2,
+                 initializer: Callable = None,
+                 init_args: Tuple = (),
+                 timeout_seconds: float = 600,
+                 max_rss_mb: float = None,
+                 poll_interval: float = 0.5):
+        """
+        Initialise supervisor (workers start as tasks are submitted)
+
+        Args:
+            task: Module-level function run in the worker for each arg
+            max_workers: Number of worker processes
+            initializer: Module-level function run once per worker
+            init_args: Arguments for initializer
+            timeout_seconds: Hard wall-clock limit per task
+            max_rss_mb: Hard resident-memory limit per worker (None = off)
+            poll_interval: Seconds between limit checks
+        """
+        self.task = task
+        self.max_workers = max(1, max_workers)
+        self.initializer = initializer
+        self.init_args = init_args
+        self.timeout_seconds = timeout_seconds
+        self.max_rss_mb = max_rss_mb
+        self.poll_interval = poll_interval
+
+        self._workers: List[_WorkerHandle] = []
+        self._queue = deque()
+
+        self.stats = {
+            'completed': 0,
+            'timeouts': 0,
+            'oom_kills': 0,
+            'crashes': 0,
+            'respawns': 0
+        }
+
+    # ========================================================================
+    # LIFECYCLE
+    # ========================================================================
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def _spawn_worker(self) -> _WorkerHandle:
+        parent_conn, child_conn = multiprocessing.Pipe()
+        process = multiprocessing.Process(
+            target=_supervised_worker_main,
+            args=(child_conn, self.initializer, self.init_args, self.task),
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        return _WorkerHandle(process, parent_conn)
+
+    def _ensure_workers(self):
+        """Spawn workers up to one per queued or running task (max_workers at most)"""
+        while len(self._workers) < min(self.max_workers, self.pending):
+            self._workers.append(self._spawn_worker())
+
+    def _kill_worker(self, worker: _WorkerHandle):
+        try:
+            worker.process.kill()
+        except Exception:
+            pass
+        worker.process.join(timeout=5)
+        try:
+            worker.conn.close()
+        except Exception:
+            pass
+
+    def _replace_worker(self, worker: _WorkerHandle):
+        """Kill (if needed) and respawn a worker in place"""
+        self._kill_worker(worker)
+        index = self._workers.index(worker)
+        self._workers[index] = self._spawn_worker()
+        self.stats['respawns'] += 1
+
+    def close(self):
+        """Stop all workers"""
+        for worker in self._workers:
+            if worker.process.is_alive() and not worker.busy:
+                try:
+                    worker.conn.send(None)
+                except Exception:
+                    pass
+
+        for worker in self._workers:
+            worker.process.join(timeout=2)
+            if worker.process.is_alive():
+                self._kill_worker(worker)
+            try:
+                worker.conn.close()
+            except Exception:
+                pass
+
+        self._workers = []
+        self._queue.clear()
+
+    # ========================================================================
+    # TASKS
+    # ========================================================================
+
+    def submit(self, task_id, arg):
+        """Queue a task"""
+        self._queue.append((task_id, arg))
+        self._ensure_workers()
+
+    @property
+    def pending(self) -> int:
+        """Tasks queued or running"""
+        return len(self._queue) + sum(1 for w in self._workers if w.busy)
+
+    def _dispatch(self):
+        for worker in self._workers:
+            if not self._queue:
+                break
+            if worker.busy:
+                continue
+            task_id, arg = self._queue.popleft()
+            try:
+                worker.assign(task_id, arg)
+            except (OSError, BrokenPipeError):
+                # Worker died while idle - respawn and retry on the new one
+                self._queue.appendleft((task_id, arg))
+                worker.release()
+                self._replace_worker(worker)
+
+    def poll(self) -> List[Tuple[Any, str, Any]]:
+        """
+        Dispatch queued tasks and wait (up to poll_interval) for results
+
+        Returns:
+            List of (task_id, status, payload) for tasks that finished
+        """
+        self._dispatch()
+
+        finished = []
+        busy = [w for w in self._workers if w.busy]
+        if not busy:
+            return finished
+
+        watch = {}
+        for worker in busy:
+            watch[worker.conn] = worker
+            watch[worker.process.sentinel] = worker
+
+        ready = wait_connections(list(watch.keys()), timeout=self.poll_interval)
+        handled = set()
+
+        for obj in ready:
+            worker = watch[obj]
+            if id(worker) in handled:
+                continue
+
+            if obj is worker.conn or worker.conn.poll():
+                try:
+                    task_id, status, payload = worker.conn.recv()
+                    finished.append((task_id, status, payload))
+                    worker.release()
+                    self.stats['completed'] += 1
+                    handled.add(id(worker))
+                    continue
+                except (EOFError, OSError):
+                    pass
+
+            # Process exited without a result
+            status = 'crashed'
+            worker.process.join(timeout=1)
+            exitcode = worker.process.exitcode
+            if exitcode is not None and exitcode == -getattr(signal, 'SIGKILL', 9):
+                status = 'oom'
+                self.stats['oom_kills'] += 1
+            else:
+                self.stats['crashes'] += 1
+
+            finished.append((worker.task_id, status, f"Worker exited with code {exitcode}"))
+            worker.release()
+            self._replace_worker(worker)
+            handled.add(id(worker))
+
+        # Enforce hard limits on workers still running
+        now = time.time()
+        for worker in list(self._workers):
+            if not worker.busy or id(worker) in handled:
+                continue
+
+            elapsed = now - worker.started_at
+            if self.timeout_seconds and elapsed > self.timeout_seconds:
+                finished.append((worker.task_id, 'timeout',
+                                 f"Killed after {elapsed:.0f}s (limit {self.timeout_seconds:.0f}s)"))
+                self.stats['timeouts'] += 1
+                worker.release()
+                self._replace_worker(worker)
+                continue
+
+            if self.max_rss_mb:
+                rss_mb = get_process_rss_mb(worker.process.pid)
+                if rss_mb is not None and rss_mb > self.max_rss_mb:
+                    finished.append((worker.task_id, 'oom',
+                                     f"Killed at {rss_mb:.0f} MB RSS (limit {self.max_rss_mb:.0f} MB)"))
+                    self.stats['oom_kills'] += 1
+                    worker.release()
+                    self._replace_worker(worker)
+
+        return finished
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Single-Read Ingestion for Lismore Litigation Intelligence System
+Reads each source file once and fans the bytes out to hashing,
+extraction and the encrypted vault
+British English throughout
+
+Location: src/utils/ingestion.py
+"""
+
+import hashlib
+import io
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from utils.archive_reader import open_source, source_stat
+
+
+HASH_CHUNK_BYTES = 1024 * 1024
+
+# Files above this are hashed while streaming but not held in memory;
+# extractors then open them from disk (or from their archive)
+MAX_INLINE_BYTES = 256 * 1024 * 1024
+
+DOC_ID_LENGTH = 16
+
+
+def canonical_doc_id(content_hash: str) -> str:
+    """
+    Canonical doc_id shared by every store
+
+    Content-addressed: the same bytes get the same id wherever they live,
+    and an edited file gets a new one.
+    """
+    return content_hash[:DOC_ID_LENGTH]
+
+
+def hash_file(file_path: Path) -> Optional[str]:
+    """Streaming SHA-256 of a file or archive member (None if it cannot be read)"""
+    digest = hashlib.sha256()
+    try:
+        with open_source(file_path) as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b''):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def sample_hash(file_path: Path) -> Optional[str]:
+    """
+    Cheap fingerprint of a file that will not be extracted
+
+    SHA-256 of the size plus the first and last HASH_CHUNK_BYTES, so a
+    multi-GB file costs two small reads instead of a full one. Not a
+    content hash - only for files that never get a canonical doc_id.
+    """
+    digest = hashlib.sha256()
+    try:
+        size = source_stat(file_path).st_size
+        digest.update(str(size).encode())
+        with open_source(file_path) as f:
+            digest.update(f.read(HASH_CHUNK_BYTES))
+            if size > 2 * HASH_CHUNK_BYTES and f.seekable():
+                f.seek(size - HASH_CHUNK_BYTES)
+                digest.update(f.read(HASH_CHUNK_BYTES))
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+@dataclass
+class SourceFile:
+    """One source file read from disk exactly once"""
+    path: Path
+    size: int
+    mtime_ns: int
+    content_hash: str
+    data: Optional[bytes] = None  # None when the file was too large to hold
+
+    @property
+    def doc_id(self) -> str:
+        return canonical_doc_id(self.content_hash)
+
+    @property
+    def has_data(self) -> bool:
+        return self.data is not None
+
+    def open(self) -> BinaryIO:
+        """Binary stream over the bytes (falls back to the file on disk)"""
+        if self.data is not None:
+            return io.BytesIO(self.data)
+        return open_source(self.path)
+
+
+def read_source(file_path: Path,
+                max_inline_bytes: int = MAX_INLINE_BYTES) -> Optional[SourceFile]:
+    """
+    Read a file once, hashing while streaming
+
+    Args:
+        file_path: File to read (or archive member virtual path)
+        max_inline_bytes: Keep the bytes in memory only up to this size
+
+    Returns:
+        SourceFile, or None if the file cannot be read
+    """
+    file_path = Path(file_path)
+
+    try:
+        stat = source_stat(file_path)
+    except OSError:
+        return None
+
+    digest = hashlib.sha256()
+    chunks = [] if stat.st_size <= max_inline_bytes else None
+
+    try:
+        with open_source(file_path) as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b''):
+                digest.update(chunk)
+                if chunks is not None:
+                    chunks.append(chunk)
+    except OSError:
+        return None
+
+    return SourceFile(
+        path=file_path,
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        content_hash=digest.hexdigest(),
+        data=b''.join(chunks) if chunks is not None else None
+    )
@@ -0,0 +1,525 @@
+#!/usr/bin/env python3
+"""
+OCR Queue for Lismore Litigation Intelligence System
+Persistent queue of scanned PDFs, worked by a low-priority OCR pool
+British English throughout
+
+Location: src/utils/ocr_queue.py
+"""
+
+import io
+import json
+import os
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from datetime import datetime
+
+from utils.archive_reader import open_source
+from utils.extraction_supervisor import ExtractionSupervisor
+
+try:
+    import fitz  # PyMuPDF - renders pages for OCR
+    FITZ_AVAILABLE = True
+except ImportError:
+    FITZ_AVAILABLE = False
+
+try:
+    import pytesseract
+    from PIL import Image
+    TESSERACT_AVAILABLE = True
+except ImportError:
+    TESSERACT_AVAILABLE = False
+
+
+OCR_AVAILABLE = FITZ_AVAILABLE and TESSERACT_AVAILABLE
+
+
+class OCRQueue:
+    """
+    Persistent queue of documents with image-only pages
+
+    Purpose:
+        - Scanned PDFs come back from extraction with no text and were lost
+        - OCR is far slower than text extraction, so it must never sit in
+          the triage path
+
+    Strategy:
+        - Jobs keyed by content hash (one OCR run however many copies exist)
+        - Status: pending -> running -> done | failed; 'running' jobs left
+          by a killed run go back to pending on recover()
+        - OCR text stored per page; done jobs stay unmerged until the
+          extraction cache and knowledge graph have picked them up, then
+          untriaged until Pass 1 has scored them with their new text
+        - SQLite in WAL mode, a fresh connection per call so the pool
+          thread and the main thread never share one
+    """
+
+    def __init__(self, db_path: Path, max_attempts: int = 2):
+        """
+        Initialise OCR queue
+
+        Args:
+            db_path: SQLite database location
+            max_attempts: Failed runs before a job is left as 'failed'
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max_attempts
+        self._init_database()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_database(self):
+        conn = self._get_connection()
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS ocr_jobs (
+                content_hash TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                doc_id TEXT,
+                pages_json TEXT,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER DEFAULT 0,
+                error TEXT,
+                merged INTEGER DEFAULT 0,
+                triaged INTEGER DEFAULT 0,
+                enqueued_date TEXT,
+                completed_date TEXT
+            )
+        """)
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS ocr_pages (
+                content_hash TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                text TEXT NOT NULL,
+                PRIMARY KEY (content_hash, page)
+            )
+        """)
+
+        # Queues created before re-triage tracking: jobs already merged
+        # were scored without their OCR text
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(ocr_jobs)")}
+        if 'triaged' not in columns:
+            conn.execute("ALTER TABLE ocr_jobs ADD COLUMN triaged INTEGER DEFAULT 0")
+
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_ocr_jobs_status ON ocr_jobs(status)")
+
+        conn.commit()
+        conn.close()
+
+    # ========================================================================
+    # QUEUE
+    # ========================================================================
+
+    def enqueue(self, file_path: Path, content_hash: str, doc_id: str,
+                pages: Optional[List[int]] = None) -> bool:
+        """
+        Queue a document for OCR (no-op if its content is already queued)
+
+        Args:
+            file_path: Source file (or archive member path)
+            content_hash: SHA-256 of the file bytes
+            doc_id: Canonical doc_id
+            pages: 1-based pages to OCR (None = every page without a text layer)
+
+        Returns:
+            True if a new job was added
+        """
+        conn = self._get_connection()
+        try:
+            cursor = conn.execute("""
+                INSERT OR IGNORE INTO ocr_jobs
+                (content_hash, path, doc_id, pages_json, status, enqueued_date)
+                VALUES (?, ?, ?, ?, 'pending', ?)
+            """, (
+                content_hash,
+                str(file_path),
+                doc_id,
+                json.dumps(pages) if pages is not None else None,
+                datetime.now().isoformat()
+            ))
+            conn.commit()
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+    def recover(self) -> int:
+        """Return jobs orphaned in 'running' by a stopped run to the queue"""
+        conn = self._get_connection()
+        try:
+            cursor = conn.execute("UPDATE ocr_jobs SET status = 'pending' WHERE status = 'running'")
+            conn.commit()
+            return cursor.rowcount
+        finally:
+            conn.close()
+
+    def retry_failed(self) -> int:
+        """Give failed jobs another full set of attempts"""
+        conn = self._get_connection()
+        try:
+            cursor = conn.execute(
+                "UPDATE ocr_jobs SET status = 'pending', attempts = 0, error = NULL WHERE status = 'failed'"
+            )
+            conn.commit()
+            return cursor.rowcount
+        finally:
+            conn.close()
+
+    def claim(self, limit: int = 1) -> List[Dict]:
+        """
+        Take pending jobs, oldest first, marking them 'running'
+
+        Returns:
+            List of {content_hash, path, doc_id, pages}
+        """
+        conn = self._get_connection()
+        try:
+            rows = conn.execute("""
+                SELECT content_hash, path, doc_id, pages_json FROM ocr_jobs
+                WHERE status = 'pending'
+                ORDER BY enqueued_date
+                LIMIT ?
+            """, (limit,)).fetchall()
+
+            conn.executemany(
+                "UPDATE ocr_jobs SET status = 'running', attempts = attempts + 1 WHERE content_hash = ?",
+                [(row[0],) for row in rows]
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        return [{
+            'content_hash': row[0],
+            'path': row[1],
+            'doc_id': row[2],
+            'pages': json.loads(row[3]) if row[3] else None
+        } for row in rows]
+
+    def complete(self, content_hash: str, pages: Dict[int, str]):
+        """Store OCR text for a job and mark it done (awaiting merge)"""
+        conn = self._get_connection()
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO ocr_pages (content_hash, page, text) VALUES (?, ?, ?)",
+                [(content_hash, int(page), text) for page, text in pages.items()]
+            )
+            conn.execute("""
+                UPDATE ocr_jobs
+                SET status = 'done', error = NULL, merged = 0, triaged = 0, completed_date = ?
+                WHERE content_hash = ?
+            """, (datetime.now().isoformat(), content_hash))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def fail(self, content_hash: str, error: str):
+        """Record a failed run; the job is retried until max_attempts"""
+        conn = self._get_connection()
+        try:
+            conn.execute("""
+                UPDATE ocr_jobs
+                SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                    error = ?
+                WHERE content_hash = ?
+            """, (self.max_attempts, error[:500], content_hash))
+            conn.commit()
+        finally:
+            conn.close()
+
+    # ========================================================================
+    # RESULTS
+    # ========================================================================
+
+    def get_pages(self, content_hash: str) -> Dict[int, str]:
+        """OCR text by page number for a document (empty if none yet)"""
+        conn = self._get_connection()
+        try:
+            rows = conn.execute(
+                "SELECT page, text FROM ocr_pages WHERE content_hash = ?", (content_hash,)
+            ).fetchall()
+        finally:
+            conn.close()
+        return {row[0]: row[1] for row in rows}
+
+    def unmerged(self) -> List[Dict]:
+        """Finished jobs whose text has not reached the cache / graph yet"""
+        conn = self._get_connection()
+        try:
+            rows = conn.execute(
+                "SELECT content_hash, path, doc_id FROM ocr_jobs WHERE status = 'done' AND merged = 0"
+            ).fetchall()
+        finally:
+            conn.close()
+        return [{'content_hash': row[0], 'path': row[1], 'doc_id': row[2]} for row in rows]
+
+    def mark_merged(self, content_hash: str):
+        conn = self._get_connection()
+        try:
+            conn.execute("UPDATE ocr_jobs SET merged = 1 WHERE content_hash = ?", (content_hash,))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def awaiting_triage(self) -> List[Dict]:
+        """Merged jobs whose documents were triaged before their OCR text existed"""
+        conn = self._get_connection()
+        try:
+            rows = conn.execute(
+                "SELECT content_hash, path, doc_id FROM ocr_jobs WHERE merged = 1 AND triaged = 0"
+            ).fetchall()
+        finally:
+            conn.close()
+        return [{'content_hash': row[0], 'path': row[1], 'doc_id': row[2]} for row in rows]
+
+    def mark_triaged(self, content_hashes: List[str]):
+        conn = self._get_connection()
+        try:
+            conn.executemany(
+                "UPDATE ocr_jobs SET triaged = 1 WHERE content_hash = ?",
+                [(content_hash,) for content_hash in content_hashes]
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    # ========================================================================
+    # STATISTICS
+    # ========================================================================
+
+    def get_statistics(self) -> Dict:
+        conn = self._get_connection()
+        try:
+            counts = dict(conn.execute(
+                "SELECT status, COUNT(*) FROM ocr_jobs GROUP BY status"
+            ).fetchall())
+            unmerged = conn.execute(
+                "SELECT COUNT(*) FROM ocr_jobs WHERE status = 'done' AND merged = 0"
+            ).fetchone()[0]
+            pages = conn.execute("SELECT COUNT(*) FROM ocr_pages").fetchone()[0]
+        finally:
+            conn.close()
+
+        return {
+            'pending': counts.get('pending', 0),
+            'running': counts.get('running', 0),
+            'done': counts.get('done', 0),
+            'failed': counts.get('failed', 0),
+            'awaiting_merge': unmerged,
+            'pages_ocrd': pages,
+            'ocr_available': OCR_AVAILABLE
+        }
+
+    def print_stats(self):
+        stats = self.get_statistics()
+        print("\n" + "=" * 70)
+        print("OCR QUEUE")
+        print("=" * 70)
+        print(f"Pending:         {stats['pending']:,}")
+        print(f"Running:         {stats['running']:,}")
+        print(f"Done:            {stats['done']:,} ({stats['awaiting_merge']:,} awaiting merge)")
+        print(f"Failed:          {stats['failed']:,}")
+        print(f"Pages OCR'd:     {stats['pages_ocrd']:,}")
+        if not stats['ocr_available']:
+            print("\n⚠️  OCR engine not installed - pip install pytesseract pillow (plus the Tesseract binary)")
+        print("=" * 70)
+
+
+# ============================================================================
+# OCR ENGINE
+# ============================================================================
+
+def ocr_pdf_pages(data: bytes, pages: Optional[List[int]] = None,
+                  dpi: int = 300, language: str = 'eng') -> Dict[int, str]:
+    """
+    OCR pages of a PDF held in memory
+
+    Args:
+        data: PDF bytes
+        pages: 1-based pages (None = every page without a text layer)
+        dpi: Render resolution
+        language: Tesseract language code(s), e.g. 'eng' or 'eng+fra'
+
+    Returns:
+        Page number -> OCR text
+    """
+    if not OCR_AVAILABLE:
+        raise ImportError("OCR needs PyMuPDF and pytesseract (pip install pytesseract pillow)")
+
+    results = {}
+    zoom = dpi / 72.0
+
+    with fitz.open(stream=data, filetype='pdf') as pdf:
+        if pages is None:
+            pages = [i + 1 for i in range(pdf.page_count)
+                     if not (pdf.load_page(i).get_text() or '').strip()]
+
+        for page_number in pages:
+            if not 1 <= page_number <= pdf.page_count:
+                continue
+            page = pdf.load_page(page_number - 1)
+            pixmap = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+            image = Image.open(io.BytesIO(pixmap.tobytes('png')))
+            results[page_number] = pytesseract.image_to_string(image, lang=language) or ''
+
+    return results
+
+
+def _lower_priority():
+    """Drop this process below normal priority so OCR yields to the pipeline"""
+    try:
+        if sys.platform == 'win32':
+            import psutil
+            psutil.Process().nice(psutil.BELOW_NORMAL_PRIORITY_CLASS)
+        else:
+            os.nice(10)
+    except Exception:
+        pass
+
+
+_OCR_SETTINGS = {}
+
+
+def _init_ocr_worker(settings: Dict):
+    global _OCR_SETTINGS
+    _lower_priority()
+    _OCR_SETTINGS = settings
+    if TESSERACT_AVAILABLE and settings.get('tesseract_cmd'):
+        pytesseract.pytesseract.tesseract_cmd = settings['tesseract_cmd']
+
+
+def _ocr_job_in_worker(task) -> Dict[int, str]:
+    """OCR one queued (path, pages) job inside a worker process"""
+    file_path, pages = task
+    with open_source(file_path) as f:
+        data = f.read()
+    return ocr_pdf_pages(
+        data, pages,
+        dpi=_OCR_SETTINGS.get('dpi', 300),
+        language=_OCR_SETTINGS.get('language', 'eng')
+    )
+
+
+# ============================================================================
+# WORKER POOL
+# ============================================================================
+
+class OCRWorkerPool:
+    """
+    Background OCR workers fed from an OCRQueue
+
+    A single feeder thread claims jobs and runs them in supervised,
+    below-normal-priority worker processes (hung or bloated OCR runs are
+    killed like any other extraction). Results only touch the queue
+    database; merging into the cache and graph happens on the main thread
+    (see LitigationOrchestrator.merge_ocr_results).
+    """
+
+    def __init__(self, queue: OCRQueue, max_workers: int = 1, dpi: int = 300,
+                 language: str = 'eng', tesseract_cmd: Optional[str] = None,
+                 job_timeout_seconds: float = 1800, max_worker_rss_mb: Optional[float] = None,
+                 on_progress: Optional[Callable[[Dict], None]] = None):
+        """
+        Initialise OCR pool (nothing starts until start() or run())
+
+        Args:
+            queue: Persistent job queue
+            max_workers: OCR processes (keep low - OCR is CPU heavy)
+            dpi: Render resolution
+            language: Tesseract language code(s)
+            tesseract_cmd: Path to the tesseract binary if not on PATH
+            job_timeout_seconds: Hard limit per document
+            max_worker_rss_mb: Hard memory limit per worker
+            on_progress: Called (from the feeder thread) after each job
+        """
+        self.queue = queue
+        self.max_workers = max(1, max_workers)
+        self.settings = {'dpi': dpi, 'language': language, 'tesseract_cmd': tesseract_cmd}
+        self.job_timeout_seconds = job_timeout_seconds
+        self.max_worker_rss_mb = max_worker_rss_mb
+        self.on_progress = on_progress
+
+        self._thread = None
+        self._stop = threading.Event()
+
+        self.stats = {'completed': 0, 'failed': 0}
+
+    def _work(self, until_empty: bool):
+        supervisor = ExtractionSupervisor(
+            task=_ocr_job_in_worker,
+            max_workers=self.max_workers,
+            initializer=_init_ocr_worker,
+            init_args=(self.settings,),
+            timeout_seconds=self.job_timeout_seconds,
+            max_rss_mb=self.max_worker_rss_mb
+        )
+
+        with supervisor:
+            while not self._stop.is_set():
+                if supervisor.pending < self.max_workers:
+                    for job in self.queue.claim(self.max_workers - supervisor.pending):
+                        supervisor.submit(job['content_hash'], (job['path'], job['pages']))
+
+                if supervisor.pending == 0:
+                    if until_empty:
+                        break
+                    self._stop.wait(5)   # idle - look for new jobs shortly
+                    continue
+
+                for content_hash, status, payload in supervisor.poll():
+                    if status == 'ok':
+                        self.queue.complete(content_hash, payload)
+                        self.stats['completed'] += 1
+                    else:
+                        self.queue.fail(content_hash, f"{status}: {payload}")
+                        self.stats['failed'] += 1
+
+                    if self.on_progress is not None:
+                        self.on_progress({'content_hash': content_hash, 'status': status, **self.stats})
+
+    def start(self) -> bool:
+        """
+        Work the queue in the background until stop()
+
+        Returns:
+            False if no OCR engine is installed
+        """
+        if not OCR_AVAILABLE:
+            return False
+        if self._thread is not None and self._thread.is_alive():
+            return True
+
+        self.queue.recover()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._work, args=(False,),
+                                        name='ocr-feeder', daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self, timeout: float = 10):
+        """
+        Stop the background pool
+
+        Jobs still running are killed with their workers and return to
+        the queue on the next recover().
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def run(self):
+        """Work the queue in the foreground until it is empty"""
+        if not OCR_AVAILABLE:
+            raise ImportError("OCR needs PyMuPDF and pytesseract (pip install pytesseract pillow)")
+        self.queue.recover()
+        self._stop.clear()
+        self._work(until_empty=True)
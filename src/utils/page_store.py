@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Page Store for Lismore Litigation Intelligence System
+Persists extracted text page by page for random-access page loading
+British English throughout
+
+Location: src/utils/page_store.py
+"""
+
+import hashlib
+import os
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional
+from datetime import datetime
+
+from utils.archive_reader import source_stat
+
+
+class PageStore:
+    """
+    Extracted text stored per document with page byte offsets
+
+    Purpose:
+        - Chat, Pass 3 and citation checks often need a few pages of a huge
+          bundle; re-parsing a 900-page PDF for pages 40-45 is wasteful
+        - Page boundaries are kept so answers can cite real page numbers
+
+    Strategy:
+        - One UTF-8 text file per source file holding every page back to back
+        - SQLite table of (byte_start, byte_length) per page, so a page range
+          is a single seek + read
+        - Entries are keyed by path and invalidated when size or mtime change
+        - Partial extractions are recorded as such and upgraded, never
+          downgraded, by later writes
+    """
+
+    def __init__(self, store_dir: Path):
+        """
+        Initialise page store
+
+        Args:
+            store_dir: Directory for the page index and text files
+        """
+        self.store_dir = Path(store_dir)
+        self.text_dir = self.store_dir / "text"
+        self.text_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.store_dir / "page_index.db"
+
+        self.stats = {
+            'documents_stored': 0,
+            'page_reads': 0,
+            'misses': 0
+        }
+
+        self._init_database()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _init_database(self):
+        """Create page index tables"""
+        conn = self._get_connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS documents (
+                path TEXT PRIMARY KEY,
+                text_file TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                total_pages INTEGER,
+                pages_stored INTEGER,
+                complete INTEGER DEFAULT 0,
+                stored_date TEXT
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                path TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                byte_start INTEGER NOT NULL,
+                byte_length INTEGER NOT NULL,
+                engine TEXT,
+                PRIMARY KEY (path, page)
+            )
+        """)
+        conn.commit()
+        conn.close()
+
+    def _text_file_for(self, path_key: str) -> Path:
+        name = hashlib.sha256(path_key.encode('utf-8')).hexdigest()[:32]
+        return self.text_dir / name[:2] / f"{name}.txt"
+
+    def _current_entry(self, conn: sqlite3.Connection, file_path: Path) -> Optional[tuple]:
+        """Stored document row if it still matches the file on disk"""
+        row = conn.execute(
+            "SELECT text_file, size, mtime_ns, total_pages, pages_stored, complete "
+            "FROM documents WHERE path = ?",
+            (str(file_path),)
+        ).fetchone()
+        if row is None:
+            return None
+
+        try:
+            stat = source_stat(file_path)
+        except OSError:
+            return None
+
+        if row[1] != stat.st_size or row[2] != stat.st_mtime_ns:
+            return None
+
+        return row
+
+    # ========================================================================
+    # WRITE
+    # ========================================================================
+
+    def put_pages(self, file_path: Path, pages: List[Dict],
+                  total_pages: int, complete: bool) -> bool:
+        """
+        Store extracted pages for a file
+
+        Args:
+            file_path: Source file
+            pages: [{'page': n, 'text': str, 'engine': str}] in page order
+            total_pages: Pages in the source file
+            complete: True if every page was extracted
+
+        Returns:
+            True if stored (False when a fuller copy already exists)
+        """
+        file_path = Path(file_path)
+        path_key = str(file_path)
+
+        try:
+            stat = source_stat(file_path)
+        except OSError:
+            return False
+
+        conn = self._get_connection()
+        try:
+            existing = self._current_entry(conn, file_path)
+            if existing is not None and (existing[5] or (existing[4] >= len(pages) and not complete)):
+                return False
+
+            text_file = self._text_file_for(path_key)
+            text_file.parent.mkdir(parents=True, exist_ok=True)
+
+            rows = []
+            offset = 0
+            temp_file = text_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(temp_file, 'wb') as f:
+                for page in pages:
+                    data = (page.get('text') or '').encode('utf-8')
+                    f.write(data)
+                    rows.append((path_key, page['page'], offset, len(data), page.get('engine')))
+                    offset += len(data)
+            os.replace(temp_file, text_file)
+
+            conn.execute("DELETE FROM pages WHERE path = ?", (path_key,))
+            conn.executemany("""
+                INSERT INTO pages (path, page, byte_start, byte_length, engine)
+                VALUES (?, ?, ?, ?, ?)
+            """, rows)
+            conn.execute("""
+                INSERT OR REPLACE INTO documents
+                (path, text_file, size, mtime_ns, total_pages, pages_stored, complete, stored_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                path_key,
+                str(text_file.relative_to(self.store_dir)),
+                stat.st_size,
+                stat.st_mtime_ns,
+                total_pages,
+                len(pages),
+                1 if complete else 0,
+                datetime.now().isoformat()
+            ))
+            conn.commit()
+        finally:
+            conn.close()
+
+        self.stats['documents_stored'] += 1
+        return True
+
+    def remove(self, file_paths: List[Path]) -> int:
+        """Drop stored pages for files (e.g. deleted from the source tree)"""
+        conn = self._get_connection()
+        removed = 0
+        for file_path in file_paths:
+            path_key = str(file_path)
+            row = conn.execute(
+                "SELECT text_file FROM documents WHERE path = ?", (path_key,)
+            ).fetchone()
+            if row is None:
+                continue
+            try:
+                (self.store_dir / row[0]).unlink()
+            except OSError:
+                pass
+            conn.execute("DELETE FROM pages WHERE path = ?", (path_key,))
+            conn.execute("DELETE FROM documents WHERE path = ?", (path_key,))
+            removed += 1
+        conn.commit()
+        conn.close()
+        return removed
+
+    # ========================================================================
+    # READ
+    # ========================================================================
+
+    def coverage(self, file_path: Path) -> Optional[Dict]:
+        """
+        What is stored for a file
+
+        Returns:
+            Dict with total_pages, pages_stored, complete - or None if the
+            file is not stored or has changed since
+        """
+        conn = self._get_connection()
+        row = self._current_entry(conn, Path(file_path))
+        conn.close()
+
+        if row is None:
+            return None
+
+        return {
+            'total_pages': row[3],
+            'pages_stored': row[4],
+            'complete': bool(row[5])
+        }
+
+    def get_pages(self, file_path: Path, start: int = 1,
+                  end: Optional[int] = None) -> Optional[List[Dict]]:
+        """
+        Read a page range (1-based, inclusive)
+
+        Args:
+            file_path: Source file
+            start: First page
+            end: Last page (None = last page stored)
+
+        Returns:
+            [{'page', 'text', 'engine'}] or None if the range is not stored
+        """
+        file_path = Path(file_path)
+        conn = self._get_connection()
+
+        try:
+            entry = self._current_entry(conn, file_path)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+
+            text_file, _, _, total_pages, pages_stored, complete = entry
+            # A capped extraction only holds a prefix; asking for the whole
+            # document must miss so the caller re-extracts every page
+            if not complete and end is None:
+                self.stats['misses'] += 1
+                return None
+
+            last_page = total_pages if complete else pages_stored
+            if end is None:
+                end = last_page
+            start = max(1, start)
+            end = min(end, total_pages or end)
+
+            if end > last_page:
+                self.stats['misses'] += 1
+                return None
+
+            rows = conn.execute("""
+                SELECT page, byte_start, byte_length, engine FROM pages
+                WHERE path = ? AND page BETWEEN ? AND ?
+                ORDER BY page
+            """, (str(file_path), start, end)).fetchall()
+        finally:
+            conn.close()
+
+        if not rows:
+            return []
+
+        # Pages are contiguous on disk - one read covers the whole range
+        range_start = rows[0][1]
+        range_end = rows[-1][1] + rows[-1][2]
+        try:
+            with open(self.store_dir / text_file, 'rb') as f:
+                f.seek(range_start)
+                data = f.read(range_end - range_start)
+        except OSError:
+            self.stats['misses'] += 1
+            return None
+
+        pages = []
+        for page, byte_start, byte_length, engine in rows:
+            local = byte_start - range_start
+            pages.append({
+                'page': page,
+                'text': data[local:local + byte_length].decode('utf-8', errors='ignore'),
+                'engine': engine
+            })
+
+        self.stats['page_reads'] += len(pages)
+        return pages
+
+    def get_text(self, file_path: Path, start: int = 1,
+                 end: Optional[int] = None) -> Optional[str]:
+        """Page range joined as plain text, or None if not stored"""
+        pages = self.get_pages(file_path, start, end)
+        if pages is None:
+            return None
+        return '\n\n'.join(page['text'] for page in pages if page['text'])
+
+    # ========================================================================
+    # STATISTICS
+    # ========================================================================
+
+    def get_statistics(self) -> Dict:
+        """Get page store statistics"""
+        conn = self._get_connection()
+        documents, complete, pages = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(complete), 0), COALESCE(SUM(pages_stored), 0) FROM documents"
+        ).fetchone()
+        conn.close()
+
+        text_bytes = sum(
+            f.stat().st_size for f in self.text_dir.rglob('*.txt') if f.is_file()
+        )
+
+        return {
+            'documents': documents,
+            'complete_documents': complete,
+            'pages': pages,
+            'text_size_mb': text_bytes / (1024 * 1024),
+            'store_dir': str(self.store_dir),
+            'session': dict(self.stats)
+        }
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Passage Index for Lismore Litigation Intelligence System
+BM25 over semantic chunks of each document, keyed back to doc_id and offsets
+British English throughout
+
+Location: src/utils/passage_index.py
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from utils.bm25_index import BM25Index
+from utils.chunker import DocumentChunker
+
+
+class PassageIndex(BM25Index):
+    """
+    BM25Index whose units are passages rather than whole documents
+
+    Purpose:
+        - Retrieval returned whole documents and prompts kept their first
+          15,000 characters, which often cut off the clause that matched
+
+    Strategy:
+        - Each document is split with DocumentChunker.chunk_by_semantic_boundaries
+          (sections, then paragraphs, then line/sentence breaks); every
+          chunk is one unit holding its doc_id and character offsets
+        - Same persistence, incremental sync and pruned ranking as the
+          document index; changing the passage size changes the format
+          version, so the index rebuilds rather than mixing sizes
+        - Passages are returned as offsets - text is sliced from the
+          knowledge graph when a prompt is built, never held here
+    """
+
+    def __init__(self, db_path: Path, chunker: DocumentChunker, passage_tokens: int = 400,
+                 k1: float = 1.5, b: float = 0.75):
+        """
+        Open (or create) a passage index
+
+        Args:
+            db_path: SQLite database location
+            chunker: DocumentChunker used to split documents
+            passage_tokens: Target passage size (tokens, ~4 chars each)
+            k1: Term frequency saturation
+            b: Length normalisation
+        """
+        self.chunker = chunker
+        self.passage_tokens = passage_tokens
+        super().__init__(db_path, k1=k1, b=b)
+
+    @property
+    def format_version(self) -> str:
+        return f"{super().format_version}/passages-{self.passage_tokens}"
+
+    def _segment(self, text: str) -> List[Tuple[int, int, str]]:
+        return [
+            (chunk['start_char'], chunk['end_char'], text[chunk['start_char']:chunk['end_char']])
+            for chunk in self.chunker.chunk_by_semantic_boundaries(text, self.passage_tokens)
+            if chunk.get('start_char') is not None
+        ]
+
+    def search_passages(self, query: str, top_k: int = 50,
+                        doc_ids: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Best passages for a query
+
+        Args:
+            query: Natural-language query
+            top_k: Passages to return
+            doc_ids: Only search passages of these documents (None = all)
+
+        Returns:
+            [{'doc_id', 'start', 'end', 'score'}, ...] best first
+        """
+        return [{
+            'doc_id': self.doc_ids[ordinal],
+            'start': int(self.spans[ordinal][0]),
+            'end': int(self.spans[ordinal][1]),
+            'score': score
+        } for ordinal, score in self.rank(query, top_k, doc_ids=doc_ids)]
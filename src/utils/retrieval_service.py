@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Retrieval Service for Lismore Litigation Intelligence System
+One BM25 index snapshot shared by every pass and by chat
+British English throughout
+
+Location: src/utils/retrieval_service.py
+"""
+
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from utils.bm25_index import BM25Index
+from utils.chunker import DocumentChunker
+from utils.passage_index import PassageIndex
+
+
+class RetrievalService:
+    """
+    The single document retrieval entry point, owned by the orchestrator
+
+    Purpose:
+        - PassExecutor, DocumentRetrieval and the orchestrator's retrieval
+          system each kept their own BM25 index (and copy of every
+          document's text), so Pass 3 and chat in one process paid twice
+
+    Strategy:
+        - One BM25Index opened lazily on first search and synced once;
+          that snapshot serves every caller until refresh() is called
+        - refresh() is explicit: callers that know documents were added
+          (start of Pass 3, build_document_index) sync; searches never do
+        - Results carry metadata fetched from the knowledge graph for the
+          returned doc_ids only - no text is held in memory
+        - A second, passage-level index, synced alongside the document
+          index by refresh(), answers retrieve_passages(): the best passages
+          across documents that fit a token budget, for Pass 3 prompts
+    """
+
+    def __init__(self, knowledge_graph, config):
+        """
+        Initialise retrieval service (the index opens on first use)
+
+        Args:
+            knowledge_graph: KnowledgeGraph instance with documents
+            config: Configuration object
+        """
+        self.knowledge_graph = knowledge_graph
+        self.config = config
+
+        retrieval_config = getattr(config, 'retrieval_config', {}) if config else {}
+        self.index_db = Path(retrieval_config.get(
+            'index_db', Path(knowledge_graph.db_path).parent / "bm25_index.db"
+        ))
+        self.k1 = retrieval_config.get('k1', 1.5)
+        self.b = retrieval_config.get('b', 0.75)
+
+        self.passage_index_db = Path(retrieval_config.get(
+            'passage_index_db', self.index_db.parent / "passage_index.db"
+        ))
+        self.passage_tokens = retrieval_config.get('passage_tokens', 400)
+        self.passage_token_budget = retrieval_config.get('passage_token_budget', 12000)
+        self.max_passages_per_doc = retrieval_config.get('max_passages_per_doc', 3)
+
+        self._index: Optional[BM25Index] = None
+        self._passages: Optional[PassageIndex] = None
+        self.last_sync: Optional[Dict] = None
+
+    @property
+    def index(self) -> BM25Index:
+        """The shared index snapshot, opened and synced on first access"""
+        if self._index is None:
+            self._open()
+        return self._index
+
+    def _open(self):
+        self._index = BM25Index(self.index_db, k1=self.k1, b=self.b)
+        self.last_sync = self._index.sync(self.knowledge_graph)
+
+    @property
+    def passages(self) -> PassageIndex:
+        """The shared passage index, opened and synced on first access"""
+        if self._passages is None:
+            self._passages = PassageIndex(
+                self.passage_index_db, DocumentChunker(self.config),
+                passage_tokens=self.passage_tokens, k1=self.k1, b=self.b
+            )
+            self._passages.sync(self.knowledge_graph)
+        return self._passages
+
+    def refresh(self) -> Dict:
+        """
+        Sync the document and passage snapshots with the knowledge graph
+
+        Returns:
+            {'action': 'current' | 'updated' | 'rebuilt', 'added': n, 'removed': n}
+        """
+        if self._index is None:
+            self._open()
+        else:
+            self.last_sync = self._index.sync(self.knowledge_graph)
+        if self._passages is None:
+            self.passages   # opens and syncs
+        else:
+            self._passages.sync(self.knowledge_graph)
+        return self.last_sync
+
+    def is_stale(self) -> bool:
+        """True if the knowledge graph changed since the snapshot was taken"""
+        return self._index is None or self._index.is_stale(self.knowledge_graph)
+
+    # ========================================================================
+    # SEARCH
+    # ========================================================================
+
+    def search_scored(self, query: str, top_k: int = 20) -> List[Tuple[str, float]]:
+        """Ranked (doc_id, BM25 score) pairs, best first"""
+        return self.index.search(query, top_k=top_k)
+
+    def search_ids(self, query: str, top_k: int = 20) -> List[str]:
+        """Ranked doc_ids, best first"""
+        return [doc_id for doc_id, _ in self.search_scored(query, top_k)]
+
+    def search(self, query: str, top_k: int = 20) -> List[Dict]:
+        """
+        Ranked documents with metadata
+
+        Args:
+            query: Search query (natural language)
+            top_k: Number of documents to return
+
+        Returns:
+            [{'doc_id', 'filename', 'category', 'score', 'preview'}, ...]
+        """
+        ranked = self.search_scored(query, top_k)
+        if not ranked:
+            return []
+
+        doc_lookup = {
+            doc['doc_id']: doc
+            for doc in self.knowledge_graph.get_documents_by_ids([doc_id for doc_id, _ in ranked])
+        }
+
+        results = []
+        for doc_id, score in ranked:
+            doc = doc_lookup.get(doc_id)
+            if doc is None:
+                continue
+            results.append({
+                'doc_id': doc_id,
+                'filename': doc.get('filename', 'Unknown'),
+                'category': doc.get('category', 'other'),
+                'score': round(score, 2),
+                'preview': (doc.get('preview', '') or doc.get('content', ''))[:200]
+            })
+
+        return results
+
+    def retrieve_passages(self, query: str, max_documents: int = 20,
+                          token_budget: Optional[int] = None,
+                          doc_ids: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Best passages for a query, grouped by document, within a token budget
+
+        Passages are taken best first (at most max_passages_per_doc per
+        document) while they fit the budget; each document's passages are
+        then put back in reading order.
+
+        Args:
+            query: Search query (natural language)
+            max_documents: Most documents to draw passages from
+            token_budget: Passage tokens allowed in total (~4 chars each)
+            doc_ids: Only search these documents (None = whole corpus)
+
+        Returns:
+            [{'doc_id', 'filename', 'category', 'score', 'preview', 'content_chars',
+              'metadata', 'passages': [{'start', 'end', 'score', 'text'}, ...]}, ...]
+            best document first
+        """
+        budget = token_budget or self.passage_token_budget
+        hits = self.passages.search_passages(
+            query, top_k=max(100, max_documents * self.max_passages_per_doc * 2), doc_ids=doc_ids
+        )
+
+        selected: Dict[str, List[Dict]] = {}
+        used = 0
+        for hit in hits:
+            tokens = (hit['end'] - hit['start']) // 4
+            chosen = selected.get(hit['doc_id'])
+            if chosen is None and len(selected) >= max_documents:
+                continue
+            if chosen is not None and len(chosen) >= self.max_passages_per_doc:
+                continue
+            if used + tokens > budget:
+                continue   # a shorter passage further down may still fit
+            selected.setdefault(hit['doc_id'], []).append(hit)
+            used += tokens
+
+        if not selected:
+            return []
+
+        doc_lookup = {doc['doc_id']: doc for doc in self.knowledge_graph.get_documents_by_ids(list(selected))}
+
+        results = []
+        for doc_id, doc_hits in selected.items():
+            doc = doc_lookup.get(doc_id)
+            if doc is None:
+                continue
+            text = doc.get('content') or doc.get('preview') or ''
+            # Offsets belong to the text that was indexed; a document edited
+            # since the snapshot is skipped until refresh() re-indexes it
+            if zlib.crc32(text.encode('utf-8')) != self.passages.fingerprints.get(doc_id):
+                continue
+
+            filename = doc.get('filename', 'Unknown')
+            results.append({
+                'doc_id': doc_id,
+                'filename': filename,
+                'category': doc.get('category', 'other'),
+                'score': round(doc_hits[0]['score'], 2),
+                'preview': (doc.get('preview', '') or text)[:200],
+                'content_chars': len(text),
+                'metadata': {'filename': filename},
+                'passages': [{
+                    'start': hit['start'],
+                    'end': hit['end'],
+                    'score': round(hit['score'], 2),
+                    'text': text[hit['start']:hit['end']]
+                } for hit in sorted(doc_hits, key=lambda h: h['start'])]
+            })
+
+        return results
+
+    def get_statistics(self) -> Dict:
+        stats = self.index.get_statistics()
+        stats['last_sync'] = self.last_sync
+        return stats
+
+    def close(self):
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        if self._passages is not None:
+            self._passages.close()
+            self._passages = None
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Source Manifest for Lismore Litigation Intelligence System
+Tracks every source file so re-runs only process what changed
+British English throughout
+
+Location: src/utils/source_manifest.py
+"""
+
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from datetime import datetime
+
+from utils.archive_reader import is_archive, iter_archive_members, source_stat
+from utils.corpus_walker import DEFAULT_WALK_WORKERS, FileRecord, walk_files
+from utils.ingestion import DOC_ID_LENGTH, canonical_doc_id, hash_file
+
+
+@dataclass
+class ManifestEntry:
+    """One source file as recorded in (or about to enter) the manifest"""
+    path: str
+    size: int
+    mtime_ns: int
+    content_hash: str            # '' while pending (see SourceManifest.scan)
+    doc_id: str
+    folder: str = ''
+    previous_doc_id: str = ''  # doc_id before the content changed
+    previous_hash: str = ''
+
+
+@dataclass
+class ManifestDiff:
+    """Difference between the source tree and the saved manifest"""
+    added: List[ManifestEntry] = field(default_factory=list)
+    changed: List[ManifestEntry] = field(default_factory=list)
+    removed: List[ManifestEntry] = field(default_factory=list)
+    unchanged: int = 0
+    touched: List[ManifestEntry] = field(default_factory=list)  # mtime moved, bytes identical
+    scanned_folders: List[str] = field(default_factory=list)
+    live_doc_ids: Set[str] = field(default_factory=set)  # doc_ids still on disk after the scan
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    @property
+    def pending(self) -> List[ManifestEntry]:
+        """Added/changed entries whose content hash is not known yet"""
+        return [e for e in self.added + self.changed if not e.content_hash]
+
+    @property
+    def paths_to_load(self) -> List[Path]:
+        """Files whose content must be (re-)extracted"""
+        return [Path(e.path) for e in self.added + self.changed]
+
+    @property
+    def stale_doc_ids(self) -> List[str]:
+        """
+        doc_ids whose previous results are no longer valid
+
+        doc_ids are content-addressed, so a changed file's old id is stale
+        and an id is kept while an identical copy remains elsewhere. While
+        hashes are pending, a file moved to a new path counts as stale.
+        """
+        stale = [e.doc_id for e in self.removed] + [e.previous_doc_id for e in self.changed]
+        return [doc_id for doc_id in dict.fromkeys(stale) if doc_id and doc_id not in self.live_doc_ids]
+
+    @property
+    def removed_doc_ids(self) -> List[str]:
+        """doc_ids of removed files with no identical copy left on disk"""
+        return [e.doc_id for e in self.removed if e.doc_id not in self.live_doc_ids]
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            'added': len(self.added),
+            'changed': len(self.changed),
+            'removed': len(self.removed),
+            'unchanged': self.unchanged
+        }
+
+
+class SourceManifest:
+    """
+    Persistent manifest of (path, size, mtime, content hash, doc_id)
+
+    scan() diffs the source tree against the manifest without modifying it;
+    commit() records a diff once the delta has been ingested, so a crash
+    mid-ingest leaves the delta to be picked up again on the next run.
+    Files whose size and mtime are unchanged are never re-hashed.
+    doc_ids are the canonical content-addressed ids from utils.ingestion.
+
+    scan(defer_hashes=True) leaves new and changed files unhashed unless
+    known_hash_fn has their hash already; resolve() then takes the hashes
+    produced by the extraction read, so an ingest reads each file once.
+    """
+
+    DOC_ID_SCHEME = 'content_sha256'
+
+    def __init__(self, db_path: Path,
+                 supported_formats: Iterable[str],
+                 hash_fn: Optional[Callable[[Path], Optional[str]]] = None,
+                 walk_workers: int = DEFAULT_WALK_WORKERS,
+                 known_hash_fn: Optional[Callable[[Path], Optional[str]]] = None):
+        """
+        Initialise source manifest
+
+        Args:
+            db_path: SQLite database location
+            supported_formats: File suffixes the loader can ingest
+            hash_fn: Content hasher; pass the loader's so hashes computed
+                during a scan are reused at extraction time
+            walk_workers: Threads listing directories during a scan
+            known_hash_fn: Hash lookup that never reads the file (used by
+                deferred scans)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.hash_fn = hash_fn or hash_file
+        self.known_hash_fn = known_hash_fn
+        self.supported_formats = {s.lower() for s in supported_formats}
+        self.walk_workers = walk_workers
+        self._init_database()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _init_database(self):
+        """Create manifest table"""
+        conn = self._get_connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS manifest (
+                path TEXT PRIMARY KEY,
+                folder TEXT,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                doc_id TEXT NOT NULL,
+                last_seen TEXT
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_manifest_folder ON manifest(folder)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_manifest_doc_id ON manifest(doc_id)")
+        conn.execute("CREATE TABLE IF NOT EXISTS manifest_meta (key TEXT PRIMARY KEY, value TEXT)")
+
+        # Manifests written before content-addressed doc_ids: the hash is
+        # already stored, so the ids can be rewritten without touching disk
+        row = conn.execute("SELECT value FROM manifest_meta WHERE key = 'doc_id_scheme'").fetchone()
+        if row is None or row[0] != self.DOC_ID_SCHEME:
+            conn.execute("UPDATE manifest SET doc_id = substr(content_hash, 1, ?)", (DOC_ID_LENGTH,))
+            conn.execute(
+                "INSERT OR REPLACE INTO manifest_meta (key, value) VALUES ('doc_id_scheme', ?)",
+                (self.DOC_ID_SCHEME,)
+            )
+
+        conn.commit()
+        conn.close()
+
+    def _iter_source_files(self, folder_path: Path):
+        """FileRecords for every supported file, stat taken during the walk"""
+        for record in walk_files([folder_path], self.supported_formats, self.walk_workers):
+            if not is_archive(record.path):
+                yield record
+                continue
+
+            # Members are tracked individually under virtual paths
+            for member_path in iter_archive_members(record.path, self.supported_formats):
+                try:
+                    stat = source_stat(member_path)
+                except OSError:
+                    continue
+                yield FileRecord(member_path, stat.st_size, stat.st_mtime_ns)
+
+    # ========================================================================
+    # SCAN / COMMIT
+    # ========================================================================
+
+    def scan(self, folders: List[Path], defer_hashes: bool = False) -> ManifestDiff:
+        """
+        Diff folders against the manifest
+
+        Only entries under the scanned folders can be reported as removed,
+        so scanning a subset of the tree never drops the rest.
+
+        Args:
+            folders: Source folders to scan
+            defer_hashes: Leave unknown hashes pending for resolve() instead
+                of reading files here (a file whose size or mtime moved is
+                then reported as changed even if its bytes are identical)
+
+        Returns:
+            ManifestDiff (manifest itself is not modified)
+        """
+        diff = ManifestDiff()
+        conn = self._get_connection()
+
+        for folder_path in folders:
+            folder_path = Path(folder_path)
+            folder_key = str(folder_path)
+            diff.scanned_folders.append(folder_key)
+
+            stored = {
+                row[0]: row for row in conn.execute(
+                    "SELECT path, size, mtime_ns, content_hash, doc_id FROM manifest WHERE folder = ?",
+                    (folder_key,)
+                )
+            }
+
+            if folder_path.exists():
+                for file_path, size, mtime_ns in self._iter_source_files(folder_path):
+                    path_key = str(file_path)
+                    previous = stored.pop(path_key, None)
+
+                    if previous and previous[1] == size and previous[2] == mtime_ns:
+                        diff.unchanged += 1
+                        diff.live_doc_ids.add(previous[4])
+                        continue
+
+                    if defer_hashes:
+                        content_hash = self.known_hash_fn(file_path) if self.known_hash_fn else None
+                        content_hash = content_hash or ''
+                    else:
+                        content_hash = self.hash_fn(file_path)
+                        if content_hash is None:
+                            continue
+
+                    entry = ManifestEntry(
+                        path=path_key,
+                        size=size,
+                        mtime_ns=mtime_ns,
+                        content_hash=content_hash,
+                        doc_id=canonical_doc_id(content_hash) if content_hash else '',
+                        folder=folder_key
+                    )
+                    if entry.doc_id:
+                        diff.live_doc_ids.add(entry.doc_id)
+
+                    if previous is None:
+                        diff.added.append(entry)
+                    elif previous[3] != content_hash:
+                        entry.previous_doc_id = previous[4]
+                        entry.previous_hash = previous[3]
+                        diff.changed.append(entry)
+                    else:
+                        diff.touched.append(entry)
+                        diff.unchanged += 1
+
+            # Anything left was in the manifest but is no longer on disk
+            for path_key, size, mtime_ns, content_hash, doc_id in stored.values():
+                diff.removed.append(ManifestEntry(
+                    path=path_key,
+                    size=size,
+                    mtime_ns=mtime_ns,
+                    content_hash=content_hash,
+                    doc_id=doc_id,
+                    folder=folder_key
+                ))
+
+        conn.close()
+        return diff
+
+    def resolve(self, diff: ManifestDiff, known_hashes: Optional[Dict[str, str]] = None) -> int:
+        """
+        Fill in pending content hashes
+
+        Args:
+            diff: Diff returned by scan(defer_hashes=True)
+            known_hashes: path -> content hash recorded while extracting;
+                anything not covered is hashed here
+
+        Returns:
+            Number of files that had to be read just to hash them
+        """
+        known_hashes = known_hashes or {}
+        hashed = 0
+        unreadable = set()
+        for entry in diff.pending:
+            content_hash = known_hashes.get(entry.path)
+            if not content_hash:
+                content_hash = self.hash_fn(Path(entry.path))
+                hashed += 1
+            if not content_hash:
+                unreadable.add(id(entry))
+                continue
+            entry.content_hash = content_hash
+            entry.doc_id = canonical_doc_id(content_hash)
+            diff.live_doc_ids.add(entry.doc_id)
+
+        # Unreadable files stay out of the manifest, as in a hashing scan
+        diff.added = [e for e in diff.added if id(e) not in unreadable]
+        diff.changed = [e for e in diff.changed if id(e) not in unreadable]
+
+        # Size or mtime moved but the bytes did not
+        same = [e for e in diff.changed if e.content_hash == e.previous_hash]
+        if same:
+            diff.changed = [e for e in diff.changed if e.content_hash != e.previous_hash]
+            diff.touched.extend(same)
+            diff.unchanged += len(same)
+
+        return hashed
+
+    def commit(self, diff: ManifestDiff):
+        """
+        Record a diff once its delta has been ingested
+
+        Args:
+            diff: Diff returned by scan() (pending hashes are resolved here)
+        """
+        if diff.pending:
+            self.resolve(diff)
+
+        now = datetime.now().isoformat()
+        conn = self._get_connection()
+
+        conn.executemany("""
+            INSERT OR REPLACE INTO manifest
+            (path, folder, size, mtime_ns, content_hash, doc_id, last_seen)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (e.path, e.folder, e.size, e.mtime_ns, e.content_hash, e.doc_id, now)
+            for e in diff.added + diff.changed + diff.touched
+        ])
+
+        conn.executemany(
+            "DELETE FROM manifest WHERE path = ?",
+            [(e.path,) for e in diff.removed]
+        )
+
+        conn.commit()
+        conn.close()
+
+    def paths_for_doc_ids(self, doc_ids: Iterable[str]) -> Dict[str, List[Path]]:
+        """Recorded paths of each doc_id (identical copies share a doc_id)"""
+        conn = self._get_connection()
+        paths = {}
+        for doc_id in dict.fromkeys(doc_ids):
+            rows = conn.execute(
+                "SELECT path FROM manifest WHERE doc_id = ? ORDER BY path", (doc_id,)
+            ).fetchall()
+            if rows:
+                paths[doc_id] = [Path(row[0]) for row in rows]
+        conn.close()
+        return paths
+
+    def is_empty(self) -> bool:
+        conn = self._get_connection()
+        count = conn.execute("SELECT COUNT(*) FROM manifest").fetchone()[0]
+        conn.close()
+        return count == 0
+
+    def get_statistics(self) -> Dict:
+        """Get manifest statistics"""
+        conn = self._get_connection()
+        total, total_bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM manifest"
+        ).fetchone()
+        by_folder = dict(conn.execute(
+            "SELECT folder, COUNT(*) FROM manifest GROUP BY folder"
+        ).fetchall())
+        conn.close()
+
+        return {
+            'total_files': total,
+            'total_size_gb': total_bytes / (1024 ** 3),
+            'by_folder': by_folder,
+            'db_path': str(self.db_path)
+        }
+
+    def print_diff(self, diff: ManifestDiff):
+        """Print scan results"""
+        summary = diff.summary()
+
+        print(f"\n{'=' * 70}")
+        print(f"SOURCE MANIFEST SCAN")
+        print(f"{'=' * 70}")
+        print(f"Folders scanned: {len(diff.scanned_folders)}")
+        print(f"  ➕ Added:     {summary['added']:,}")
+        print(f"  ✏️  Changed:   {summary['changed']:,}")
+        print(f"  ➖ Removed:   {summary['removed']:,}")
+        print(f"  ✓  Unchanged: {summary['unchanged']:,}")
+
+        for label, entries in (('Added', diff.added), ('Changed', diff.changed), ('Removed', diff.removed)):
+            if entries:
+                print(f"\n{label} (first 10):")
+                for entry in entries[:10]:
+                    print(f"  • {Path(entry.path).name}")
+
+        print(f"{'=' * 70}\n")
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+BM25 index tests - MaxScore pruning must match exhaustive scoring
+British English throughout
+
+Location: tests/test_bm25_index.py
+"""
+
+import math
+import random
+import sqlite3
+import sys
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('numpy')
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from utils.bm25_index import BM25Index, tokenize
+
+
+VOCABULARY = [
+    'arbitration', 'shareholder', 'agreement', 'indemnity', 'warranty',
+    'tribunal', 'damages', 'breach', 'disclosure', 'transfer', 'payment',
+    'notice', 'clause', 'director', 'valuation', 'escrow', 'completion',
+    'novation', 'guarantee', 'termination'
+]
+
+QUERIES = [
+    'arbitration',
+    'shareholder agreement breach',
+    'indemnity warranty damages damages',
+    'tribunal disclosure transfer payment notice clause',
+    'escrow completion novation guarantee termination valuation director',
+    'unknown terms only',
+]
+
+
+class DiscoveryLog:
+    """Just enough of KnowledgeGraph for BM25Index.sync()"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._tick = 0
+        conn = self._get_connection()
+        conn.execute("""
+            CREATE TABLE discovery_log (
+                doc_id TEXT PRIMARY KEY,
+                content TEXT,
+                preview TEXT,
+                indexed_date TEXT
+            )
+        """)
+        conn.commit()
+        conn.close()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def put(self, documents: dict):
+        conn = self._get_connection()
+        for doc_id, content in documents.items():
+            self._tick += 1
+            conn.execute(
+                "INSERT OR REPLACE INTO discovery_log (doc_id, content, preview, indexed_date) "
+                "VALUES (?, ?, '', ?)",
+                (doc_id, content, f"2024-01-01T00:00:{self._tick:06d}")
+            )
+        conn.commit()
+        conn.close()
+
+    def delete(self, doc_ids: list):
+        conn = self._get_connection()
+        conn.executemany("DELETE FROM discovery_log WHERE doc_id = ?", [(d,) for d in doc_ids])
+        conn.commit()
+        conn.close()
+
+
+def _random_text(rng: random.Random) -> str:
+    # Skewed draws so terms differ widely in df and tf
+    words = rng.choices(VOCABULARY, weights=range(len(VOCABULARY), 0, -1), k=rng.randint(3, 60))
+    return ' '.join(words)
+
+
+def _exhaustive_bm25(corpus: dict, query: str, k1: float, b: float) -> dict:
+    """Plain BM25 over every document - no bounds, no pruning"""
+    docs = {doc_id: Counter(tokenize(text)) for doc_id, text in corpus.items()}
+    lengths = {doc_id: sum(tf.values()) for doc_id, tf in docs.items()}
+    avgdl = sum(lengths.values()) / len(docs)
+
+    scores = {}
+    for term, query_tf in Counter(tokenize(query)).items():
+        df = sum(1 for tf in docs.values() if term in tf)
+        if not df:
+            continue
+        idf = math.log((len(docs) - df + 0.5) / (df + 0.5) + 1.0)
+        for doc_id, tf in docs.items():
+            if term in tf:
+                f = tf[term]
+                norm = k1 * (1 - b + b * lengths[doc_id] / avgdl)
+                scores[doc_id] = scores.get(doc_id, 0.0) + query_tf * idf * f * (k1 + 1) / (f + norm)
+    return scores
+
+
+def _assert_matches_exhaustive(index: BM25Index, corpus: dict):
+    for query in QUERIES:
+        expected = _exhaustive_bm25(corpus, query, index.k1, index.b)
+        ranked_scores = sorted(expected.values(), reverse=True)
+
+        for top_k in (1, 3, 10, len(corpus)):
+            results = index.search(query, top_k)
+            assert len(results) == min(top_k, len(expected)), (query, top_k)
+
+            # Same scores in the same order; ties may resolve to any of the tied documents
+            assert [s for _, s in results] == pytest.approx(ranked_scores[:top_k]), (query, top_k)
+            for doc_id, score in results:
+                assert score == pytest.approx(expected[doc_id]), (query, doc_id)
+
+
+def test_rank_matches_exhaustive_bm25_across_sync(tmp_path):
+    rng = random.Random(2024)
+    corpus = {f"doc{n:03d}": _random_text(rng) for n in range(400)}
+
+    graph = DiscoveryLog(tmp_path / "kg.db")
+    graph.put(corpus)
+    index = BM25Index(tmp_path / "bm25.db")
+    assert index.sync(graph)['action'] == 'rebuilt'
+    _assert_matches_exhaustive(index, corpus)
+
+    # Add, edit and delete few enough documents to stay on the incremental path
+    added = {f"new{n:03d}": _random_text(rng) for n in range(20)}
+    edited = {doc_id: _random_text(rng) for doc_id in ('doc005', 'doc040')}
+    deleted = ['doc010', 'doc011', 'doc060']
+
+    graph.put({**added, **edited})
+    graph.delete(deleted)
+    corpus.update(added)
+    corpus.update(edited)
+    for doc_id in deleted:
+        del corpus[doc_id]
+
+    result = index.sync(graph)
+    assert result['action'] == 'updated'
+    assert result['removed'] == len(deleted)
+    assert index.get_statistics()['tombstones'] == len(deleted) + len(edited)
+    _assert_matches_exhaustive(index, corpus)
+
+    # Reopened from disk: same answers
+    index.close()
+    index = BM25Index(tmp_path / "bm25.db")
+    assert index.sync(graph)['action'] == 'current'
+    _assert_matches_exhaustive(index, corpus)
+    index.close()
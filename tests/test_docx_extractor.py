@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Streaming DOCX extractor tests
+British English throughout
+
+Location: tests/test_docx_extractor.py
+"""
+
+import io
+import sys
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from utils.docx_extractor import extract_docx_text
+
+
+W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+
+def _docx(body: str) -> io.BytesIO:
+    data = io.BytesIO()
+    with zipfile.ZipFile(data, 'w') as archive:
+        archive.writestr('word/document.xml', f'<w:document xmlns:w="{W}"><w:body>{body}</w:body></w:document>')
+    data.seek(0)
+    return data
+
+
+def test_tab_stop_definitions_are_not_text():
+    paragraph = (
+        '<w:p><w:pPr><w:tabs>'
+        '<w:tab w:val="left" w:pos="720"/><w:tab w:val="right" w:pos="9000"/>'
+        '</w:tabs></w:pPr><w:r><w:t>Clause</w:t></w:r></w:p>'
+    )
+    assert extract_docx_text(_docx(paragraph)) == 'Clause'
+
+
+def test_tabs_inside_runs_are_kept():
+    paragraph = '<w:p><w:r><w:t>1.1</w:t><w:tab/><w:t>Definitions</w:t></w:r></w:p>'
+    assert extract_docx_text(_docx(paragraph)) == '1.1\tDefinitions'
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Email threading tests
+British English throughout
+
+Location: tests/test_email_threading.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from utils.email_threading import EmailThreader, sent_time_key
+
+
+def _email(message_id: str, sent_time: str, in_reply_to: str = '') -> dict:
+    return {
+        'doc_id': message_id,
+        'filename': f'{message_id}.eml',
+        'content': 'From: a@example.com\n\nBody',
+        'metadata': {
+            'doc_type': 'email',
+            'message_id': message_id,
+            'subject': 'Heads of terms',
+            'sender_email': 'a@example.com',
+            'recipients': ['b@example.com'],
+            'sent_time': sent_time,
+            'in_reply_to': in_reply_to,
+        },
+    }
+
+
+def test_sent_time_key_normalises_offsets():
+    # 09:30+02:00 is 07:30 UTC, earlier than 08:00+00:00 despite sorting later as text
+    assert sent_time_key('2024-03-01T09:30:00+02:00') < sent_time_key('2024-03-01T08:00:00+00:00')
+    assert sent_time_key('Fri, 01 Mar 2024 09:30:00 +0200') == sent_time_key('2024-03-01T07:30:00+00:00')
+    assert sent_time_key('2024-03-01T07:30:00') == sent_time_key('2024-03-01T07:30:00+00:00')
+
+
+def test_missing_or_unparsable_dates_sort_first():
+    dated = sent_time_key('1990-01-01T00:00:00+00:00')
+    assert sent_time_key('') < dated
+    assert sent_time_key('not a date') < dated
+    assert sent_time_key('') == sent_time_key('not a date')
+
+
+def test_threads_ordered_by_utc_time():
+    threader = EmailThreader()
+    # As text these sort c, b, a - the reverse of when they were sent
+    threader.add_document(_email('<a@x>', '2024-03-01T09:00:00+02:00'))
+    threader.add_document(_email('<b@x>', '2024-03-01T07:30:00+00:00', in_reply_to='<a@x>'))
+    threader.add_document(_email('<c@x>', '2024-03-01T03:00:00-05:00', in_reply_to='<b@x>'))
+
+    threads = threader.build_threads()
+    assert list(threads.values()) == [['<a@x>', '<b@x>', '<c@x>']]
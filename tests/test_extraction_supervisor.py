@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Extraction supervisor tests - hangs, crashes and memory blow-ups are contained
+British English throughout
+
+Location: tests/test_extraction_supervisor.py
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from utils.extraction_supervisor import ExtractionSupervisor, get_process_rss_mb
+
+
+def _misbehaving_task(arg):
+    """Module-level so worker processes can run it"""
+    kind, value = arg
+    if kind == 'hang':
+        time.sleep(60)
+    elif kind == 'exit':
+        os._exit(3)
+    elif kind == 'grow':
+        ballast = b'\x01' * (value * 1024 * 1024)   # written, so resident
+        time.sleep(60)
+        return len(ballast)
+    elif kind == 'raise':
+        raise ValueError(value)
+    return value * 2
+
+
+def _run(supervisor, tasks, deadline_seconds=30):
+    for task_id, arg in tasks.items():
+        supervisor.submit(task_id, arg)
+
+    results = {}
+    deadline = time.time() + deadline_seconds
+    while supervisor.pending and time.time() < deadline:
+        for task_id, status, payload in supervisor.poll():
+            results[task_id] = (status, payload)
+    return results
+
+
+@pytest.mark.skipif(get_process_rss_mb(os.getpid()) is None,
+                    reason="needs psutil or /proc to read worker memory")
+def test_limits_contain_failures_without_losing_other_tasks():
+    tasks = {
+        'first': ('ok', 1),
+        'hang': ('hang', None),
+        'exit': ('exit', None),
+        'grow': ('grow', 300),
+        'raise': ('raise', 'corrupt stream'),
+        'last': ('ok', 21),
+    }
+
+    with ExtractionSupervisor(_misbehaving_task, max_workers=3,
+                              timeout_seconds=1, max_rss_mb=100,
+                              poll_interval=0.05) as supervisor:
+        results = _run(supervisor, tasks)
+        stats = dict(supervisor.stats)
+
+    assert set(results) == set(tasks)
+    assert results['first'] == ('ok', 2)
+    assert results['last'] == ('ok', 42)
+    assert results['hang'][0] == 'timeout'
+    assert results['exit'][0] == 'crashed'
+    assert results['grow'][0] == 'oom'
+    assert results['raise'] == ('error', 'ValueError: corrupt stream')
+
+    assert stats['timeouts'] == 1
+    assert stats['crashes'] == 1
+    assert stats['oom_kills'] == 1
+    assert stats['respawns'] == 3
+
+
+def test_workers_survive_many_tasks_after_a_crash():
+    tasks = {n: ('ok', n) for n in range(20)}
+    tasks['exit'] = ('exit', None)
+
+    with ExtractionSupervisor(_misbehaving_task, max_workers=2,
+                              timeout_seconds=5, poll_interval=0.05) as supervisor:
+        results = _run(supervisor, tasks)
+
+    assert results.pop('exit')[0] == 'crashed'
+    assert results == {n: ('ok', n * 2) for n in range(20)}
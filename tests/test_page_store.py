@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Page store tests - capped extractions must not pass for full text
+British English throughout
+
+Location: tests/test_page_store.py
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from utils.page_store import PageStore
+
+
+PAGES = 60
+PAGE_TEXT = "Clause {page}. " + "The shareholder agreement provides for arbitration. " * 64
+
+
+def _pages(count):
+    return [{'page': n, 'text': PAGE_TEXT.format(page=n), 'engine': 'pymupdf'}
+            for n in range(1, count + 1)]
+
+
+def test_incomplete_entry_misses_for_whole_document(tmp_path):
+    source = tmp_path / "bundle.pdf"
+    source.write_bytes(b"%PDF-1.4 placeholder")
+    store = PageStore(tmp_path / "store")
+
+    # A 60-page bundle capped at 100K chars stores only its first 31 pages
+    assert store.put_pages(source, _pages(31), total_pages=PAGES, complete=False)
+
+    assert store.get_pages(source) is None
+    assert store.get_pages(source, 40, 60) is None
+    assert [p['page'] for p in store.get_pages(source, 1, 5)] == [1, 2, 3, 4, 5]
+
+    # The full re-extraction replaces the prefix
+    assert store.put_pages(source, _pages(PAGES), total_pages=PAGES, complete=True)
+    pages = store.get_pages(source)
+    assert len(pages) == PAGES
+    assert pages[-1]['text'].startswith("Clause 60.")
+
+
+def test_load_full_text_of_capped_pdf(tmp_path):
+    fitz = pytest.importorskip("fitz")
+    from utils.document_loader import DocumentLoader
+
+    source = tmp_path / "bundle.pdf"
+    pdf = fitz.open()
+    for n in range(1, PAGES + 1):
+        page = pdf.new_page()
+        page.insert_textbox(page.rect + (36, 36, -36, -36), PAGE_TEXT.format(page=n), fontsize=6)
+    pdf.save(source)
+    pdf.close()
+
+    config = SimpleNamespace(
+        folder_mapping=None,
+        loader_config={},
+        page_store_config={'enabled': True, 'store_dir': tmp_path / "store"}
+    )
+    loader = DocumentLoader(config)
+
+    capped = loader.load_document(source)
+    assert "Clause 60." not in capped['content']
+    assert not loader.page_store.coverage(source)['complete']
+
+    full_text = loader.load_full_text(source)
+    assert "Clause 60." in full_text
+    assert loader.page_store.coverage(source)['complete']